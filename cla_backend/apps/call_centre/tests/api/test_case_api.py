@@ -572,6 +572,45 @@ class SearchCaseTestCase(BaseSearchCaseAPIMixin, BaseCaseTestCase):
             ['ref1', 'ref2', 'ref3', 'ref4', 'ref5']
         )
 
+    def test_list_with_cursor(self):
+        """
+        Following the cursors returns the cases in the same order as the
+        page number pagination.
+        """
+        Case.objects.all().delete()
+        for outcome_code in [None, 'COI', 'MIS', None, 'CB1']:
+            make_recipe('legalaid.case', outcome_code=outcome_code)
+
+        response = self.client.get(
+            self.list_url, format='json',
+            HTTP_AUTHORIZATION='Bearer %s' % self.token
+        )
+        expected = [case['reference'] for case in response.data['results']]
+
+        references = []
+        url = '%s?cursor=&page_size=2' % self.list_url
+        while url:
+            response = self.client.get(
+                url, format='json',
+                HTTP_AUTHORIZATION='Bearer %s' % self.token
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['count'], None)
+            references += [
+                case['reference'] for case in response.data['results']
+            ]
+            url = response.data['next'] and \
+                '%s%s&page_size=2' % (self.list_url, response.data['next'])
+
+        self.assertEqual(references, expected)
+
+    def test_list_with_cursor_and_unsupported_ordering(self):
+        response = self.client.get(
+            '%s?cursor=&ordering=personal_details__full_name' % self.list_url,
+            format='json', HTTP_AUTHORIZATION='Bearer %s' % self.token
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     # person_ref PARAM
 
     def test_list_with_person_ref_param(self):
@@ -0,0 +1,69 @@
+from django.core.urlresolvers import reverse
+from django.http import QueryDict
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from historic.models import CaseArchived
+from legalaid.tests.views.test_base import CLAOperatorAuthBaseApiTestMixin
+
+
+class CaseArchivedSearchTestCase(
+    CLAOperatorAuthBaseApiTestMixin, APITestCase
+):
+    def setUp(self):
+        super(CaseArchivedSearchTestCase, self).setUp()
+        for laa_reference, full_name in [
+            (3000001, 'ANNE SMITH'),
+            (3000002, 'JOHNSMITH'),
+            (3000003, 'JOHN SMITH'),
+            (3000004, 'BOB 3000001'),
+        ]:
+            CaseArchived.objects.create(
+                laa_reference=laa_reference, full_name=full_name,
+                search_field='%s %s' % (full_name, laa_reference)
+            )
+        self.list_url = reverse('call_centre:casearchived-list')
+
+    def search(self, term):
+        response = self.client.get(
+            self.list_url, {'search': term},
+            HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [case['laa_reference'] for case in response.data['results']]
+
+    def test_substring_search(self):
+        self.assertItemsEqual(
+            self.search('mith'), [3000001, 3000002, 3000003]
+        )
+
+    def test_word_start_matches_first(self):
+        results = self.search('smith')
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[-1], 3000002)
+
+    def test_laa_reference_matches_first(self):
+        self.assertEqual(self.search('3000001'), [3000001, 3000004])
+
+    def test_search_with_cursor(self):
+        expected = self.search('smith')
+
+        results = []
+        params = {'search': 'smith', 'page_size': 1, 'cursor': ''}
+        while True:
+            response = self.client.get(
+                self.list_url, params,
+                HTTP_AUTHORIZATION=self.get_http_authorization()
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            results += [
+                case['laa_reference'] for case in response.data['results']
+            ]
+            if not response.data['next']:
+                break
+            params['cursor'] = QueryDict(
+                response.data['next'].lstrip('?')
+            )['cursor']
+
+        self.assertEqual(results, expected)
@@ -1,10 +1,17 @@
+import jsonpatch
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from cla_eventlog.models import Log
+
+from legalaid.models import EligibilityCheck
 from legalaid.tests.views.test_base import CLAOperatorAuthBaseApiTestMixin
 
 from legalaid.tests.views.mixins.eligibility_check_api import \
-    NestedEligibilityCheckAPIMixin
+    NestedEligibilityCheckAPIMixin, mi_dict_generator
+
+from call_centre.serializers import EligibilityCheckSerializer
 
 
 class EligibilityCheckTestCase(
@@ -87,3 +94,42 @@ class EligibilityCheckTestCase(
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, {'warnings': {}})
+
+    def test_patch_logged_same_as_full_diff(self):
+        """
+        The MT_CHANGED log patch only includes the changed fields but it's
+        the same as the diff between the full serialized objects.
+        """
+        before = EligibilityCheckSerializer(
+            EligibilityCheck.objects.get(pk=self.resource.pk)
+        ).data
+        data = {
+            'your_problem_notes': 'ipsum lorem2',
+            'dependants_young': 2,
+            'you': {
+                'income': {
+                    'earnings': mi_dict_generator(50000)
+                }
+            }
+        }
+        response = self.client.patch(
+            self.detail_url, data=data, format='json',
+            HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        after = EligibilityCheckSerializer(
+            EligibilityCheck.objects.get(pk=self.resource.pk)
+        ).data
+        log = Log.objects.get(case=self.parent_resource, code='MT_CHANGED')
+
+        sort_key = lambda op: (op['path'], op['op'])
+        for direction, patch in [
+            ('forwards', jsonpatch.JsonPatch.from_diff(before, after)),
+            ('backwards', jsonpatch.JsonPatch.from_diff(after, before))
+        ]:
+            self.assertTrue(patch.patch)
+            self.assertEqual(
+                sorted(log.patch[direction], key=sort_key),
+                sorted(patch.patch, key=sort_key)
+            )
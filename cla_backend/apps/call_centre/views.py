@@ -12,14 +12,15 @@ from rest_framework import viewsets, mixins, status
 from rest_framework.decorators import action, link
 from rest_framework.response import Response as DRFResponse
 from rest_framework.filters import OrderingFilter, DjangoFilterBackend, \
-    SearchFilter, BaseFilterBackend
+    BaseFilterBackend
 
 from cla_provider.models import Provider, OutOfHoursRota, Feedback
 from cla_eventlog import event_registry
 from cla_eventlog.views import BaseEventViewSet, BaseLogViewSet
 from cla_provider.helpers import ProviderAllocationHelper, notify_case_assigned
 
-from core.drf.pagination import RelativeUrlPaginationSerializer
+from core.drf.pagination import RelativeUrlPaginationSerializer, \
+    CursorPaginationMixin
 from core.drf.mixins import FormActionMixin
 
 from timer.views import BaseTimerViewSet
@@ -30,7 +31,7 @@ from legalaid.views import BaseUserViewSet, \
     BaseMatterTypeViewSet, BaseMediaCodeViewSet, FullPersonalDetailsViewSet, \
     BaseThirdPartyDetailsViewSet, BaseAdaptationDetailsViewSet, \
     BaseAdaptationDetailsMetadataViewSet, FullCaseViewSet, \
-    BaseCaseNotesHistoryViewSet, AscCaseOrderingFilter
+    BaseCaseNotesHistoryViewSet, AscCaseOrderingFilter, CaseSearchFilter
 
 from cla_common.constants import REQUIRES_ACTION_BY
 from knowledgebase.views import BaseArticleViewSet, BaseArticleCategoryViewSet
@@ -76,10 +77,10 @@ class EligibilityCheckViewSet(
 ):
     serializer_class = EligibilityCheckSerializer
 
-    # this is to fix a stupid thing in DRF where pre_save doesn't call super
+    # skips DRF's UpdateModelMixin.pre_save, the original state for the
+    # patch is kept by JsonPatchViewSetMixin.get_serializer
     def pre_save(self, obj):
-        original_obj = self.get_object()
-        self.__pre_save__ = self.get_serializer_class()(original_obj).data
+        pass
 
 
 class MatterTypeViewSet(
@@ -128,7 +129,7 @@ class CaseViewSet(
 
     filter_backends = (
         AscCaseOrderingFilter,
-        SearchFilter,
+        CaseSearchFilter,
     )
 
     def get_serializer_class(self):
@@ -437,6 +438,7 @@ class LogViewSet(CallCentrePermissionsViewSetMixin, BaseLogViewSet):
 
 
 class FeedbackViewSet(CallCentreManagerPermissionsViewSetMixin,
+                      CursorPaginationMixin,
                       mixins.ListModelMixin,
                       mixins.UpdateModelMixin,
                       mixins.RetrieveModelMixin,
@@ -462,16 +464,25 @@ class FeedbackViewSet(CallCentreManagerPermissionsViewSetMixin,
     max_paginate_by = 100
 
 
-class CaseArchivedSearchFilter(SearchFilter):
-    def get_search_terms(self, request):
-        terms = super(CaseArchivedSearchFilter, self).get_search_terms(request)
-        return [term.upper() for term in terms]
+class CaseArchivedSearchFilter(CaseSearchFilter):
+    """
+    Same as `CaseSearchFilter` on the trigram indexed
+    `CaseArchived.search_field`, archived cases with a LAA reference equal
+    to a term come first.
+    """
+    rank_sql = """CASE
+        WHEN historic_casearchived.laa_reference::text = %s THEN 2
+        WHEN historic_casearchived.search_field LIKE %s
+            OR historic_casearchived.search_field LIKE %s THEN 1
+        ELSE 0
+    END"""
 
-    def construct_search(self, field_name):
-        return "%s__contains" % field_name
+    def get_rank_params(self, term, like_term):
+        return [term, '%s%%' % like_term, '%% %s%%' % like_term]
 
 
 class CaseArchivedViewSet(CallCentrePermissionsViewSetMixin,
+                          CursorPaginationMixin,
                           mixins.ListModelMixin,
                           mixins.RetrieveModelMixin,
                           viewsets.GenericViewSet):
@@ -1,7 +1,5 @@
 import logging
-import datetime
 
-from django.conf import settings
 from django.utils import timezone
 
 from provider.oauth2.forms import PasswordGrantForm
@@ -12,7 +10,7 @@ from django_statsd.clients import statsd
 from call_centre.models import Operator
 from cla_provider.models import Staff
 
-from .models import AccessAttempt
+from .lockout import LoginFailures
 
 
 logger = logging.getLogger(__name__)
@@ -36,16 +34,7 @@ class ClientIdPasswordGrantForm(PasswordGrantForm):
     def clean_login_attempts(self):
         username = self.cleaned_data['username']
 
-        cooloff_time = timezone.now() - datetime.timedelta(
-            minutes=settings.LOGIN_FAILURE_COOLOFF_TIME
-        )
-
-        attempts = AccessAttempt.objects.filter(
-            username=username,
-            created__gt=cooloff_time
-        ).count()
-
-        if attempts >= settings.LOGIN_FAILURE_LIMIT:
+        if LoginFailures(username).is_locked_out(timezone.now()):
             self.account_lockedout = True
 
             statsd.incr('account.lockout.created')
@@ -61,11 +50,12 @@ class ClientIdPasswordGrantForm(PasswordGrantForm):
         if not self.account_lockedout:
             username = self.cleaned_data.get('username')
             if username:
-                AccessAttempt.objects.create_for_username(username)
+                LoginFailures(username).add(timezone.now())
 
     def on_form_valid(self):
         username = self.cleaned_data.get('username')
-        AccessAttempt.objects.delete_for_username(username)
+        if username:
+            LoginFailures(username).clear()
 
     def clean(self):
         self.clean_login_attempts()
@@ -0,0 +1,117 @@
+import calendar
+import datetime
+import hashlib
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import request_finished
+from django.utils import timezone
+
+from .models import AccessAttempt
+
+
+_local = threading.local()
+
+
+class LoginFailures(object):
+    """
+    Sliding window of the failed logins of a username in the last
+    `settings.LOGIN_FAILURE_COOLOFF_TIME` minutes, kept in the cache so
+    that checking for lockouts doesn't need to query the database.
+
+    The failures are counted per minute with the atomic `add` and `incr`
+    of the cache so that none is lost when logins happen in parallel,
+    the window moves a minute at a time.
+
+    The cache has to be shared by all the processes for the limit to
+    apply to them, without one (`settings.LOGIN_FAILURES_IN_CACHE` off)
+    the failures are counted from the AccessAttempts in the database.
+    """
+    key_prefix = 'login_failures'
+
+    def __init__(self, username):
+        self.username = username
+        self.in_cache = settings.LOGIN_FAILURES_IN_CACHE
+        self.key = '%s:%s' % (
+            self.key_prefix, hashlib.md5(username.encode('utf-8')).hexdigest()
+        )
+
+    @property
+    def window(self):
+        return datetime.timedelta(minutes=settings.LOGIN_FAILURE_COOLOFF_TIME)
+
+    @property
+    def timeout(self):
+        return int(self.window.total_seconds()) + 60
+
+    def get_bucket_key(self, time):
+        # minutes since the epoch
+        return '%s:%s' % (
+            self.key, calendar.timegm(time.utctimetuple()) // 60
+        )
+
+    def get_bucket_keys(self, now):
+        """
+        :return: keys of the per minute counts of the window ending `now`
+        """
+        first = now - self.window + datetime.timedelta(minutes=1)
+        return [
+            self.get_bucket_key(first + datetime.timedelta(minutes=minute))
+            for minute in range(settings.LOGIN_FAILURE_COOLOFF_TIME)
+        ]
+
+    def count(self, now):
+        if not self.in_cache:
+            return AccessAttempt.objects.filter(
+                username=self.username, created__gt=now - self.window
+            ).count()
+        return sum(cache.get_many(self.get_bucket_keys(now)).values())
+
+    def is_locked_out(self, now):
+        return self.count(now) >= settings.LOGIN_FAILURE_LIMIT
+
+    def add(self, now):
+        if not self.in_cache:
+            AccessAttempt.objects.create(username=self.username, created=now)
+            return
+
+        key = self.get_bucket_key(now)
+        if not cache.add(key, 1, self.timeout):
+            try:
+                cache.incr(key)
+            except ValueError:
+                # expired in the meantime
+                cache.add(key, 1, self.timeout)
+        record_access_attempt(self.username)
+
+    def clear(self):
+        if not self.in_cache:
+            AccessAttempt.objects.delete_for_username(self.username)
+            return
+        cache.delete_many(self.get_bucket_keys(timezone.now()))
+
+
+def record_access_attempt(username):
+    """
+    The AccessAttempt of `username` is only kept for auditing so it's
+    written after the response has been sent (see `write_access_attempts`).
+    """
+    if not username:
+        return
+
+    if not hasattr(_local, 'access_attempts'):
+        _local.access_attempts = []
+    _local.access_attempts.append(AccessAttempt(username=username))
+
+
+def write_access_attempts(**kwargs):
+    access_attempts = getattr(_local, 'access_attempts', None)
+    if access_attempts:
+        _local.access_attempts = []
+        AccessAttempt.objects.bulk_create(access_attempts)
+
+
+request_finished.connect(
+    write_access_attempts, dispatch_uid='write_access_attempts'
+)
@@ -0,0 +1,26 @@
+import datetime
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from cla_auth.models import AccessAttempt
+
+
+class Command(BaseCommand):
+
+    option_list = BaseCommand.option_list + (
+        make_option('--days',
+                    dest='days', type='int', default=90,
+                    help='Number of days of access attempts to keep'
+        ),
+    )
+
+    help = ('Deletes the access attempts older than the given number of '
+            'days. They are only kept for auditing, lockouts are worked out '
+            'from the cache')
+
+    def handle(self, *args, **options):
+        before = timezone.now() - datetime.timedelta(days=options['days'])
+        count = AccessAttempt.objects.prune(before)
+        self.stdout.write('%s access attempt(s) deleted' % count)
@@ -16,6 +16,17 @@ class AccessAttemptManager(models.Manager):
 
         return self.create(username=username)
 
+    def prune(self, before):
+        """
+        Deletes the access attempts created before `before`.
+
+        @return: number of access attempts deleted
+        """
+        attempts = self.filter(created__lt=before)
+        count = attempts.count()
+        attempts.delete()
+        return count
+
 
 class AccessAttempt(TimeStampedModel):
     username = models.CharField(max_length=255)
@@ -0,0 +1,160 @@
+import datetime
+import threading
+import time
+
+import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from cla_auth.lockout import LoginFailures, record_access_attempt, \
+    write_access_attempts
+from cla_auth.models import AccessAttempt
+
+
+class AtomicCache(LocMemCache):
+    """
+    LocMemCache with an atomic incr like the shared caches (e.g. memcached)
+    and slow reads so that the parallel read-modify-writes overlap.
+    """
+    def __init__(self):
+        super(AtomicCache, self).__init__('lockout-tests', {})
+        self.incr_lock = threading.Lock()
+
+    def get(self, *args, **kwargs):
+        value = super(AtomicCache, self).get(*args, **kwargs)
+        time.sleep(0.001)
+        return value
+
+    def incr(self, *args, **kwargs):
+        with self.incr_lock:
+            return super(AtomicCache, self).incr(*args, **kwargs)
+
+
+class LoginFailuresTestCase(TestCase):
+    def setUp(self):
+        super(LoginFailuresTestCase, self).setUp()
+        cache.clear()
+        self.now = timezone.now()
+        self.failures = LoginFailures(u'username')
+
+    def test_locked_out_after_limit(self):
+        for index in range(settings.LOGIN_FAILURE_LIMIT - 1):
+            self.failures.add(self.now)
+        self.assertFalse(self.failures.is_locked_out(self.now))
+
+        self.failures.add(self.now)
+        self.assertTrue(self.failures.is_locked_out(self.now))
+
+    def test_old_failures_not_counted(self):
+        window = datetime.timedelta(
+            minutes=settings.LOGIN_FAILURE_COOLOFF_TIME
+        )
+        self.failures.add(self.now - window)
+        self.failures.add(self.now - window / 2)
+
+        self.assertEqual(self.failures.count(self.now), 1)
+        self.assertEqual(self.failures.count(self.now + window / 2), 0)
+
+    @mock.patch('cla_auth.lockout.record_access_attempt')
+    def test_parallel_failures_not_lost(self, record_access_attempt):
+        start = threading.Event()
+
+        def add():
+            start.wait()
+            self.failures.add(self.now)
+
+        with mock.patch('cla_auth.lockout.cache', AtomicCache()):
+            threads = [threading.Thread(target=add) for index in range(20)]
+            for thread in threads:
+                thread.start()
+            start.set()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(self.failures.count(self.now), 20)
+
+    def test_usernames_counted_separately(self):
+        self.failures.add(self.now)
+        self.assertEqual(LoginFailures(u'other').count(self.now), 0)
+
+    def test_clear(self):
+        self.failures.add(self.now)
+        self.failures.clear()
+        self.assertEqual(self.failures.count(self.now), 0)
+
+    def test_access_attempt_recorded(self):
+        self.failures.add(self.now)
+        write_access_attempts()
+        self.assertEqual(
+            AccessAttempt.objects.filter(username=u'username').count(), 1
+        )
+
+
+@override_settings(LOGIN_FAILURES_IN_CACHE=False)
+class DatabaseLoginFailuresTestCase(TestCase):
+    def setUp(self):
+        super(DatabaseLoginFailuresTestCase, self).setUp()
+        cache.clear()
+        self.now = timezone.now()
+        self.failures = LoginFailures(u'username')
+
+    def test_locked_out_after_limit(self):
+        for index in range(settings.LOGIN_FAILURE_LIMIT - 1):
+            self.failures.add(self.now)
+        self.assertFalse(self.failures.is_locked_out(self.now))
+        self.assertEqual(
+            cache.get_many(self.failures.get_bucket_keys(self.now)), {}
+        )
+
+        self.failures.add(self.now)
+        self.assertTrue(self.failures.is_locked_out(self.now))
+        self.assertEqual(
+            AccessAttempt.objects.filter(username=u'username').count(),
+            settings.LOGIN_FAILURE_LIMIT
+        )
+
+    def test_old_failures_not_counted(self):
+        window = datetime.timedelta(
+            minutes=settings.LOGIN_FAILURE_COOLOFF_TIME
+        )
+        self.failures.add(self.now - window)
+        self.failures.add(self.now - window / 2)
+
+        self.assertEqual(self.failures.count(self.now), 1)
+
+    def test_clear(self):
+        self.failures.add(self.now)
+        LoginFailures(u'other').add(self.now)
+        self.failures.clear()
+
+        self.assertEqual(self.failures.count(self.now), 0)
+        self.assertEqual(LoginFailures(u'other').count(self.now), 1)
+
+
+class AccessAttemptTestCase(TestCase):
+    def test_written_when_request_finished(self):
+        record_access_attempt(u'username')
+        record_access_attempt(u'username')
+        self.assertEqual(AccessAttempt.objects.count(), 0)
+
+        write_access_attempts()
+        self.assertEqual(
+            AccessAttempt.objects.filter(username=u'username').count(), 2
+        )
+
+    def test_prune(self):
+        old = AccessAttempt.objects.create_for_username(u'username')
+        AccessAttempt.objects.filter(pk=old.pk).update(
+            created=timezone.now() - datetime.timedelta(days=100)
+        )
+        recent = AccessAttempt.objects.create_for_username(u'username')
+
+        call_command('prune_access_attempts', days=90)
+
+        self.assertEqual(list(AccessAttempt.objects.all()), [recent])
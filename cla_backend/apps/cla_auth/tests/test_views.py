@@ -15,12 +15,15 @@ from core.tests.mommy_utils import make_recipe
 from cla_provider.models import Staff
 from call_centre.models import Operator
 
+from cla_auth.lockout import LoginFailures
 from cla_auth.models import AccessAttempt
 
 
 class LoginTestCase(TestCase):
     def setUp(self):
         super(LoginTestCase, self).setUp()
+        # clearing the login failures of previous tests
+        cache.clear()
 
         self.url = reverse('oauth2:access_token')
 
@@ -184,7 +187,31 @@ class LoginTestCase(TestCase):
             )
             self.assertEqual(response.status_code, 200)
 
-            self.assertEqual(AccessAttempt.objects.count(), 0)
+            # the access attempts are kept for auditing
+            self.assertEqual(
+                AccessAttempt.objects.count(), settings.LOGIN_FAILURE_LIMIT
+            )
+            self.assertEqual(
+                LoginFailures(self.op_username).count(
+                    mocked_timezone.now.return_value
+                ), 0
+            )
+
+    def test_successful_login_clears_failures(self):
+        for index in range(settings.LOGIN_FAILURE_LIMIT - 1):
+            self.client.post(
+                self.url, data=self.get_operator_data(password='invalid')
+            )
+        self.assertEqual(
+            LoginFailures(self.op_username).count(timezone.now()),
+            settings.LOGIN_FAILURE_LIMIT - 1
+        )
+
+        response = self.client.post(self.url, data=self.get_operator_data())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            LoginFailures(self.op_username).count(timezone.now()), 0
+        )
 
     def test_throttling(self):
         # clearing cache
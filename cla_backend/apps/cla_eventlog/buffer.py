@@ -0,0 +1,107 @@
+import threading
+
+from django.db import transaction
+
+from core.profiling import profile_section
+
+from .models import Log
+
+
+_local = threading.local()
+
+
+class LogBuffer(object):
+    """
+    Collects logs so that they can all be written with one insert when
+    the buffer gets flushed instead of one by one.
+    """
+    def __init__(self):
+        self.logs = []
+
+        # (timer_id, case_id, code) of the logs with a timer in the buffer
+        self.timer_codes = set()
+
+    def __len__(self):
+        return len(self.logs)
+
+    def _is_duplicate(self, log, unique_codes, timer_codes):
+        return any(
+            (log.timer_id, log.case_id, code) in timer_codes
+            for code in unique_codes
+        )
+
+    def add(self, log, unique_codes=None):
+        """
+        :param unique_codes: if given `log` is discarded when there's
+            already a log of its case and timer with one of these codes.
+        """
+        if unique_codes and self._is_duplicate(
+            log, unique_codes, self.timer_codes
+        ):
+            return
+
+        self.logs.append((log, unique_codes))
+        if log.timer_id:
+            self.timer_codes.add((log.timer_id, log.case_id, log.code))
+
+    def get_saved_timer_codes(self, logs):
+        codes = set()
+        timer_ids = set()
+        case_ids = set()
+        for log, unique_codes in logs:
+            if unique_codes:
+                codes.update(unique_codes)
+                timer_ids.add(log.timer_id)
+                case_ids.add(log.case_id)
+
+        if not codes:
+            return set()
+
+        return set(Log.objects.filter(
+            timer_id__in=timer_ids, case_id__in=case_ids, code__in=codes
+        ).values_list('timer_id', 'case_id', 'code'))
+
+    def flush(self):
+        """
+        Writes the buffered logs apart from the ones duplicating logs
+        already in the db.
+
+        :return: the logs written
+        """
+        logs, self.logs = self.logs, []
+        self.timer_codes = set()
+
+        saved_timer_codes = self.get_saved_timer_codes(logs)
+        logs = [
+            log for log, unique_codes in logs
+            if not unique_codes or
+            not self._is_duplicate(log, unique_codes, saved_timer_codes)
+        ]
+
+        with profile_section('events'), transaction.atomic():
+            return Log.objects.create_logs(logs)
+
+
+def get_log_buffer():
+    return getattr(_local, 'buffer', None)
+
+
+def start_log_buffer():
+    """
+    From now on, the logs that can be buffered (see
+    `BaseEvent.can_buffer_log`) are kept in a buffer local to this thread
+    until `stop_log_buffer` is called.
+    """
+    _local.buffer = LogBuffer()
+    return _local.buffer
+
+
+def stop_log_buffer():
+    """
+    Stops buffering logs and writes the ones in the buffer.
+    """
+    buffer = get_log_buffer()
+    _local.buffer = None
+    if buffer is not None:
+        buffer.flush()
+    return buffer
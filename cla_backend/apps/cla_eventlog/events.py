@@ -1,8 +1,10 @@
 from collections import OrderedDict
 
+from cla_eventlog.buffer import get_log_buffer
 from cla_eventlog.models import Log
-from cla_eventlog.constants import LOG_TYPES
+from cla_eventlog.constants import LOG_TYPES, LOG_LEVELS
 
+from core.profiling import profile_section
 from timer.utils import get_timer
 
 
@@ -45,42 +47,68 @@ class BaseEvent(object):
 
         return self.codes.keys()[0]
 
-    def save_log(self, log):
+    def can_buffer_log(self, log):
+        """
+        Minor logs that don't stop the timer or change the case can be
+        buffered and written at the end of the request.
+        """
+        code_data = self.codes[log.code]
+        return log.level <= LOG_LEVELS.MINOR and \
+            log.type != LOG_TYPES.OUTCOME and \
+            not code_data.get('stops_timer', False) and \
+            'set_requires_action_by' not in code_data
+
+    def save_log(self, log, unique_codes=None):
+        """
+        :param unique_codes: if given `log` is not saved when there's
+            already a log of its case and timer with one of these codes.
+        """
+        buffer = get_log_buffer()
+        if buffer is not None and self.can_buffer_log(log):
+            buffer.add(log, unique_codes=unique_codes)
+            return
+
+        if unique_codes and Log.objects.filter(
+            timer=log.timer, case=log.case, code__in=unique_codes
+        ).exists():
+            return
+
         log.save(force_insert=True)
 
     def process(self, case, code=None, notes="", created_by=None, patch=None, context=None, **kwargs):
-        if not code:
-            code = self.get_log_code(case=case, **kwargs)
-
-        code_data = self.codes[code]
-        timer = get_timer(created_by)
-
-        log = Log(
-            case=case,
-            code=code,
-            timer=timer,
-            type=code_data['type'],
-            level=code_data['level'],
-            notes=notes,
-            patch=patch,
-            created_by=created_by,
-            context=context
-        )
-
-        self.save_log(log)
-
-        # stop timer if the code wants
-        if timer and code_data.get('stops_timer', False):
-            timer.stop()
-
-        # update set_requires_action_by if the code wantes
-        if 'set_requires_action_by' in code_data:
-            set_requires_action_by = code_data['set_requires_action_by']
-            if callable(set_requires_action_by):
-                set_requires_action_by = set_requires_action_by(case)
-            case.set_requires_action_by(set_requires_action_by)
-
-        return log
+        with profile_section('events'):
+            if not code:
+                code = self.get_log_code(case=case, **kwargs)
+
+            code_data = self.codes[code]
+            timer = get_timer(created_by)
+
+            log = Log(
+                case=case,
+                code=code,
+                timer=timer,
+                type=code_data['type'],
+                level=code_data['level'],
+                notes=notes,
+                patch=patch,
+                created_by=created_by,
+                context=context
+            )
+
+            self.save_log(log)
+
+            # stop timer if the code wants
+            if timer and code_data.get('stops_timer', False):
+                timer.stop()
+
+            # update set_requires_action_by if the code wantes
+            if 'set_requires_action_by' in code_data:
+                set_requires_action_by = code_data['set_requires_action_by']
+                if callable(set_requires_action_by):
+                    set_requires_action_by = set_requires_action_by(case)
+                case.set_requires_action_by(set_requires_action_by)
+
+            return log
 
     @classmethod
     def get_selectable_codes(cls, role):
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from cla_eventlog.models import CaseLogSummary
+
+
+class Command(BaseCommand):
+
+    help = ('Recreates the log summaries of all cases from the event log. '
+            'Summaries are kept up to date as logs are created so this is '
+            'only needed to populate them the first time or to fix them')
+
+    def handle(self, *args, **options):
+        count = CaseLogSummary.objects.rebuild()
+        self.stdout.write('%s case log summaries created' % count)
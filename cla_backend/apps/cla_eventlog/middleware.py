@@ -0,0 +1,14 @@
+from .buffer import start_log_buffer, stop_log_buffer
+
+
+class LogBufferMiddleware(object):
+    """
+    Buffers the minor logs created during the request and writes them all
+    together at the end of it.
+    """
+    def process_request(self, request):
+        start_log_buffer()
+
+    def process_response(self, request, response):
+        stop_log_buffer()
+        return response
@@ -1,15 +1,40 @@
-from django.db import models
+from collections import Counter
+
+from django.db import models, connection, transaction, IntegrityError
 from jsonfield import JSONField
 from django.conf import settings
 from django_statsd.clients import statsd
 
 from model_utils.models import TimeStampedModel
 
+from core.cloning import reserve_pks
 from timer.models import Timer
 
 from .constants import LOG_LEVELS, LOG_TYPES
 
 
+class LogManager(models.Manager):
+    def create_logs(self, logs):
+        """
+        Inserts the new `logs` with one query and then does what
+        `Log.save` does for new logs.
+        """
+        if not logs:
+            return logs
+
+        for log, pk in zip(logs, reserve_pks(self.model, len(logs))):
+            log.pk = pk
+        self.bulk_create(logs)
+
+        CaseLogSummary.objects.update_for_logs(logs)
+        for log in logs:
+            log.update_case()
+
+        for code, count in Counter(log.code for log in logs).items():
+            statsd.incr('outcome.%s' % code, count)
+        return logs
+
+
 class Log(TimeStampedModel):
     case = models.ForeignKey('legalaid.Case')
     timer = models.ForeignKey(Timer, null=True, blank=True)
@@ -32,11 +57,24 @@ class Log(TimeStampedModel):
     patch = JSONField(null=True, blank=True)
     context = JSONField(null=True, blank=True, help_text='Field to store extra event data for reporting')
 
+    objects = LogManager()
+
     def __unicode__(self):
         return u'%s - %s:%s' % (self.case, self.type, self.code)
 
     def save(self, *args, **kwargs):
+        created = not self.pk
         super(Log, self).save(*args, **kwargs)
+        if created:
+            CaseLogSummary.objects.update_for_log(self)
+
+        self.update_case()
+        statsd.incr('outcome.%s' % self.code)
+
+    def update_case(self):
+        """
+        Updates the case fields that depend on this log.
+        """
         if self.type == LOG_TYPES.OUTCOME and self.level >= LOG_LEVELS.HIGH:
             self.case.outcome_code = self.code
             self.case.level = self.level
@@ -45,8 +83,148 @@ class Log(TimeStampedModel):
 
         if self.code == 'CASE_VIEWED' and hasattr(self.created_by, 'staff'):
             self.case.view_by_provider(self.created_by.staff.provider)
-        statsd.incr('outcome.%s' % self.code)
-
 
     class Meta:
         ordering = ['-created']
+
+
+# Codes of the events which assign a case to a provider
+PROVIDER_ASSIGN_CODES = ('REFSP', 'MANALC', 'MANREF', 'SPOR')
+
+
+# (column, aggregate, expression) where each expression gives the id of
+# the log `l` if it's a candidate for the latest outcome / first operator
+# view etc. of its case, NULL otherwise and the aggregate picks the right
+# one among all the logs of a case.
+# `op` and `staff` are the operator and provider staff of the log creator.
+CASE_LOG_SUMMARY_COLUMNS = (
+    ('latest_outcome_id', 'MAX', "CASE WHEN l.type = '%s' THEN l.id END" % (
+        LOG_TYPES.OUTCOME
+    )),
+    ('operator_first_view_id', 'MIN', """CASE WHEN op.id IS NOT NULL
+        AND l.code != 'CASE_CREATED' THEN l.id END"""),
+    ('provider_first_view_id', 'MIN', """CASE WHEN staff.id IS NOT NULL
+        AND l.code != 'CASE_CREATED' THEN l.id END"""),
+    ('provider_first_assign_id', 'MIN', "CASE WHEN l.code IN (%s) THEN l.id END" % (
+        ', '.join("'%s'" % code for code in PROVIDER_ASSIGN_CODES)
+    )),
+)
+
+CASE_LOG_SUMMARY_FROM = """
+    FROM cla_eventlog_log AS l
+        LEFT OUTER JOIN call_centre_operator AS op ON op.user_id = l.created_by_id
+        LEFT OUTER JOIN cla_provider_staff AS staff ON staff.user_id = l.created_by_id
+"""
+
+
+class CaseLogSummaryManager(models.Manager):
+    def _columns(self):
+        return ', '.join(name for name, _, _ in CASE_LOG_SUMMARY_COLUMNS)
+
+    def _select_columns(self, aggregate=False):
+        columns = []
+        for name, aggregate_function, expression in CASE_LOG_SUMMARY_COLUMNS:
+            if aggregate:
+                expression = '%s(%s)' % (aggregate_function, expression)
+            columns.append('%s AS %s' % (expression, name))
+        return ', '.join(columns)
+
+    def update_for_log(self, log):
+        self.update_for_logs([log])
+
+    def update_for_logs(self, logs):
+        """
+        Updates the summaries of the cases of the newly created `logs`.
+
+        Logs are only ever added so the latest outcome is always replaced
+        and the 'first' logs are only set if not already set.
+        """
+        if not logs:
+            return
+
+        cursor = connection.cursor()
+        cursor.execute("""
+            UPDATE cla_eventlog_caselogsummary AS s SET
+                latest_outcome_id = COALESCE(v.latest_outcome_id, s.latest_outcome_id),
+                operator_first_view_id = COALESCE(s.operator_first_view_id, v.operator_first_view_id),
+                provider_first_view_id = COALESCE(s.provider_first_view_id, v.provider_first_view_id),
+                provider_first_assign_id = COALESCE(s.provider_first_assign_id, v.provider_first_assign_id)
+            FROM (
+                SELECT l.case_id, %s %s WHERE l.id IN %%s GROUP BY l.case_id
+            ) AS v
+            WHERE s.case_id = v.case_id
+            RETURNING s.case_id
+        """ % (
+            self._select_columns(aggregate=True), CASE_LOG_SUMMARY_FROM
+        ), [tuple(log.pk for log in logs)])
+        updated = set(case_id for case_id, in cursor.fetchall())
+
+        # no summary for these cases yet
+        new_logs = [log for log in logs if log.case_id not in updated]
+        if not new_logs:
+            return
+
+        try:
+            with transaction.atomic():
+                cursor.execute("""
+                    INSERT INTO cla_eventlog_caselogsummary (case_id, %s)
+                    SELECT l.case_id, %s %s WHERE l.id IN %%s
+                    GROUP BY l.case_id
+                """ % (
+                    self._columns(), self._select_columns(aggregate=True),
+                    CASE_LOG_SUMMARY_FROM
+                ), [tuple(log.pk for log in new_logs)])
+        except IntegrityError:
+            # created in the meantime
+            self.update_for_logs(new_logs)
+
+    def rebuild(self):
+        """
+        Recreates the summaries of all cases from their logs.
+
+        :return: number of summaries created
+        """
+        with transaction.atomic():
+            cursor = connection.cursor()
+            # stops logs from being added while rebuilding
+            cursor.execute(
+                'LOCK TABLE cla_eventlog_caselogsummary IN EXCLUSIVE MODE'
+            )
+            cursor.execute('DELETE FROM cla_eventlog_caselogsummary')
+            cursor.execute("""
+                INSERT INTO cla_eventlog_caselogsummary (case_id, %s)
+                SELECT l.case_id, %s %s GROUP BY l.case_id
+            """ % (
+                self._columns(), self._select_columns(aggregate=True),
+                CASE_LOG_SUMMARY_FROM
+            ))
+            return cursor.rowcount
+
+
+class CaseLogSummary(models.Model):
+    """
+    Facts about the logs of a case needed by the MI extracts, kept up to
+    date as logs are created (see `Log.save`) so that the extracts don't
+    need to look for them in the whole log table.
+    """
+    case = models.OneToOneField(
+        'legalaid.Case', primary_key=True, related_name='log_summary'
+    )
+    latest_outcome = models.ForeignKey(
+        Log, null=True, blank=True, related_name='+',
+        on_delete=models.SET_NULL
+    )
+    operator_first_view = models.ForeignKey(
+        Log, null=True, blank=True, related_name='+',
+        on_delete=models.SET_NULL
+    )
+    provider_first_view = models.ForeignKey(
+        Log, null=True, blank=True, related_name='+',
+        on_delete=models.SET_NULL
+    )
+    provider_first_assign = models.ForeignKey(
+        Log, null=True, blank=True, related_name='+',
+        on_delete=models.SET_NULL
+    )
+
+    objects = CaseLogSummaryManager()
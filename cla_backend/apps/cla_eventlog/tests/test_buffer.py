@@ -0,0 +1,98 @@
+from django.test import TestCase
+
+from core.tests.mommy_utils import make_recipe
+
+from cla_eventlog import event_registry
+from cla_eventlog.buffer import start_log_buffer, stop_log_buffer, \
+    get_log_buffer
+from cla_eventlog.models import Log, CaseLogSummary
+
+
+class LogBufferTestCase(TestCase):
+    def setUp(self):
+        super(LogBufferTestCase, self).setUp()
+        self.case = make_recipe('legalaid.case')
+        self.user = make_recipe('call_centre.operator').user
+        self.event = event_registry.get_event('case')()
+
+    def tearDown(self):
+        stop_log_buffer()
+        super(LogBufferTestCase, self).tearDown()
+
+    def process(self, status, case=None):
+        return self.event.process(
+            case=case or self.case, created_by=self.user, status=status
+        )
+
+    def test_minor_logs_written_when_stopped(self):
+        other_case = make_recipe('legalaid.case')
+        start_log_buffer()
+
+        self.process('viewed')
+        self.process('viewed', case=other_case)
+        self.assertEqual(Log.objects.count(), 0)
+        self.assertEqual(len(get_log_buffer()), 2)
+
+        stop_log_buffer()
+        self.assertEqual(
+            sorted(Log.objects.values_list('case', 'code')),
+            [
+                (self.case.pk, 'CASE_VIEWED'),
+                (other_case.pk, 'CASE_VIEWED')
+            ]
+        )
+        self.assertEqual(
+            CaseLogSummary.objects.get(case=self.case).operator_first_view,
+            Log.objects.get(case=self.case)
+        )
+
+    def test_high_logs_not_buffered(self):
+        start_log_buffer()
+
+        self.process('created')
+
+        self.assertEqual(Log.objects.count(), 1)
+        self.assertEqual(len(get_log_buffer()), 0)
+
+    def test_duplicates_in_buffer_discarded(self):
+        make_recipe('timer.Timer', created_by=self.user)
+        start_log_buffer()
+
+        self.process('viewed')
+        self.process('viewed')
+        self.assertEqual(len(get_log_buffer()), 1)
+
+        stop_log_buffer()
+        self.assertEqual(Log.objects.count(), 1)
+
+    def test_duplicates_in_db_discarded(self):
+        make_recipe('timer.Timer', created_by=self.user)
+        start_log_buffer()
+
+        self.process('created')
+        self.process('viewed')
+        self.assertEqual(len(get_log_buffer()), 1)
+
+        stop_log_buffer()
+        self.assertEqual(
+            list(Log.objects.values_list('code', flat=True)),
+            ['CASE_CREATED']
+        )
+
+    def test_not_buffered_without_buffer(self):
+        self.process('viewed')
+        self.assertEqual(Log.objects.count(), 1)
+
+    def test_flush_returns_saved_logs(self):
+        cases = [make_recipe('legalaid.case') for i in range(5)]
+        start_log_buffer()
+        for case in cases:
+            self.process('viewed', case=case)
+
+        logs = get_log_buffer().flush()
+
+        self.assertEqual(len(logs), 5)
+        self.assertItemsEqual(
+            [log.pk for log in logs],
+            Log.objects.values_list('pk', flat=True)
+        )
@@ -0,0 +1,92 @@
+from django.test import TestCase
+
+from core.tests.mommy_utils import make_recipe, make_user
+
+from cla_eventlog.constants import LOG_TYPES, LOG_LEVELS
+from cla_eventlog.models import CaseLogSummary
+
+
+class CaseLogSummaryTestCase(TestCase):
+    def setUp(self):
+        super(CaseLogSummaryTestCase, self).setUp()
+        self.case = make_recipe('legalaid.case')
+        self.operator = make_recipe('call_centre.operator').user
+        self.staff = make_recipe('cla_provider.staff').user
+        self.other_user = make_user()
+
+    def make_log(self, code, created_by, type=LOG_TYPES.SYSTEM):
+        return make_recipe(
+            'cla_eventlog.log', case=self.case, code=code, type=type,
+            level=LOG_LEVELS.MINOR, created_by=created_by
+        )
+
+    def get_summary(self):
+        return CaseLogSummary.objects.get(case=self.case)
+
+    def summary_values(self):
+        return list(CaseLogSummary.objects.order_by('case').values_list(
+            'case', 'latest_outcome', 'operator_first_view',
+            'provider_first_view', 'provider_first_assign'
+        ))
+
+    def test_summary_created_with_first_log(self):
+        self.assertFalse(CaseLogSummary.objects.exists())
+
+        self.make_log('CASE_CREATED', self.operator)
+
+        summary = self.get_summary()
+        self.assertEqual(summary.latest_outcome, None)
+        self.assertEqual(summary.operator_first_view, None)
+        self.assertEqual(summary.provider_first_view, None)
+        self.assertEqual(summary.provider_first_assign, None)
+
+    def test_latest_outcome_replaced(self):
+        self.make_log('CB1', self.operator, type=LOG_TYPES.OUTCOME)
+        self.make_log('CASE_VIEWED', self.operator)
+        outcome = self.make_log('CB2', self.operator, type=LOG_TYPES.OUTCOME)
+
+        self.assertEqual(self.get_summary().latest_outcome, outcome)
+
+    def test_first_logs_not_replaced(self):
+        self.make_log('CASE_CREATED', self.operator)
+        operator_view = self.make_log('CASE_VIEWED', self.operator)
+        assign = self.make_log('MANALC', self.operator)
+        provider_view = self.make_log('CASE_VIEWED', self.staff)
+        self.make_log('CASE_VIEWED', self.operator)
+        self.make_log('SPOR', self.operator)
+        self.make_log('CASE_VIEWED', self.staff)
+        self.make_log('CASE_VIEWED', self.other_user)
+
+        summary = self.get_summary()
+        self.assertEqual(summary.operator_first_view, operator_view)
+        self.assertEqual(summary.provider_first_view, provider_view)
+        self.assertEqual(summary.provider_first_assign, assign)
+
+    def test_log_update_doesnt_change_summary(self):
+        log = self.make_log('CB1', self.operator, type=LOG_TYPES.OUTCOME)
+        outcome = self.make_log('CB2', self.operator, type=LOG_TYPES.OUTCOME)
+
+        log.notes = 'updated'
+        log.save()
+
+        self.assertEqual(self.get_summary().latest_outcome, outcome)
+
+    def test_rebuild_same_as_incremental(self):
+        other_case = make_recipe('legalaid.case')
+        self.make_log('CASE_CREATED', self.operator)
+        self.make_log('CASE_VIEWED', self.operator)
+        self.make_log('CB1', self.operator, type=LOG_TYPES.OUTCOME)
+        self.make_log('REFSP', self.operator, type=LOG_TYPES.OUTCOME)
+        self.make_log('CASE_VIEWED', self.staff)
+        make_recipe(
+            'cla_eventlog.log', case=other_case, code='CASE_VIEWED',
+            type=LOG_TYPES.SYSTEM, level=LOG_LEVELS.MINOR,
+            created_by=self.staff
+        )
+
+        incremental = self.summary_values()
+        self.assertEqual(len(incremental), 2)
+
+        CaseLogSummary.objects.all().delete()
+        self.assertEqual(CaseLogSummary.objects.rebuild(), 2)
+        self.assertEqual(self.summary_values(), incremental)
@@ -248,6 +248,33 @@ class ProviderExtractForm(Form):
         return data
 
 
+class ProviderBulkExtractForm(Form):
+    """
+    Selects the cases to extract by CRNs (separated by commas) and/or by
+    the range of dates they were last modified in.
+    """
+    CHSUserName = forms.CharField(required=True)
+    CHSOrganisationID = forms.CharField(required=True)
+    CHSPassword = forms.CharField(required=True)
+    CHSCRNs = forms.CharField(required=False)
+    DateFrom = forms.DateTimeField(required=False)
+    DateTo = forms.DateTimeField(required=False)
+
+    def clean_CHSCRNs(self):
+        data = self.cleaned_data['CHSCRNs'] or ''
+        return [crn.strip().upper() for crn in data.split(',') if crn.strip()]
+
+    def clean(self):
+        cleaned_data = super(ProviderBulkExtractForm, self).clean()
+        if not cleaned_data.get('CHSCRNs') and not (
+            cleaned_data.get('DateFrom') and cleaned_data.get('DateTo')
+        ):
+            raise forms.ValidationError(
+                'Either CHSCRNs or DateFrom and DateTo are required'
+            )
+        return cleaned_data
+
+
 class AdminStaffForm(forms.ModelForm):
     chs_password = ReadOnlyPasswordHashField(widget=PasswordInput(),
                                              required=False,
@@ -1,43 +1,144 @@
+import bisect
 import datetime
 import random
+import time
 
 from django.core.mail import EmailMultiAlternatives
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.template import Context
 from django.template.loader import render_to_string, get_template
 from django.utils import timezone
+from django.utils.formats import localize
+from django.utils.html import escape
+from django.utils.text import capfirst
 from django.conf import settings
+from django.db.models.signals import post_save, post_delete
 
 from cla_common.call_centre_availability import OpeningHours
+from cla_eventlog.constants import LOG_TYPES
 from cla_provider.models import Provider, ProviderAllocation, OutOfHoursRota
+from legalaid.models import Case
 
 
 PROVIDER_HOURS = OpeningHours(**settings.PROVIDER_HOURS)
 
 
-class ProviderAllocationHelper(object):
+class CategoryAllocation(object):
+    """
+    Providers offering a category with their cumulative weights and the
+    out of hours rota of the category sorted by start date, built once and
+    shared by all the lookups until invalidated.
+    """
+    def __init__(self, allocations, rotas):
+        self.providers = []
+        self.cumulative_weights = []
+        total = 0
+        for pa in allocations:
+            total += pa.weighted_distribution
+            self.providers.append(pa.provider)
+            self.cumulative_weights.append(total)
 
-    def __init__(self, as_of=None):
-        self._providers_in_category = None
-        self.as_of = timezone.localtime(as_of or timezone.now())
+        self.rotas = sorted(rotas, key=lambda rota: rota.start_date)
+        self.rota_start_dates = [rota.start_date for rota in self.rotas]
+        # latest end date of the rotas up to each index, used to stop
+        # looking back for rotas including a given time
+        self.rota_max_end_dates = []
+        max_end_date = None
+        for rota in self.rotas:
+            max_end_date = max(max_end_date, rota.end_date) \
+                if max_end_date else rota.end_date
+            self.rota_max_end_dates.append(max_end_date)
+
+    @classmethod
+    def for_category(cls, category):
+        allocations = ProviderAllocation.objects.filter(
+            category=category).select_related('provider')
+        rotas = OutOfHoursRota.objects.filter(
+            category=category).select_related('provider')
+        return cls(list(allocations), list(rotas))
 
-    def get_qualifying_providers_allocation(self, category):
+    def get_random_provider(self):
         """
-        @return: list
+        @return: provider picked with probability proportional to its
+                 weighted distribution or None if there are no providers
+        """
+        if not self.cumulative_weights or not self.cumulative_weights[-1]:
+            return None
+
+        r = random.random() * self.cumulative_weights[-1]
+        return self.providers[bisect.bisect_right(self.cumulative_weights, r)]
+
+    def get_rota_provider(self, as_of):
+        """
+        @return: provider on the rota at `as_of` or None if there is none
+                 or more than one
         """
-        if not self._providers_in_category:
-            self._providers_in_category = ProviderAllocation.objects.filter(
-                category=category)
+        rotas = []
+        index = bisect.bisect_right(self.rota_start_dates, as_of) - 1
+        while index >= 0 and self.rota_max_end_dates[index] >= as_of:
+            if self.rotas[index].end_date >= as_of:
+                rotas.append(self.rotas[index])
+            index -= 1
+
+        if len(rotas) != 1:
+            # more than one should be prevented by OutOfHoursRota.clean
+            # but if something slipped the net it's not clear who to pick
+            return None
+        return rotas[0].provider
+
+
+_category_allocations = {}
+_category_allocations_generation = [0]
+
+
+def get_category_allocation(category):
+    """
+    @return: CategoryAllocation of `category` from the in-process cache,
+             built from the database if missing or older than
+             settings.PROVIDER_ALLOCATION_CACHE_TIMEOUT seconds.
 
-        return self._providers_in_category
+    Entries are dropped as soon as providers, allocations or rotas are
+    saved in this process, the timeout covers changes made by others.
+    """
+    now = time.time()
+    cached = _category_allocations.get(category.pk)
+    if cached and now - cached[0] < settings.PROVIDER_ALLOCATION_CACHE_TIMEOUT:
+        return cached[1]
+
+    generation = _category_allocations_generation[0]
+    allocation = CategoryAllocation.for_category(category)
+    # don't cache it if it got invalidated while being built
+    if generation == _category_allocations_generation[0]:
+        _category_allocations[category.pk] = (now, allocation)
+    return allocation
+
+
+def clear_category_allocations(**kwargs):
+    _category_allocations_generation[0] += 1
+    _category_allocations.clear()
+
+
+for model in (Provider, ProviderAllocation, OutOfHoursRota):
+    for signal in (post_save, post_delete):
+        signal.connect(
+            clear_category_allocations, sender=model,
+            dispatch_uid='clear_category_allocations_%s_%s' % (
+                model.__name__, 'save' if signal is post_save else 'delete'
+            )
+        )
+
+
+class ProviderAllocationHelper(object):
+
+    def __init__(self, as_of=None):
+        self.as_of = timezone.localtime(as_of or timezone.now())
 
     def get_qualifying_providers(self, category):
         """
         @return: list
         """
         if category:
-            return [pa.provider for pa in
-                    self.get_qualifying_providers_allocation(category)]
+            return list(get_category_allocation(category).providers)
 
         return Provider.objects.active()
 
@@ -62,36 +163,13 @@ class ProviderAllocationHelper(object):
                 In this way, we would ignore the state before the allocation
                 changed.
         """
-        def calculate_winner():
-            allocations = self.get_qualifying_providers_allocation(category)
-            if not allocations:
-                return None
-
-            total = sum(pa.weighted_distribution for pa in allocations)
-
-            r = random.uniform(0, total)
-            upto = 0
-            for pa in allocations:
-                if upto + pa.weighted_distribution > r:
-                    return pa.provider
-                upto += pa.weighted_distribution
-            assert False, "Shouldn't get here"
-        return calculate_winner()
+        return get_category_allocation(category).get_random_provider()
 
     def _get_rota_provider(self, category):
-        try:
-            rota = OutOfHoursRota.objects.get_current(category,
-                                                      as_of=self.as_of)
-            return rota.provider if rota else None
-        except OutOfHoursRota.MultipleObjectsReturned:
-            # this should be prevented by OutOfHoursRota.clean but what
-            # if something slipped the net. How should it be handled?
-            return None
-        except OutOfHoursRota.DoesNotExist:
-            # if no operator exists then handle it (not yet) but in
-            # ticket coming soon #71535438 but there are some blockers
-            # (e.g. being able to manually allocate)
-            return None
+        # if no rota exists then None is returned (not handled yet) see
+        # ticket #71535438 but there are some blockers
+        # (e.g. being able to manually allocate)
+        return get_category_allocation(category).get_rota_provider(self.as_of)
 
     def get_suggested_provider(self, category):
         if self.as_of not in PROVIDER_HOURS:
@@ -134,3 +212,248 @@ class ProviderExtractFormatter(object):
                             content_type='text/xml')
         resp['Access-Control-Allow-Origin'] = '*'
         return resp
+
+
+def _xml_text(value):
+    """
+    `value` as rendered by `{{ value }}` in a template.
+    """
+    return escape(localize(value))
+
+
+def _xml_date(value):
+    """
+    `value` as rendered by `{{ value|date:'c' }}` in a template.
+    """
+    if value in (None, ''):
+        return u''
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return escape(value.isoformat())
+
+
+class ProviderExtractWriter(object):
+    """
+    Writes the extract of cases as XML without going through the template
+    engine, the output of each case is the same as rendering the
+    `provider/case.xml` template with it.
+
+    The template looks up some values with misspelt names (e.g.
+    `case.adapation_details`) so they always come out empty, this is kept
+    the same here as the CHS integrations depend on the current output.
+    """
+    # where the service adaptations would go if the template found them
+    ADAPTATIONS = (
+        u'\n            \n\n            \n            \n            '
+        u'\n            \n            \n\n            '
+    )
+
+    def write_case(self, case):
+        """
+        @return: unicode XML of `case`
+        """
+        ec = case.eligibility_check
+        pd = case.personal_details
+        tp = case.thirdparty_details
+        diagnosis = case.diagnosis
+        category = diagnosis.category if diagnosis else None
+        tp_pd = tp.personal_details if tp else None
+
+        out = []
+        write = out.append
+
+        write(u'\n<Case CRN="%s" CaseCreated="%s">\n' % (
+            _xml_text(case.laa_reference), _xml_date(case.created)
+        ))
+        write(u'    <MeansTestResult>%s</MeansTestResult>\n' % (
+            u'P' if ec and ec.state else u'F'
+        ))
+        write(u'    <MatterType>\n        <Name>%s</Name>\n' % (
+            _xml_text(capfirst(category.name)) if category else u''
+        ))
+        for part, matter_type in (
+            (1, case.matter_type1), (2, case.matter_type2)
+        ):
+            write(u'        <Part%s>%s</Part%s>\n' % (
+                part, _xml_text(matter_type.code) if matter_type else u'',
+                part
+            ))
+        write(
+            u'    </MatterType>\n    <ReferralSource>P</ReferralSource>\n'
+            u'    <Client>\n        <Anonymous>N</Anonymous>\n        \n'
+        )
+        write(u'        <CanBeCalledBack>%s</CanBeCalledBack>\n        \n' % (
+            u'Y' if pd and pd.safe_to_contact == 'SAFE' else u'N'
+        ))
+
+        pd_text = lambda name: _xml_text(getattr(pd, name)) if pd else u''
+        write(
+            u'        <Name>\n            <Title>%s</Title>\n'
+            u'            <FirstName>%s</FirstName>\n'
+            u'            <Surname/>\n            <KnownAs/>\n'
+            u'        </Name>\n        <DOB>%s</DOB>\n'
+            u'        <Gender>n/a</Gender>\n        <Address>\n'
+            u'            <Line1>%s</Line1>\n            <Line2>n/a</Line2>\n'
+            u'            <Town>n/a</Town>\n            <County>n/a</County>\n'
+            u'            <PostCode>%s</PostCode>\n        </Address>\n'
+            u'        <Ethnicity>n/a</Ethnicity>\n'
+            u'        <DisabilityMonitoringCode>n/a</DisabilityMonitoringCode>\n'
+            u'        <ServiceAdaptations>\n' % (
+                pd_text('title'), pd_text('full_name'),
+                _xml_date(pd.date_of_birth) if pd else u'',
+                pd_text('street'), pd_text('postcode')
+            )
+        )
+        write(self.ADAPTATIONS)
+        if tp:
+            write(u'<ThirdPartyCaller>Adaptation</ThirdPartyCaller>')
+        write(
+            u'\n            <Other>none</Other>\n        </ServiceAdaptations>\n'
+            u'        <ContactDetails>\n            <Phone>%s</Phone>\n'
+            u'            <Mobile>%s</Mobile>\n            <Email>%s</Email>\n'
+            u'            \n        </ContactDetails>\n        \n        \n'
+            u'                            <LanguageUsed/>\n'
+            u'        <CanBeCalledForFeedback>N</CanBeCalledForFeedback>\n'
+            u'        <Security>\n            <Password>%s</Password>\n'
+            u'            <Reminder>n/a</Reminder>\n        </Security>\n'
+            u'    </Client>\n    \n' % (
+                pd_text('home_phone'), pd_text('mobile_phone'),
+                pd_text('email'), _xml_text(tp.pass_phrase) if tp else u''
+            )
+        )
+
+        if case.exempt_user:
+            write(u'        <ExemptionCode>%s</ExemptionCode>\n    \n' % (
+                _xml_text(case.exempt_user_reason)
+            ))
+        else:
+            write(u'        <ExemptionCode/>\n    \n')
+
+        provider = case.provider
+        write(
+            u'    <PreviousCRN/>\n    <TelephoneAdviceNotAppropriate/>\n'
+            u'    <ReferredOrganisation>\n'
+            u'        <Organisation>%s</Organisation>\n'
+            u'        <OrganisationNumber>%s</OrganisationNumber>\n'
+            u'        <ProviderChosenByClient>False</ProviderChosenByClient>\n'
+            u'    </ReferredOrganisation>\n    \n        ' % (
+                _xml_text(provider.name) if provider else u'',
+                _xml_text(provider.telephone_frontdoor) if provider else u''
+            )
+        )
+
+        referrals = case.caseknowledgebaseassignment_set.all()
+        if referrals:
+            write(u'\n            <SignPostingCaseReferrals>\n                ')
+            for referral in referrals:
+                write(
+                    u'\n                    <CaseReferral>\n'
+                    u'                        <CaseReferralCaseDate>%s'
+                    u'</CaseReferralCaseDate>\n'
+                    u'                        <CaseReferralCaseOutcome>n/a'
+                    u'</CaseReferralCaseOutcome>\n'
+                    u'                        <CaseReferralReasonRejected>n/a'
+                    u'</CaseReferralReasonRejected>\n'
+                    u'                        <UserName></UserName>\n'
+                    u'                    </CaseReferral>\n                ' % (
+                        _xml_date(referral.created)
+                    )
+                )
+            write(u'\n            </SignPostingCaseReferrals>\n        ')
+        else:
+            write(u'\n            <SignPostingCaseReferrals/>\n        ')
+
+        tp_pd_text = lambda name: \
+            _xml_text(getattr(tp_pd, name)) if tp_pd else u''
+        tp_text = lambda name: _xml_text(getattr(tp, name)) if tp else u''
+        write(
+            u'\n    \n    <ThirdParty>\n        <Name>%s</Name>\n'
+            u'        <Address>\n            <AtSameAddress>%s</AtSameAddress>\n'
+            u'            <Line1>%s</Line1>\n            <Line2>n/a</Line2>\n'
+            u'            <Town>n/a</Town>\n            <County>n/a</County>\n'
+            u'            <PostCode></PostCode>\n        </Address>\n'
+            u'        <ContactDetails>\n            <Phone>%s</Phone>\n'
+            u'            <Mobile/>\n            <Email></Email>\n'
+            u'        </ContactDetails>\n'
+            u'        <ReasonForThirdPartyCall>%s</ReasonForThirdPartyCall>\n'
+            u'        <RelationshipToClient>%s</RelationshipToClient>\n'
+            u'        <Organisation>%s</Organisation>\n'
+            u'        <HaveYouSpokenToClient>%s</HaveYouSpokenToClient>\n'
+            u'        <ReasonForNotSpeakingWithClient>%s'
+            u'</ReasonForNotSpeakingWithClient>\n'
+            u'        <EvidenceProvided/>\n    </ThirdParty>\n'
+            u'    <CaseEvents>\n        ' % (
+                tp_pd_text('full_name'),
+                u'Y' if (tp_pd.street if tp_pd else None) ==
+                        (pd.street if pd else None) else u'N',
+                tp_pd_text('street'), tp_pd_text('home_phone'),
+                tp_text('reason'), tp_text('personal_relationship'),
+                tp_text('organisation_name'), tp_text('spoke_to'),
+                tp_text('no_contact_reason')
+            )
+        )
+
+        for log in case.log_set.all():
+            write(u'\n            ')
+            if log.type == LOG_TYPES.OUTCOME:
+                write(
+                    u'\n            <CaseEvent>\n'
+                    u'                <OutcomeCode>%s</OutcomeCode>\n'
+                    u'                <OutcomeNotes>%s</OutcomeNotes>\n'
+                    u'            </CaseEvent>\n            ' % (
+                        _xml_text(log.code), _xml_text(log.notes)
+                    )
+                )
+            write(u'\n        ')
+        write(u'\n    </CaseEvents>\n</Case>\n\n')
+
+        return u''.join(out)
+
+    def write_cases(self, cases):
+        """
+        Yields the XML of `cases` wrapped in a `Cases` element, encoded
+        as utf-8 one case at a time.
+        """
+        yield '<Cases>'
+        for case in cases:
+            yield self.write_case(case).encode('utf-8')
+        yield '</Cases>\n'
+
+
+class ProviderBulkExtractFormatter(object):
+    """
+    Streams the extract of the cases in `queryset`. They are loaded
+    `batch_size` at a time with a fixed number of queries per batch
+    instead of the few queries per case that the template makes.
+    """
+    batch_size = 100
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+
+    def get_cases(self):
+        pks = list(
+            self.queryset.order_by('created', 'pk').values_list(
+                'pk', flat=True
+            )
+        )
+        for index in range(0, len(pks), self.batch_size):
+            batch_pks = pks[index:index + self.batch_size]
+            cases = Case.objects.filter(pk__in=batch_pks).select_related(
+                'eligibility_check', 'personal_details',
+                'thirdparty_details__personal_details', 'diagnosis__category',
+                'matter_type1', 'matter_type2', 'provider'
+            ).prefetch_related('caseknowledgebaseassignment_set', 'log_set')
+            cases_by_pk = dict((case.pk, case) for case in cases)
+            for pk in batch_pks:
+                # skipping the ones deleted in the meantime
+                if pk in cases_by_pk:
+                    yield cases_by_pk[pk]
+
+    def format(self):
+        resp = StreamingHttpResponse(
+            ProviderExtractWriter().write_cases(self.get_cases()),
+            content_type='text/xml'
+        )
+        resp['Access-Control-Allow-Origin'] = '*'
+        return resp
@@ -152,11 +152,19 @@ class CSVUpload(TimeStampedModel):
     body = JSONField()
     month = models.DateField(validators=[validate_first_of_month])
 
+    # kept in sync with body so that lists don't need to load it
+    row_count = models.PositiveIntegerField(default=0)
+    summary = JSONField(null=True, blank=True)
+
     class Meta:
         unique_together = [
             ['provider', 'month']
         ]
 
+    def save(self, *args, **kwargs):
+        self.row_count = len(self.body)
+        super(CSVUpload, self).save(*args, **kwargs)
+
 
 post_save.connect(log_staff_created, sender=Staff)
 pre_save.connect(log_staff_modified, sender=Staff)
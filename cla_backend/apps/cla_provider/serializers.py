@@ -268,6 +268,7 @@ class CSVUploadSerializer(CSVUploadSerializerBase):
             'created_by',
             'comment',
             'rows',
+            'summary',
             'body',
             'month',
             'created',
@@ -281,6 +282,7 @@ class CSVUploadDetailSerializer(CSVUploadSerializerBase):
             'provider',
             'created_by',
             'comment',
+            'summary',
             'body',
             'month',
             'created',
@@ -28,6 +28,7 @@ class CSVUploadAPIMixin(SimpleResourceAPIMixin):
             'created_by',
             'comment',
             'rows',
+            'summary',
             'month',
             'created',
         ]
@@ -155,6 +156,60 @@ class ProviderCSVValidatorTestCase(unittest.TestCase):
         validator = v.ProviderCSVValidator(self.data)
         self.assertEqual(len(validator.validate()), 2)
 
+    def test_validate_all_valid(self):
+        validator = v.ProviderCSVValidator(iter(self.data))
+        self.assertEqual(validator.validate_all(), [])
+        self.assertEqual(len(validator.cleaned_data), 2)
+        self.assertEqual(validator.summary, {
+            'categories': {u'education': 2},
+            'time_spent': 117,
+            'case_costs': u'199.0'
+        })
+
+    def test_validate_all_collects_all_errors(self):
+        wrong_account_number = self.data[0][:]
+        wrong_account_number[2] = u'22222B'
+        wrong_postcode_and_time = self.data[1][:]
+        wrong_postcode_and_time[11] = u'WRONG'
+        wrong_postcode_and_time[20] = u'-1'
+
+        validator = v.ProviderCSVValidator([
+            wrong_account_number, [], self.data[0], wrong_postcode_and_time
+        ])
+        errors = validator.validate_all()
+
+        self.assertEqual(
+            [(error['row'], error['column']) for error in errors],
+            [(1, 3), (2, None), (4, 12), (4, 21)]
+        )
+        self.assertTrue(errors[0]['message'].startswith(
+            'Row: 1 Field (3): Account Number - '
+        ))
+        self.assertTrue(errors[1]['message'].startswith(
+            'Row: 2 - Incorrect number of columns'
+        ))
+        self.assertEqual(len(validator.cleaned_data), 1)
+        self.assertEqual(validator.summary['categories'], {u'education': 1})
+
+    def test_validate_all_errors_across_fields(self):
+        row = self.data[0][:]
+        row[18] = u'01/01/2014'
+
+        validator = v.ProviderCSVValidator([row])
+        errors = validator.validate_all()
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]['column'], None)
+        self.assertRegexpMatches(errors[0]['message'], 'Row: 1 - .*must be after')
+
+    def test_compiled_fields_built_once(self):
+        fields = v.ProviderCSVValidator.get_compiled_fields()
+        self.assertIs(v.ProviderCSVValidator.get_compiled_fields(), fields)
+        self.assertEqual(
+            [name for name, _ in fields],
+            [name for name, _ in v.ProviderCSVValidator.fields]
+        )
+
     def test_invalid_field_count(self):
         validator = v.ProviderCSVValidator([[],[]])
         with self.assertRaisesRegexp(serializers.ValidationError,
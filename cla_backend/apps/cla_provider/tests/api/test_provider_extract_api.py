@@ -1,7 +1,20 @@
+import datetime
+
+from django.core.urlresolvers import reverse
+from django.template import Context
+from django.template.loader import get_template
+from django.utils import timezone
+
 from lxml import objectify
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from cla_common.constants import REQUIRES_ACTION_BY
+from core.tests.mommy_utils import make_recipe
+
+from cla_eventlog.constants import LOG_TYPES
+from cla_provider.helpers import ProviderBulkExtractFormatter
+from legalaid.models import Case
 from legalaid.tests.views.test_base import CLAProviderAuthBaseApiTestMixin
 
 from legalaid.tests.views.mixins.provider_extract_api import ProviderExtractAPIMixin
@@ -23,3 +36,88 @@ class ProviderExtractTests(CLAProviderAuthBaseApiTestMixin, ProviderExtractAPIMi
 
         self.assertListEqual(o.attrib.keys(), ['CRN', 'CaseCreated'])
 
+
+class ProviderBulkExtractTests(CLAProviderAuthBaseApiTestMixin, APITestCase):
+    def setUp(self):
+        super(ProviderBulkExtractTests, self).setUp()
+        self.creds = {
+            'CHSOrganisationID': 'org123',
+            'CHSUserName': 'test_user',
+            'CHSPassword': 'test_pass'
+        }
+        self.user.staff.chs_organisation = self.creds['CHSOrganisationID']
+        self.user.staff.set_chs_password(self.creds['CHSPassword'])
+        self.user.staff.chs_user = self.creds['CHSUserName']
+        self.user.staff.save()
+
+        self.cases = [
+            make_recipe(
+                'legalaid.eligible_case', provider=self.provider,
+                thirdparty_details=make_recipe('legalaid.thirdparty_details'),
+                requires_action_by=REQUIRES_ACTION_BY.PROVIDER
+            )
+            for i in range(3)
+        ]
+        for case in self.cases:
+            make_recipe(
+                'cla_eventlog.log', case=case, type=LOG_TYPES.OUTCOME,
+                _quantity=2
+            )
+        self.other_case = make_recipe('legalaid.case')
+
+        self.url = reverse('cla_provider:provider-bulk-extract')
+
+    def post(self, **kwargs):
+        data = dict(self.creds, **kwargs)
+        return self.client.post(self.url, data=data)
+
+    def test_extract_by_crns(self):
+        response = self.post(CHSCRNs=','.join(
+            [case.reference.lower() for case in self.cases[:2]] +
+            [self.other_case.reference]
+        ))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        o = objectify.fromstring(''.join(response.streaming_content))
+        self.assertItemsEqual(
+            [case.get('CRN') for case in o.Case],
+            [str(case.laa_reference) for case in self.cases[:2]]
+        )
+
+    def test_extract_by_date_range(self):
+        response = self.post(
+            DateFrom=(timezone.now() - datetime.timedelta(days=1)).isoformat(),
+            DateTo=(timezone.now() + datetime.timedelta(days=1)).isoformat()
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        o = objectify.fromstring(''.join(response.streaming_content))
+        self.assertEqual(len(o.Case), 3)
+
+    def test_extract_without_crns_or_dates_bad_request(self):
+        response = self.post()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cases_same_as_template(self):
+        content = ''.join(
+            ProviderBulkExtractFormatter(
+                Case.objects.filter(provider=self.provider)
+            ).format().streaming_content
+        )
+
+        template = get_template('provider/case.xml')
+        expected = '<Cases>%s</Cases>\n' % ''.join(
+            template.render(Context({'case': case})).encode('utf-8')
+            for case in Case.objects.filter(
+                provider=self.provider
+            ).order_by('created', 'pk')
+        )
+        self.assertEqual(content, expected)
+
+    def test_fixed_number_of_queries(self):
+        formatter = ProviderBulkExtractFormatter(
+            Case.objects.filter(provider=self.provider)
+        )
+        # case pks, cases, knowledgebase assignments, logs
+        with self.assertNumQueries(4):
+            list(formatter.format().streaming_content)
@@ -1,9 +1,14 @@
+import datetime
 import mock
 from collections import defaultdict
 
-from django.test import TestCase
+from django.test import TestCase, SimpleTestCase
+from django.utils import timezone
 
-from cla_provider.helpers import ProviderAllocationHelper
+from core.tests.mommy_utils import make_recipe
+
+from cla_provider.helpers import ProviderAllocationHelper, \
+    CategoryAllocation, get_category_allocation
 
 
 class ProviderAllocationHelperTestCase(TestCase):
@@ -21,13 +26,15 @@ class ProviderAllocationHelperTestCase(TestCase):
     def _test__get_random_provider(self, alloc_data, num_iterations=100000):
         # print "\n\nNew test"
         helper = ProviderAllocationHelper()
-        helper._providers_in_category = self.build_providers(alloc_data)
+        allocation = CategoryAllocation(self.build_providers(alloc_data), [])
 
         results = defaultdict(int)
         category = mock.MagicMock()
-        for i in range(0, num_iterations):
-            winner = helper._get_random_provider(category)
-            results[winner.id] += 1
+        with mock.patch('cla_provider.helpers.get_category_allocation',
+                        return_value=allocation):
+            for i in range(0, num_iterations):
+                winner = helper._get_random_provider(category)
+                results[winner.id] += 1
 
         for id, count in results.items():
             prob = (count * 100.) / num_iterations
@@ -77,11 +84,99 @@ class ProviderAllocationHelperTestCase(TestCase):
             100: {'weight': 2, 'expected_prob': 100},
         })
 
-    @mock.patch('cla_provider.helpers.ProviderAllocation')
-    def test__get_random_provider_with_empty_list(self, MockedProviderAllocation):
-        MockedProviderAllocation.objects.filter.return_value = []
-
+    @mock.patch('cla_provider.helpers.get_category_allocation',
+                return_value=CategoryAllocation([], []))
+    def test__get_random_provider_with_empty_list(self, mocked_get_allocation):
         helper = ProviderAllocationHelper()
 
         winner = helper._get_random_provider(mock.MagicMock())
         self.assertEqual(winner, None)
+
+
+class CategoryAllocationRotaTestCase(SimpleTestCase):
+    def build_rota(self, provider, start_day, end_day):
+        start = timezone.make_aware(
+            datetime.datetime(2014, 1, 1), timezone.utc
+        )
+        return mock.MagicMock(
+            provider=provider,
+            start_date=start + datetime.timedelta(days=start_day),
+            end_date=start + datetime.timedelta(days=end_day)
+        )
+
+    def get_rota_provider(self, allocation, day):
+        as_of = timezone.make_aware(
+            datetime.datetime(2014, 1, 1, 12), timezone.utc
+        ) + datetime.timedelta(days=day)
+        return allocation.get_rota_provider(as_of)
+
+    def test_rota_provider(self):
+        allocation = CategoryAllocation([], [
+            self.build_rota('p3', 20, 30),
+            self.build_rota('p1', 0, 5),
+            self.build_rota('p2', 5, 10),
+        ])
+
+        self.assertEqual(self.get_rota_provider(allocation, -1), None)
+        self.assertEqual(self.get_rota_provider(allocation, 0), 'p1')
+        self.assertEqual(self.get_rota_provider(allocation, 4), 'p1')
+        self.assertEqual(self.get_rota_provider(allocation, 7), 'p2')
+        self.assertEqual(self.get_rota_provider(allocation, 15), None)
+        self.assertEqual(self.get_rota_provider(allocation, 25), 'p3')
+        self.assertEqual(self.get_rota_provider(allocation, 31), None)
+
+    def test_overlapping_rotas_return_none(self):
+        allocation = CategoryAllocation([], [
+            self.build_rota('p1', 0, 30),
+            self.build_rota('p2', 5, 10),
+            self.build_rota('p3', 20, 25),
+        ])
+
+        self.assertEqual(self.get_rota_provider(allocation, 3), 'p1')
+        self.assertEqual(self.get_rota_provider(allocation, 7), None)
+        self.assertEqual(self.get_rota_provider(allocation, 15), 'p1')
+        self.assertEqual(self.get_rota_provider(allocation, 22), None)
+
+
+class CategoryAllocationCacheTestCase(TestCase):
+    def setUp(self):
+        super(CategoryAllocationCacheTestCase, self).setUp()
+        self.category = make_recipe('legalaid.category')
+        self.provider = make_recipe('cla_provider.provider')
+        make_recipe(
+            'cla_provider.provider_allocation', provider=self.provider,
+            category=self.category, weighted_distribution=1
+        )
+
+    def test_allocation_cached(self):
+        allocation = get_category_allocation(self.category)
+        self.assertEqual(allocation.providers, [self.provider])
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_category_allocation(self.category), allocation)
+            helper = ProviderAllocationHelper()
+            self.assertEqual(
+                helper._get_random_provider(self.category), self.provider
+            )
+
+    def test_cache_cleared_on_allocation_change(self):
+        get_category_allocation(self.category)
+
+        other_provider = make_recipe('cla_provider.provider')
+        make_recipe(
+            'cla_provider.provider_allocation', provider=other_provider,
+            category=self.category, weighted_distribution=1
+        )
+
+        self.assertItemsEqual(
+            get_category_allocation(self.category).providers,
+            [self.provider, other_provider]
+        )
+
+    def test_cache_expires(self):
+        allocation = get_category_allocation(self.category)
+
+        with self.settings(PROVIDER_ALLOCATION_CACHE_TIMEOUT=0):
+            self.assertIsNot(
+                get_category_allocation(self.category), allocation
+            )
@@ -38,5 +38,6 @@ urlpatterns = patterns('',
     url(r'^', include(case_one2one_router.urls)),
     url(r'^', include(case_one2many_router.urls)),
     url(r'^caseExport/$', views.ProviderExtract.as_view(), name='provider-extract'),
+    url(r'^caseExport/bulk/$', views.ProviderBulkExtract.as_view(), name='provider-bulk-extract'),
     url(r'^', include(router.urls)),
 )
@@ -1,7 +1,8 @@
 import logging
 from cla_provider.authentication import LegacyCHSAuthentication
-from cla_provider.forms import ProviderExtractForm
-from cla_provider.helpers import ProviderExtractFormatter
+from cla_provider.forms import ProviderExtractForm, ProviderBulkExtractForm
+from cla_provider.helpers import ProviderExtractFormatter, \
+    ProviderBulkExtractFormatter
 from core.permissions import IsProviderPermission
 
 from django.shortcuts import get_object_or_404
@@ -61,10 +62,10 @@ class EligibilityCheckViewSet(
 ):
     serializer_class = EligibilityCheckSerializer
 
-    # this is to fix a stupid thing in DRF where pre_save doesn't call super
+    # skips DRF's UpdateModelMixin.pre_save, the original state for the
+    # patch is kept by JsonPatchViewSetMixin.get_serializer
     def pre_save(self, obj):
-        original_obj = self.get_object()
-        self.__pre_save__ = self.get_serializer_class()(original_obj).data
+        pass
 
 
 class MatterTypeViewSet(
@@ -100,7 +101,7 @@ class CaseViewSet(
 
     ordering_fields = ('modified', 'null_priority', 'priority',
                        'personal_details__full_name', 'personal_details__postcode')
-    ordering = ('null_priority', '-priority', '-modified')
+    ordering = ('-priority', '-modified')
 
     def get_queryset(self, **kwargs):
         """
@@ -216,13 +217,15 @@ class ProviderExtract(APIView):
                 'Access-Control-Allow-Origin': '*'
             })
 
-    def post(self, request):
+    def get_post_data(self, request):
         # this is to keep backward compatibility with the old system
         data = request.POST.copy()
         if 'CHSOrganisationID' not in data:
             data['CHSOrganisationID'] = data.get('CHSOrgansationID')
+        return data
 
-        form = ProviderExtractForm(data)
+    def post(self, request):
+        form = ProviderExtractForm(self.get_post_data(request))
         if form.is_valid():
             data = form.cleaned_data
             try:
@@ -251,6 +254,40 @@ class ProviderExtract(APIView):
                                 })
 
 
+class ProviderBulkExtract(ProviderExtract):
+    """
+    Streams the extract of all the cases of the provider matching the
+    CRNs and/or modified in the date range posted, in the same format as
+    `ProviderExtract` but wrapped in a `Cases` element.
+    """
+    def post(self, request):
+        form = ProviderBulkExtractForm(self.get_post_data(request))
+        if form.is_valid():
+            data = form.cleaned_data
+            cases = Case.objects.filter(provider=request.user.staff.provider)
+            if data['CHSCRNs']:
+                cases = cases.filter(reference__in=data['CHSCRNs'])
+            if data['DateFrom']:
+                cases = cases.filter(modified__gte=data['DateFrom'])
+            if data['DateTo']:
+                cases = cases.filter(modified__lte=data['DateTo'])
+
+            statsd.incr('provider_extract.bulk_exported')
+
+            logger.info('Provider cases exported',
+                        extra={'USERNAME': request.user.username,
+                               'POSTDATA': request.POST})
+
+            return ProviderBulkExtractFormatter(cases).format()
+        else:
+            statsd.incr('provider_extract.malformed')
+            return DRFResponse(form.errors, content_type='text/xml',
+                               status=400,
+                               headers={
+                                'Access-Control-Allow-Origin': '*'
+                                })
+
+
 class UserViewSet(CLAProviderPermissionViewSetMixin, BaseUserViewSet):
     model = Staff
     serializer_class = StaffSerializer
@@ -0,0 +1,302 @@
+"""
+Benchmarks of the hot paths of the backend, run by the `benchmark`
+management command against a test database.
+
+Each benchmark creates its fixtures for a given data size and then times
+`run` a number of times, every run is rolled back so that they all start
+from the same data.
+"""
+import datetime
+import time
+
+from django.contrib.auth.models import User
+from django.core.urlresolvers import reverse
+from django.db import transaction
+from django.test.client import Client as TestClient
+from django.utils import timezone
+
+from provider.oauth2.models import Client, AccessToken
+
+from eligibility_calculator.calculator import EligibilityChecker
+from eligibility_calculator.exceptions import PropertyExpectedException
+
+from core.profiling import start_profile, stop_profile
+from core.tests.mommy_utils import make_recipe
+from call_centre.models import Operator
+from cla_eventlog import event_registry
+from diagnosis.serializers import DiagnosisSerializer
+from legalaid.models import EligibilityCheck
+from legalaid.utils.csvupload.validators import ProviderCSVValidator
+from reports import forms as report_forms
+
+
+class Benchmark(object):
+    name = None
+
+    def setup(self, size):
+        """
+        Creates the fixtures for `size`.
+        """
+        pass
+
+    def run(self):
+        raise NotImplementedError
+
+
+def run_benchmark(benchmark, size, repeat):
+    """
+    :return: dict with the min, median and mean time of the runs in
+        milliseconds and the number of queries of a run.
+    """
+    timings = []
+    query_count = 0
+    with transaction.atomic():
+        benchmark.setup(size)
+
+        for index in range(repeat):
+            with transaction.atomic():
+                profile = start_profile()
+                start = time.time()
+                try:
+                    benchmark.run()
+                finally:
+                    timings.append((time.time() - start) * 1000)
+                    stop_profile()
+                    query_count = profile.query_count
+                transaction.set_rollback(True)
+
+        transaction.set_rollback(True)
+
+    timings.sort()
+    return {
+        'min': timings[0],
+        'median': timings[len(timings) // 2],
+        'mean': sum(timings) / len(timings),
+        'queries': query_count,
+    }
+
+
+def compare_results(results, baseline, tolerance):
+    """
+    :param results: {benchmark name: {size: result}} as returned by
+        `run_benchmark`, same for `baseline`.
+    :param tolerance: share of the baseline median time a benchmark can
+        get slower by before it's a regression.
+    :return: list of (name, size, message) of the regressions, only the
+        benchmarks and sizes in both are compared.
+    """
+    regressions = []
+    for name, sizes in sorted(results.items()):
+        for size, result in sorted(sizes.items()):
+            expected = baseline.get(name, {}).get(size)
+            if not expected:
+                continue
+
+            if result['median'] > expected['median'] * (1 + tolerance):
+                regressions.append((name, size, '%.1fms, was %.1fms' % (
+                    result['median'], expected['median']
+                )))
+            if result['queries'] > expected['queries']:
+                regressions.append((name, size, '%s queries, was %s' % (
+                    result['queries'], expected['queries']
+                )))
+    return regressions
+
+
+def make_eligibility_check():
+    eligibility_check = make_recipe(
+        'legalaid.eligibility_check',
+        you=make_recipe('legalaid.full_person'),
+        partner=make_recipe('legalaid.full_person'),
+        has_partner=True, is_you_or_your_partner_over_60=False,
+        on_passported_benefits=False, on_nass_benefits=False
+    )
+    make_recipe(
+        'legalaid.property', eligibility_check=eligibility_check,
+        value=20000000, mortgage_left=10000000, share=100,
+        disputed=False, main=True
+    )
+    return eligibility_check
+
+
+class EligibilityCheckerBenchmark(Benchmark):
+    name = 'EligibilityChecker.is_eligible'
+
+    def setup(self, size):
+        self.case_data = [
+            make_eligibility_check().to_case_data() for index in range(size)
+        ]
+
+    def run(self):
+        for case_data in self.case_data:
+            try:
+                EligibilityChecker(case_data).is_eligible()
+            except PropertyExpectedException:
+                pass
+
+
+class ToCaseDataBenchmark(Benchmark):
+    name = 'EligibilityCheck.to_case_data'
+
+    def setup(self, size):
+        self.pks = [make_eligibility_check().pk for index in range(size)]
+
+    def run(self):
+        for eligibility_check in EligibilityCheck.objects.filter(
+            pk__in=self.pks
+        ):
+            eligibility_check.to_case_data()
+
+
+class DiagnosisBenchmark(Benchmark):
+    name = 'DiagnosisSerializer.move_down_move_up'
+
+    def setup(self, size):
+        self.traversals = make_recipe('diagnosis.diagnosis', _quantity=size)
+        self.node_id = DiagnosisSerializer(
+            self.traversals[0]
+        ).data['choices'][0]['id']
+
+    def run(self):
+        for traversal in self.traversals:
+            serializer = DiagnosisSerializer(
+                traversal, data={'current_node_id': self.node_id},
+                partial=True
+            )
+            serializer.is_valid()
+            serializer.save(force_update=True)
+
+            DiagnosisSerializer(serializer.object).move_up()
+
+
+class CaseApiBenchmark(Benchmark):
+    """
+    Requests to the call centre case API (`FullCaseViewSet`) as an
+    operator, going through the middleware and authentication.
+    """
+    def setup(self, size):
+        user = User.objects.create_user('benchmark', 'benchmark@example.com')
+        Operator.objects.create(user=user)
+        token = AccessToken.objects.create(
+            user=user, client=Client.objects.create(
+                user=user, name='operator', client_type=0,
+                client_id='call_centre', client_secret='secret',
+                url='http://localhost/',
+                redirect_uri='http://localhost/redirect'
+            ), token='benchmark_token', scope=0
+        )
+        self.client = TestClient(
+            HTTP_AUTHORIZATION='Bearer %s' % token.token
+        )
+        self.cases = make_recipe('legalaid.case', _quantity=size)
+
+
+class CaseListBenchmark(CaseApiBenchmark):
+    name = 'FullCaseViewSet.list'
+
+    def run(self):
+        self.client.get(reverse('call_centre:case-list'))
+
+
+class CaseRetrieveBenchmark(CaseApiBenchmark):
+    name = 'FullCaseViewSet.retrieve'
+
+    def run(self):
+        self.client.get(reverse(
+            'call_centre:case-detail',
+            kwargs={'reference': self.cases[-1].reference}
+        ))
+
+
+class EventProcessBenchmark(Benchmark):
+    name = 'BaseEvent.process'
+
+    def setup(self, size):
+        self.user = make_recipe('call_centre.operator').user
+        make_recipe('timer.Timer', created_by=self.user)
+        self.cases = make_recipe('legalaid.case', _quantity=size)
+
+    def run(self):
+        event = event_registry.get_event('case')()
+        for case in self.cases:
+            event.process(case=case, created_by=self.user, status='viewed')
+
+
+class ProviderCSVValidatorBenchmark(Benchmark):
+    name = 'ProviderCSVValidator.validate'
+
+    row = [
+        u'3333333', u'0001', u'2B222B', u'A N Other', u'Corgi',
+        u'02/01/1901', u'E', u'M', u'1', u'', u'', u'SW1A 1AA',
+        u'X', u'EPRO', u'ESOS', u'EA', u'EB', u'', u'01/01/1901',
+        u'01/01/1902', u'99', u'99.5', u'', u'ILL', u'0', u'0',
+        u'', u'N', u'', u'', u'NAR', u'', u'DK', u'TA'
+    ]
+
+    def setup(self, size):
+        self.rows = [
+            [unicode(3333333 + index)] + self.row[1:]
+            for index in range(size)
+        ]
+
+    def run(self):
+        ProviderCSVValidator(self.rows).validate()
+
+
+class ReportFormBenchmark(Benchmark):
+    """
+    Builds all the rows of the report for today, with `size` cases
+    created and logged today.
+    """
+    def __init__(self, form_class):
+        self.form_class = form_class
+        self.name = '%s.rows' % form_class.__name__
+
+    def setup(self, size):
+        user = make_recipe('call_centre.operator').user
+        make_recipe('timer.Timer', created_by=user)
+        event = event_registry.get_event('case')()
+        for case in make_recipe('legalaid.case', _quantity=size):
+            event.process(case=case, created_by=user, status='created')
+
+        today = timezone.localtime(timezone.now()).date()
+        self.data = {
+            'date_from': today - datetime.timedelta(days=1),
+            'date_to': today,
+        }
+
+    def run(self):
+        form = self.form_class(data=self.data)
+        if not form.is_valid():
+            raise ValueError(form.errors)
+        for row in form:
+            pass
+
+
+def get_report_forms():
+    # ProviderCaseClosure and OperatorCaseClosure haven't been
+    # reimplemented with logs yet
+    return [
+        report_forms.OperatorCaseCreate,
+        report_forms.CaseReport,
+        report_forms.NewCasesWithAdaptationCount,
+        report_forms.CaseVolumeAndAvgDurationByDay,
+        report_forms.ReferredCasesByCategory,
+        report_forms.AllocatedCasesNoOutcome,
+        report_forms.MICaseExtract,
+        report_forms.MIFeedbackExtract,
+        report_forms.MIAlternativeHelpExtract,
+        report_forms.MIContactsPerCaseByCategoryExtract,
+        report_forms.MISurveyExtract,
+        report_forms.MICB1Extract,
+    ]
+
+
+def get_benchmarks():
+    return [
+        EligibilityCheckerBenchmark(), ToCaseDataBenchmark(),
+        DiagnosisBenchmark(), CaseListBenchmark(), CaseRetrieveBenchmark(),
+        EventProcessBenchmark(), ProviderCSVValidatorBenchmark(),
+    ] + [
+        ReportFormBenchmark(form_class) for form_class in get_report_forms()
+    ]
@@ -0,0 +1,61 @@
+import datetime
+from cStringIO import StringIO
+
+from django.db import connections, DEFAULT_DB_ALIAS
+
+
+def copy_value(value):
+    """
+    `value` in the text format of COPY
+    """
+    if value is None:
+        return r'\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, unicode):
+        value = value.encode('utf-8')
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace(
+        '\n', '\\n').replace('\r', '\\r')
+
+
+def copy_rows(cursor, table, columns, rows):
+    """
+    Writes `rows`, tuples of values of `columns`, into `table` with one
+    COPY.
+    """
+    buf = StringIO()
+    for row in rows:
+        buf.write('\t'.join(copy_value(value) for value in row))
+        buf.write('\n')
+    buf.seek(0)
+
+    cursor.copy_expert(
+        'COPY %s (%s) FROM STDIN' % (table, ', '.join(columns)), buf
+    )
+
+
+def copy_objects(model, objs, using=DEFAULT_DB_ALIAS):
+    """
+    Like `bulk_create` but writes the objects with COPY, which is a lot
+    faster for large numbers of them.
+
+    The objects are written as they are: no `pre_save` so auto_now fields
+    and the like have to be set already and so do the primary keys.
+    """
+    connection = connections[using]
+    fields = model._meta.concrete_fields
+    copy_rows(
+        connection.cursor(), model._meta.db_table,
+        [connection.ops.quote_name(field.column) for field in fields],
+        (
+            [
+                field.get_db_prep_save(
+                    getattr(obj, field.attname), connection=connection
+                )
+                for field in fields
+            ]
+            for obj in objs
+        )
+    )
@@ -1,3 +1,8 @@
+from collections import defaultdict
+
+from django.db import connection
+
+
 def clone_model(cls, pk, config={}):
     """
     NOTE: it does not support cloning many2many and one2many
@@ -40,6 +45,116 @@ def clone_model(cls, pk, config={}):
     return cloned
 
 
+def reserve_pks(cls, count):
+    """
+    @return: list of `count` new primary keys for `cls` taken from its
+             sequence so that objects can be bulk inserted with their ids
+             already known (bulk_create doesn't return them).
+    """
+    if not count:
+        return []
+
+    cursor = connection.cursor()
+    cursor.execute(
+        'SELECT nextval(pg_get_serial_sequence(%s, %s)) '
+        'FROM generate_series(1, %s)',
+        [cls._meta.db_table, cls._meta.pk.column, count]
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def clone_objects(cls, objs, config={}, save=False):
+    """
+    Same as `clone_model` but for a list of `objs` already fetched.
+
+    The fks in `clone_fks` are cloned with one `bulk_clone_model` per
+    related model and the clones inserted with one `bulk_create` unless
+    `save` is True, in which case each clone is saved on its own (needed
+    when the model's save method does extra work).
+
+    @return: list of clones in the same order as `objs`
+    """
+    excludes = config.get('excludes', [])
+    clone_fks = config.get('clone_fks', [])
+    override_values = config.get('override_values', {})
+
+    # fks, all the ids of the same related model are cloned together
+    fk_ids = defaultdict(set)
+    for field in clone_fks:
+        if field in override_values:
+            continue
+        fk_field = cls._meta.get_field(field)
+        fk_ids[fk_field.rel.to].update(
+            getattr(obj, fk_field.attname) for obj in objs
+        )
+
+    cloned_fks = {}
+    for fk_clazz, ids in fk_ids.items():
+        cloned_fks[fk_clazz] = bulk_clone_model(
+            fk_clazz, ids, fk_clazz.cloning_config
+        )
+
+    cloned_objs = []
+    for obj in objs:
+        cloned = cls(**dict(
+            (field.attname, getattr(obj, field.attname))
+            for field in cls._meta.concrete_fields
+        ))
+        cloned.pk = None
+
+        # excludes
+        for field in excludes:
+            fk_field = cls._meta.get_field(field)
+            setattr(cloned, field, fk_field.get_default())
+
+        # fks
+        for field in clone_fks:
+            if field in override_values:
+                continue
+
+            fk_field = cls._meta.get_field(field)
+            fk_id = getattr(obj, fk_field.attname)
+            setattr(
+                cloned, fk_field.name,
+                cloned_fks[fk_field.rel.to].get(fk_id)
+            )
+
+        # overrides
+        for field, value in override_values.items():
+            setattr(cloned, field, value)
+
+        cloned_objs.append(cloned)
+
+    if save:
+        for cloned in cloned_objs:
+            cloned.save(force_insert=True)
+    else:
+        for cloned, pk in zip(cloned_objs, reserve_pks(cls, len(cloned_objs))):
+            cloned.pk = pk
+        cls.objects.bulk_create(cloned_objs)
+
+    return cloned_objs
+
+
+def bulk_clone_model(cls, pks, config={}):
+    """
+    Clones the objects of `cls` with primary keys `pks` fetching them with
+    one query and inserting the clones with one query (plus the ones of
+    the fks to clone, see `clone_objects`).
+
+    @return: dict of original pk -> clone
+    """
+    pks = [pk for pk in pks if pk]
+    if not pks:
+        return {}
+
+    objs = list(cls.objects.in_bulk(pks).values())
+    return dict(
+        (obj.pk, cloned)
+        for obj, cloned in zip(objs, clone_objects(cls, objs, config))
+    )
+
+
 class CloneModelMixin(object):
     cloning_config = {
         'excludes': [],  # these will be set to default vals
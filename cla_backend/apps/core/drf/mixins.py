@@ -1,10 +1,12 @@
 import jsonpatch
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.utils.datastructures import SortedDict
 
 from rest_framework.exceptions import MethodNotAllowed
 from rest_framework.response import Response as DRFResponse
 from rest_framework import status
+from rest_framework.serializers import BaseSerializer
 
 
 class NoParentReferenceException(BaseException):
@@ -81,6 +83,16 @@ class NestedGenericModelMixin(object):
 
 
 class JsonPatchViewSetMixin(object):
+    """
+    Keeps the serialized state of the object before and after the save so
+    that `jsonpatch` can return the forwards and backwards patches.
+
+    Only the fields that can change are serialized: all the plain fields
+    (cheap and possibly changed as a side effect of saving) and the nested
+    serializers present in the request data. The "before" state is taken
+    when the serializer gets the request data, before it writes to the
+    object, so the object doesn't need to be fetched again.
+    """
     @property
     def jsonpatch(self):
         forwards = jsonpatch.JsonPatch.from_diff(self.__pre_save__, self.__post_save__)
@@ -93,13 +105,46 @@ class JsonPatchViewSetMixin(object):
             'forwards': forwards.patch
         }
 
-    def pre_save(self, obj):
-        original_obj = self.get_object()
-        self.__pre_save__ = self.get_serializer_class()(original_obj).data
+    def get_patch_fields(self, serializer, data):
+        """
+        Returns the names of the fields to include in the patch given
+        the request `data`, None means all of them.
+        """
+        if not isinstance(data, dict):
+            return None
+
+        return [
+            name for name, field in serializer.fields.items()
+            if name in data or not isinstance(field, BaseSerializer)
+        ]
+
+    def serialize_patch_fields(self, obj):
+        serializer = self.get_serializer_class()()
+        if self.__patch_fields__ is None:
+            return serializer.to_native(obj)
+
+        data = SortedDict()
+        for name, field in serializer.fields.items():
+            if name in self.__patch_fields__:
+                field.initialize(parent=serializer, field_name=name)
+                key = serializer.get_field_key(name)
+                data[key] = field.field_to_native(obj, name)
+        return data
+
+    def get_serializer(self, instance=None, data=None, *args, **kwargs):
+        serializer = super(JsonPatchViewSetMixin, self).get_serializer(
+            instance, data, *args, **kwargs
+        )
+        if data is not None:
+            self.__patch_fields__ = None
+            if instance is not None:
+                self.__patch_fields__ = self.get_patch_fields(serializer, data)
+            self.__pre_save__ = self.serialize_patch_fields(instance)
+        return serializer
 
     def post_save(self, obj, created=False, **kwargs):
         super(JsonPatchViewSetMixin, self).post_save(obj, created=created)
-        self.__post_save__ = self.get_serializer_class()(obj).data
+        self.__post_save__ = self.serialize_patch_fields(obj)
 
         return obj
 
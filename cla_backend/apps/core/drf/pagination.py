@@ -1,3 +1,13 @@
+import base64
+import json
+import operator
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Q
+from django.db.models.fields import FieldDoesNotExist
+
+from rest_framework.exceptions import ParseError
 from rest_framework.templatetags.rest_framework import replace_query_param
 from rest_framework.pagination import BasePaginationSerializer
 from rest_framework import serializers
@@ -27,3 +37,300 @@ class RelativeUrlPaginationSerializer(BasePaginationSerializer):
     count = serializers.Field(source='paginator.count')
     next = RelativeNextPageField('*')
     previous = RelativePreviousPageField('*')
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage(object):
+    """
+    Page of a `CursorPaginator`, it can only be followed forwards.
+    """
+    def __init__(self, object_list, next_cursor, paginator):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.paginator = paginator
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return False
+
+
+class FieldOrderingKey(object):
+    """
+    Model field the object list of a `CursorPaginator` is ordered by.
+    """
+    is_extra = False
+
+    def __init__(self, field):
+        self.field = field
+        self.name = field.name
+
+    def get_value(self, obj):
+        return self.field.value_to_string(obj)
+
+    def to_python(self, value):
+        return self.field.to_python(value)
+
+    def get_sql(self, query, connection):
+        qn = connection.ops.quote_name
+        return '%s.%s' % (
+            qn(query.get_meta().db_table), qn(self.field.column)
+        ), []
+
+    def get_db_value(self, value, connection):
+        return self.field.get_db_prep_value(value, connection)
+
+
+class ExtraOrderingKey(object):
+    """
+    Extra select (e.g. a search rank) the object list of a
+    `CursorPaginator` is ordered by, its value can only be a number.
+    """
+    is_extra = True
+
+    def __init__(self, name):
+        self.name = name
+
+    def get_value(self, obj):
+        return getattr(obj, self.name)
+
+    def to_python(self, value):
+        if isinstance(value, bool) or \
+                not isinstance(value, (int, long, float)):
+            raise ValueError(value)
+        return value
+
+    def get_sql(self, query, connection):
+        sql, params = query.extra_select[self.name]
+        return '(%s)' % sql, list(params)
+
+    def get_db_value(self, value, connection):
+        return value
+
+
+class CursorPaginator(object):
+    """
+    Keyset paginator: instead of an OFFSET, each page is selected with a
+    WHERE clause on the values of the ordering fields of the last item
+    of the previous page, encoded in an opaque cursor. No COUNT query
+    is made unless `with_count` is True.
+
+    The ordering of the queryset can only include non null, non
+    relational fields of its model and numeric extra selects (e.g. the
+    search rank of `legalaid.views.CaseSearchFilter`), the pk is always
+    added as the last one to make the ordering total.
+
+    `extra_num` works as in `legalaid.views.PaginatorWithExtraItem`: each
+    page includes that many more items than expected, which are also
+    included in the next page.
+    """
+    def __init__(
+        self, object_list, per_page, extra_num=0, with_count=False
+    ):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.extra_num = extra_num
+        self.with_count = with_count
+        self.ordering = self.get_ordering()
+        self._count = None
+
+    @property
+    def count(self):
+        if not self.with_count:
+            return None
+        if self._count is None:
+            self._count = self.object_list.count()
+        return self._count
+
+    def get_ordering(self):
+        """
+        :return: list of (key, descending) the object list is ordered by,
+            see `FieldOrderingKey` and `ExtraOrderingKey`
+        """
+        query = self.object_list.query
+        opts = query.get_meta()
+        names = list(query.order_by)
+        if not names and query.default_ordering:
+            names = list(opts.ordering)
+
+        ordering = []
+        for name in names:
+            descending = name.startswith('-')
+            name = name.lstrip('-')
+            if name in query.extra_select:
+                ordering.append((ExtraOrderingKey(name), descending))
+                continue
+
+            if name == 'pk':
+                name = opts.pk.name
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                field = None
+            if field is None or field.rel or field.null:
+                raise InvalidCursor(
+                    u"Can't paginate with a cursor when ordering by %s" % name
+                )
+            ordering.append((FieldOrderingKey(field), descending))
+
+        if opts.pk.name not in [key.name for key, _ in ordering]:
+            descending = ordering[-1][1] if ordering else False
+            ordering.append((FieldOrderingKey(opts.pk), descending))
+        return ordering
+
+    def encode_cursor(self, obj):
+        values = [key.get_value(obj) for key, _ in self.ordering]
+        return base64.urlsafe_b64encode(json.dumps(values))
+
+    def decode_cursor(self, cursor):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(str(cursor)))
+            if len(values) != len(self.ordering):
+                raise ValueError(cursor)
+            return [
+                key.to_python(value)
+                for (key, _), value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise InvalidCursor(u'Invalid cursor')
+
+    def get_cursor_filter(self, values):
+        """
+        :return: Q object selecting the items after the ones with `values`
+        """
+        filters = []
+        for index, (key, descending) in enumerate(self.ordering):
+            lookups = dict(
+                (prev_key.name, value)
+                for (prev_key, _), value
+                in zip(self.ordering[:index], values)
+            )
+            lookup = '%s__%s' % (key.name, 'lt' if descending else 'gt')
+            lookups[lookup] = values[index]
+            filters.append(Q(**lookups))
+        return reduce(operator.or_, filters)
+
+    def get_cursor_where(self, values):
+        """
+        Same as `get_cursor_filter` as an extra where clause, needed when
+        ordering by extra selects as they can't be used in lookups.
+
+        :return: (sql, params)
+        """
+        query = self.object_list.query
+        connection = connections[self.object_list.db]
+        keys = []
+        for (key, descending), value in zip(self.ordering, values):
+            sql, params = key.get_sql(query, connection)
+            keys.append((
+                sql, params, key.get_db_value(value, connection), descending
+            ))
+
+        filters = []
+        filter_params = []
+        for index, (sql, params, value, descending) in enumerate(keys):
+            conditions = []
+            for prev_sql, prev_params, prev_value, _ in keys[:index]:
+                conditions.append('%s = %%s' % prev_sql)
+                filter_params += prev_params + [prev_value]
+            conditions.append('%s %s %%s' % (sql, '<' if descending else '>'))
+            filter_params += params + [value]
+            filters.append('(%s)' % ' AND '.join(conditions))
+        return '(%s)' % ' OR '.join(filters), filter_params
+
+    def page(self, cursor=None):
+        object_list = self.object_list.order_by(*[
+            '%s%s' % ('-' if descending else '', key.name)
+            for key, descending in self.ordering
+        ])
+        if cursor:
+            values = self.decode_cursor(cursor)
+            if any(key.is_extra for key, _ in self.ordering):
+                where, params = self.get_cursor_where(values)
+                object_list = object_list.extra(where=[where], params=params)
+            else:
+                object_list = object_list.filter(
+                    self.get_cursor_filter(values)
+                )
+
+        # one more item than shown is needed to know if there's a next page
+        items = list(object_list[:self.per_page + max(self.extra_num, 1)])
+        next_cursor = None
+        if len(items) > self.per_page:
+            next_cursor = self.encode_cursor(items[self.per_page - 1])
+        return CursorPage(
+            items[:self.per_page + self.extra_num], next_cursor, self
+        )
+
+
+class RelativeNextCursorField(serializers.Field):
+    cursor_field = 'cursor'
+
+    def to_native(self, value):
+        if not value.has_next():
+            return None
+        return replace_query_param('', self.cursor_field, value.next_cursor)
+
+
+class RelativeCursorPaginationSerializer(BasePaginationSerializer):
+    count = serializers.Field(source='paginator.count')
+    next = RelativeNextCursorField('*')
+    previous = RelativePreviousPageField('*')
+
+
+class CursorPaginationMixin(object):
+    """
+    Opt-in cursor pagination for list endpoints: when the `cursor` query
+    param is given (empty for the first page) the list is paginated with
+    a `CursorPaginator` and `next` links to the following page by cursor.
+    The count is only calculated if `with_count` is given as well.
+    """
+    cursor_query_param = 'cursor'
+    count_query_param = 'with_count'
+    cursor_paginator_class = CursorPaginator
+    cursor_pagination_serializer_class = RelativeCursorPaginationSerializer
+
+    def is_cursor_paginated(self):
+        return self.cursor_query_param in self.request.QUERY_PARAMS
+
+    def paginate_queryset(self, queryset, page_size=None):
+        if not self.is_cursor_paginated():
+            return super(CursorPaginationMixin, self).paginate_queryset(
+                queryset, page_size=page_size
+            )
+
+        page_size = page_size or self.get_paginate_by()
+        if not page_size:
+            return None
+
+        try:
+            paginator = self.cursor_paginator_class(
+                queryset, page_size,
+                extra_num=getattr(self.paginator_class, 'extra_num', 0),
+                with_count=bool(
+                    self.request.QUERY_PARAMS.get(self.count_query_param)
+                )
+            )
+            return paginator.page(
+                self.request.QUERY_PARAMS.get(self.cursor_query_param)
+            )
+        except InvalidCursor as e:
+            raise ParseError(unicode(e))
+
+    def get_pagination_serializer(self, page):
+        if not isinstance(page, CursorPage):
+            return super(CursorPaginationMixin, self).get_pagination_serializer(
+                page
+            )
+
+        class SerializerClass(self.cursor_pagination_serializer_class):
+            class Meta:
+                object_serializer_class = self.get_serializer_class()
+
+        return SerializerClass(
+            instance=page, context=self.get_serializer_context()
+        )
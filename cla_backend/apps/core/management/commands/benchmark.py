@@ -0,0 +1,127 @@
+import json
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, \
+    teardown_test_environment
+
+from south.management.commands import patch_for_test_db_setup
+
+
+class Command(BaseCommand):
+    """
+    Runs the benchmarks in `core.benchmarks` (or the ones starting with
+    the given names) against a new test database, writes the results as
+    JSON and, given a baseline written by a previous run, fails if any of
+    them has got slower or makes more queries.
+    """
+
+    args = '[benchmark name ...]'
+
+    option_list = BaseCommand.option_list + (
+        make_option('-s', '--sizes',
+                    dest='sizes', default='10,100,1000',
+                    help='comma separated data sizes to run the benchmarks '
+                         'with'
+        ),
+        make_option('-r', '--repeat',
+                    dest='repeat', type='int', default=5,
+                    help='number of times each benchmark is run per size'
+        ),
+        make_option('-o', '--output',
+                    dest='output', default='benchmark.json',
+                    help='path of the JSON file to write the results to'
+        ),
+        make_option('-b', '--baseline',
+                    dest='baseline',
+                    help='path of the JSON results to compare with'
+        ),
+        make_option('-t', '--tolerance',
+                    dest='tolerance', type='float', default=0.25,
+                    help='how much slower than the baseline a benchmark '
+                         'can get before it fails, 0.25 being 25%'
+        ),
+        make_option('--noinput',
+                    action='store_false', dest='interactive', default=True,
+                    help='destroy an existing test database without asking'
+        ),
+    )
+
+    help = ('Benchmarks the hot paths of the backend with synthetic data '
+            'and compares the results with a baseline')
+
+    def handle(self, *names, **options):
+        try:
+            sizes = [int(size) for size in options['sizes'].split(',')]
+        except ValueError:
+            raise CommandError('Invalid sizes: %s' % options['sizes'])
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                baseline = json.load(f)['results']
+
+        # imported here as it needs the test dependencies
+        from core.benchmarks import get_benchmarks, run_benchmark, \
+            compare_results
+
+        benchmarks = [
+            benchmark for benchmark in get_benchmarks()
+            if not names or benchmark.name.startswith(names)
+        ]
+        if not benchmarks:
+            raise CommandError('No benchmarks matching %s' % ', '.join(names))
+
+        results = {}
+        with TestDatabase(options['interactive']):
+            for benchmark in benchmarks:
+                results[benchmark.name] = {}
+                for size in sizes:
+                    result = run_benchmark(benchmark, size, options['repeat'])
+                    results[benchmark.name][str(size)] = result
+                    self.stdout.write(
+                        '%s [%s]: %.1fms median, %s queries' % (
+                            benchmark.name, size, result['median'],
+                            result['queries']
+                        )
+                    )
+
+        with open(options['output'], 'w') as f:
+            json.dump({
+                'sizes': sizes, 'repeat': options['repeat'],
+                'results': results
+            }, f, indent=2, sort_keys=True)
+        self.stdout.write('Results written to %s' % options['output'])
+
+        if baseline is not None:
+            regressions = compare_results(
+                results, baseline, options['tolerance']
+            )
+            if regressions:
+                raise CommandError('Regressions:\n%s' % '\n'.join(
+                    '%s [%s]: %s' % regression for regression in regressions
+                ))
+            self.stdout.write('No regressions')
+
+
+class TestDatabase(object):
+    """
+    Creates the test database the same way as the test runner and destroys
+    it on exit.
+    """
+    def __init__(self, interactive, verbosity=0):
+        self.interactive = interactive
+        self.verbosity = verbosity
+
+    def __enter__(self):
+        patch_for_test_db_setup()
+        setup_test_environment()
+        self.old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(
+            self.verbosity, autoclobber=not self.interactive
+        )
+
+    def __exit__(self, *exc_info):
+        connection.creation.destroy_test_db(self.old_name, self.verbosity)
+        teardown_test_environment()
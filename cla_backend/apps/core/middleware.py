@@ -1,6 +1,14 @@
+import random
+import time
+
+from django.conf import settings
 from django.http import Http404
+from django.utils.crypto import constant_time_compare
 from django_statsd.clients import statsd
 
+from .profiling import start_profile, stop_profile, get_profile, \
+    patch_serializers
+
 
 class GraphiteMiddleware(object):
 
@@ -12,3 +20,94 @@ class GraphiteMiddleware(object):
         if not isinstance(exception, Http404):
             statsd.incr('response.500')
 
+
+class ProfilingMiddleware(object):
+    """
+    Profiles the requests with the `settings.PROFILING_REQUEST_HEADER`
+    header and a `settings.PROFILING_SAMPLE_RATE` share of the others,
+    sending the number of queries, duplicate queries, SQL time and time
+    spent serializing, rendering and processing events to statsd as
+    `profile.<view>.<action>.<metric>` timers.
+
+    With `settings.PROFILING_RESPONSE_HEADER` the metrics are also added
+    to the response as an `X-Profile` header.
+
+    As profiling makes requests more expensive, the request header is only
+    honoured when its value is `settings.PROFILING_HEADER_SECRET` or with
+    `settings.DEBUG` on.
+    """
+    def __init__(self):
+        patch_serializers()
+
+    def should_profile(self, request):
+        header = getattr(settings, 'PROFILING_REQUEST_HEADER', None)
+        if header and header in request.META and self.can_request_profile(
+            request.META[header]
+        ):
+            return True
+        sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0)
+        return sample_rate > 0 and random.random() < sample_rate
+
+    def can_request_profile(self, value):
+        if settings.DEBUG:
+            return True
+        secret = getattr(settings, 'PROFILING_HEADER_SECRET', None)
+        return bool(secret) and constant_time_compare(value, secret)
+
+    def get_view_name(self, request, response):
+        """
+        :return: (view, action) of the request, DRF views are named after
+            their class and action (e.g. `list`, `partial_update`).
+        """
+        action = request.method.lower()
+        renderer_context = getattr(response, 'renderer_context', None) or {}
+        view = renderer_context.get('view')
+        if view is not None:
+            return (
+                view.__class__.__name__, getattr(view, 'action', None) or action
+            )
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is not None:
+            return (
+                resolver_match.url_name or resolver_match.func.__name__,
+                action
+            )
+        return None, action
+
+    def process_request(self, request):
+        if self.should_profile(request):
+            request.profile = start_profile()
+
+    def process_template_response(self, request, response):
+        profile = getattr(request, 'profile', None)
+        if profile is not None:
+            start = time.time()
+            response.add_post_render_callback(
+                lambda response: profile.add_timing(
+                    'render', time.time() - start
+                )
+            )
+        return response
+
+    def process_response(self, request, response):
+        profile = getattr(request, 'profile', None)
+        if profile is None:
+            return response
+        if get_profile() is profile:
+            stop_profile()
+
+        metrics = profile.get_metrics()
+        view_name, action = self.get_view_name(request, response)
+        if view_name:
+            for name, value in metrics.items():
+                statsd.timing(
+                    'profile.%s.%s.%s' % (view_name, action, name), value
+                )
+
+        if getattr(settings, 'PROFILING_RESPONSE_HEADER', False):
+            response['X-Profile'] = '; '.join(
+                '%s=%g' % (name, round(value, 1))
+                for name, value in sorted(metrics.items())
+            )
+        return response
@@ -0,0 +1,164 @@
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import connections
+
+from rest_framework.serializers import BaseSerializer
+
+
+_local = threading.local()
+
+# literals replaced when working out the fingerprint of a query
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST_RE = re.compile(r'\((?:\s*\?\s*,)+\s*\?\s*\)')
+
+
+def get_query_fingerprint(sql):
+    """
+    `sql` without its literals so that the queries only differing by
+    their params (e.g. the ones of a N+1) get the same fingerprint.
+    """
+    sql = _STRING_RE.sub('?', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    return _IN_LIST_RE.sub('(?)', sql)
+
+
+class RequestProfile(object):
+    """
+    Collects the queries run and the time spent in the profiled sections
+    (see `profile_section`) while it's active.
+
+    Queries are taken from `connection.queries` so the connections are
+    switched to debug cursors until the profile is stopped.
+    """
+    def __init__(self):
+        self.timings = defaultdict(float)
+        self.queries = []
+        self._active_sections = set()
+        self._connections = []
+
+    def start(self):
+        for connection in connections.all():
+            self._connections.append(
+                (connection, connection.use_debug_cursor,
+                 len(connection.queries))
+            )
+            connection.use_debug_cursor = True
+
+    def stop(self):
+        for connection, use_debug_cursor, start in self._connections:
+            self.queries.extend(connection.queries[start:])
+            connection.use_debug_cursor = use_debug_cursor
+        self._connections = []
+
+    @contextmanager
+    def section(self, name):
+        # nested sections with the same name are timed once
+        if name in self._active_sections:
+            yield
+            return
+
+        self._active_sections.add(name)
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.time() - start
+            self._active_sections.discard(name)
+
+    def add_timing(self, name, seconds):
+        self.timings[name] += seconds
+
+    @property
+    def query_count(self):
+        return len(self.queries)
+
+    @property
+    def sql_time(self):
+        return sum(float(query['time']) for query in self.queries)
+
+    @property
+    def duplicate_queries(self):
+        """
+        Number of queries with the same fingerprint as a previous one.
+        """
+        fingerprints = set(
+            get_query_fingerprint(query['sql']) for query in self.queries
+        )
+        return len(self.queries) - len(fingerprints)
+
+    def get_metrics(self):
+        """
+        :return: {name: value}, times in milliseconds.
+        """
+        metrics = {
+            'queries': self.query_count,
+            'sql': self.sql_time * 1000,
+            'duplicate_queries': self.duplicate_queries,
+        }
+        for name, seconds in self.timings.items():
+            metrics[name] = seconds * 1000
+        return metrics
+
+
+def get_profile():
+    return getattr(_local, 'profile', None)
+
+
+def start_profile():
+    """
+    Profiles this thread until `stop_profile` is called.
+    """
+    stop_profile()
+    _local.profile = RequestProfile()
+    _local.profile.start()
+    return _local.profile
+
+
+def stop_profile():
+    profile = get_profile()
+    _local.profile = None
+    if profile is not None:
+        profile.stop()
+    return profile
+
+
+@contextmanager
+def profile_section(name):
+    """
+    Adds the time spent in the block to `name` of the current profile,
+    does nothing if the thread isn't being profiled.
+    """
+    profile = get_profile()
+    if profile is None:
+        yield
+        return
+
+    with profile.section(name):
+        yield
+
+
+_serializers_patched = False
+
+
+def patch_serializers():
+    """
+    Times the serialization of objects (`BaseSerializer.data`) of the
+    profiled requests.
+    """
+    global _serializers_patched
+    if _serializers_patched:
+        return
+    _serializers_patched = True
+
+    get_data = BaseSerializer.data.fget
+
+    def data(self):
+        with profile_section('serializer'):
+            return get_data(self)
+
+    BaseSerializer.data = property(data, doc=BaseSerializer.data.__doc__)
@@ -0,0 +1,53 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.benchmarks import Benchmark, run_benchmark, compare_results
+
+
+class UserBenchmark(Benchmark):
+    name = 'user'
+
+    def setup(self, size):
+        for index in range(size):
+            User.objects.create(username='user%s' % index)
+
+    def run(self):
+        self.counts = getattr(self, 'counts', [])
+        self.counts.append(User.objects.count())
+        User.objects.create(username='new')
+
+
+class RunBenchmarkTestCase(TestCase):
+    def test_runs_rolled_back(self):
+        benchmark = UserBenchmark()
+
+        result = run_benchmark(benchmark, 3, repeat=4)
+
+        self.assertEqual(benchmark.counts, [3, 3, 3, 3])
+        self.assertEqual(result['queries'], 2)
+        self.assertTrue(result['min'] <= result['median'])
+        self.assertEqual(User.objects.count(), 0)
+
+
+class CompareResultsTestCase(TestCase):
+    def result(self, median, queries=1):
+        return {
+            'min': median, 'median': median, 'mean': median,
+            'queries': queries
+        }
+
+    def test_regressions(self):
+        baseline = {
+            'a': {'10': self.result(10), '100': self.result(100)},
+            'b': {'10': self.result(10, queries=2)},
+        }
+        results = {
+            'a': {'10': self.result(12), '100': self.result(130)},
+            'b': {'10': self.result(5, queries=3)},
+            'c': {'10': self.result(1000)},
+        }
+
+        self.assertEqual(compare_results(results, baseline, 0.25), [
+            ('a', '100', '130.0ms, was 100.0ms'),
+            ('b', '10', '3 queries, was 2'),
+        ])
@@ -0,0 +1,172 @@
+import mock
+
+from django.contrib.auth.models import User
+from django.core.urlresolvers import reverse
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+
+from core.middleware import ProfilingMiddleware
+from core.profiling import get_query_fingerprint, start_profile, \
+    stop_profile, get_profile, profile_section
+from legalaid.tests.views.test_base import CLAOperatorAuthBaseApiTestMixin
+
+
+class UserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ('username',)
+
+
+class QueryFingerprintTestCase(TestCase):
+    def test_params_replaced(self):
+        self.assertEqual(
+            get_query_fingerprint(
+                "SELECT * FROM a WHERE id = 12 AND name = 'it''s'"
+            ),
+            'SELECT * FROM a WHERE id = ? AND name = ?'
+        )
+
+    def test_in_lists_collapsed(self):
+        self.assertEqual(
+            get_query_fingerprint('SELECT * FROM a WHERE id IN (1, 2, 3)'),
+            get_query_fingerprint('SELECT * FROM a WHERE id IN (4)'),
+        )
+
+
+class RequestProfileTestCase(TestCase):
+    def tearDown(self):
+        stop_profile()
+        super(RequestProfileTestCase, self).tearDown()
+
+    def test_queries_collected(self):
+        User.objects.create(username='u1')
+        User.objects.create(username='u2')
+
+        start_profile()
+        for username in ['u1', 'u2']:
+            User.objects.get(username=username)
+        User.objects.count()
+        profile = stop_profile()
+
+        self.assertEqual(profile.query_count, 3)
+        self.assertEqual(profile.duplicate_queries, 1)
+        self.assertEqual(get_profile(), None)
+
+    def test_nested_sections_timed_once(self):
+        profile = start_profile()
+        with mock.patch('core.profiling.time.time', side_effect=[1, 4]):
+            with profile_section('events'):
+                with profile_section('events'):
+                    pass
+
+        self.assertEqual(profile.timings, {'events': 3})
+
+    def test_section_without_profile(self):
+        with profile_section('events'):
+            pass
+        self.assertEqual(get_profile(), None)
+
+
+@override_settings(
+    PROFILING_REQUEST_HEADER='HTTP_X_PROFILE',
+    PROFILING_HEADER_SECRET='secret',
+    PROFILING_SAMPLE_RATE=0,
+    PROFILING_RESPONSE_HEADER=True
+)
+class ProfilingMiddlewareTestCase(TestCase):
+    def setUp(self):
+        super(ProfilingMiddlewareTestCase, self).setUp()
+        self.middleware = ProfilingMiddleware()
+        self.factory = RequestFactory()
+
+    def tearDown(self):
+        stop_profile()
+        super(ProfilingMiddlewareTestCase, self).tearDown()
+
+    def test_not_profiled_without_header(self):
+        request = self.factory.get('/')
+        self.middleware.process_request(request)
+        self.assertEqual(get_profile(), None)
+
+    def test_header_ignored_without_secret(self):
+        request = self.factory.get('/', HTTP_X_PROFILE='1')
+        self.middleware.process_request(request)
+        self.assertEqual(get_profile(), None)
+
+        with override_settings(PROFILING_HEADER_SECRET=None):
+            request = self.factory.get('/', HTTP_X_PROFILE='')
+            self.middleware.process_request(request)
+            self.assertEqual(get_profile(), None)
+
+    @override_settings(DEBUG=True)
+    def test_header_honoured_in_debug(self):
+        request = self.factory.get('/', HTTP_X_PROFILE='1')
+        self.middleware.process_request(request)
+        self.assertNotEqual(get_profile(), None)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_profiled_when_sampled(self):
+        request = self.factory.get('/')
+        self.middleware.process_request(request)
+        self.assertNotEqual(get_profile(), None)
+
+    def test_active_profile_not_stopped(self):
+        profile = start_profile()
+        request = self.factory.get('/')
+        self.middleware.process_request(request)
+        self.middleware.process_response(request, mock.MagicMock())
+        self.assertIs(get_profile(), profile)
+
+    @mock.patch('core.middleware.statsd')
+    def test_metrics_sent(self, statsd):
+        User.objects.create(username='u1')
+        request = self.factory.get('/', HTTP_X_PROFILE='secret')
+        self.middleware.process_request(request)
+
+        serializer = UserSerializer(User.objects.all(), many=True)
+        serializer.data
+
+        response = mock.MagicMock(renderer_context={'view': None})
+        request.resolver_match = mock.Mock(url_name='user-list')
+        self.middleware.process_response(request, response)
+
+        timings = dict(
+            (call[0][0], call[0][1]) for call in statsd.timing.call_args_list
+        )
+        self.assertEqual(timings['profile.user-list.get.queries'], 1)
+        self.assertEqual(
+            timings['profile.user-list.get.duplicate_queries'], 0
+        )
+        self.assertIn('profile.user-list.get.sql', timings)
+        self.assertIn('profile.user-list.get.serializer', timings)
+        response.__setitem__.assert_called_once_with(
+            'X-Profile', mock.ANY
+        )
+
+
+@override_settings(
+    PROFILING_REQUEST_HEADER='HTTP_X_PROFILE',
+    PROFILING_HEADER_SECRET='secret',
+    PROFILING_SAMPLE_RATE=0,
+    PROFILING_RESPONSE_HEADER=True
+)
+class ProfilingApiTestCase(CLAOperatorAuthBaseApiTestMixin, APITestCase):
+    def tearDown(self):
+        stop_profile()
+        super(ProfilingApiTestCase, self).tearDown()
+
+    @mock.patch('core.middleware.statsd')
+    def test_api_request_profiled_with_header(self, statsd):
+        response = self.client.get(
+            reverse('call_centre:case-list'), HTTP_X_PROFILE='secret',
+            HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('queries=', response['X-Profile'])
+        names = [call[0][0] for call in statsd.timing.call_args_list]
+        self.assertIn('profile.CaseViewSet.list.queries', names)
@@ -1,10 +1,12 @@
 import hashlib
 import re
 import codecs
+import cPickle as pickle
+import os
 import networkx as nx
 from lxml import objectify
 
-from os.path import join, abspath, dirname
+from os.path import join, abspath, dirname, basename, exists
 
 from django.conf import settings
 from django.utils.functional import SimpleLazyObject
@@ -28,8 +30,7 @@ class GraphImporter(object):
         self.prop_mapping = None
 
     def process(self):
-        with open(self.file_path, 'rb') as afile:
-            version = hashlib.md5(afile.read()).hexdigest()
+        version = get_graph_version(self.file_path)
         self.graph = nx.MultiDiGraph(version=version)
 
         with codecs.open(self.file_path, 'r', encoding="utf-8") as f:
@@ -127,11 +128,79 @@ class GraphImporter(object):
             self.graph.add_edge(edge.attrib['source'], edge.attrib['target'])
 
 
+# bump this when the structure of the processed graph changes so that
+# existing compiled graphs get ignored
+COMPILED_GRAPH_FORMAT = 1
+
+
+def get_graph_version(file_path):
+    with open(file_path, 'rb') as afile:
+        return hashlib.md5(afile.read()).hexdigest()
+
+
+def get_graph_file_path(file_name=settings.DIAGNOSIS_FILE_NAME):
+    return join(abspath(dirname(__file__)), 'data', file_name)
+
+
+def get_compiled_graph_path(file_path, version):
+    compiled_dir = getattr(
+        settings, 'DIAGNOSIS_COMPILED_GRAPH_DIR', None
+    ) or dirname(file_path)
+    return join(
+        compiled_dir, '%s.%s.compiled' % (basename(file_path), version)
+    )
+
+
+def compile_graph(file_path):
+    """
+    Parses the graphml file and dumps the processed graph into a binary file
+    named after the md5 of the graphml file so that it can be loaded by
+    `load_compiled_graph` without having to parse and process it again.
+
+    :return: path to the compiled graph
+    """
+    graph = GraphImporter(file_path).process()
+    compiled_path = get_compiled_graph_path(file_path, graph.graph['version'])
+
+    tmp_path = '%s.%s.tmp' % (compiled_path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(
+            (COMPILED_GRAPH_FORMAT, graph.graph['version'], graph),
+            f, pickle.HIGHEST_PROTOCOL
+        )
+    os.rename(tmp_path, compiled_path)
+    return compiled_path
+
+
+def load_compiled_graph(file_path):
+    """
+    :return: the compiled graph for the current version of the graphml file
+        or None if it hasn't been compiled or it's stale
+    """
+    version = get_graph_version(file_path)
+    compiled_path = get_compiled_graph_path(file_path, version)
+    if not exists(compiled_path):
+        return None
+
+    try:
+        with open(compiled_path, 'rb') as f:
+            graph_format, graph_version, graph = pickle.load(f)
+    except Exception:
+        return None
+
+    if graph_format != COMPILED_GRAPH_FORMAT or graph_version != version:
+        return None
+    return graph
+
+
 def get_graph(file_name=settings.DIAGNOSIS_FILE_NAME):
-    file_path = join(abspath(dirname(__file__)), 'data', file_name)
-    importer = GraphImporter(file_path)
+    file_path = get_graph_file_path(file_name)
 
-    return importer.process()
+    graph = load_compiled_graph(file_path)
+    if graph is None:
+        importer = GraphImporter(file_path)
+        graph = importer.process()
+    return graph
 
 
 def get_graph_mock():
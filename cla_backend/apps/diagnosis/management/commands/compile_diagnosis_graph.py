@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from diagnosis.graph import compile_graph, get_graph_file_path
+
+
+class Command(BaseCommand):
+
+    args = '[GRAPH_FILE_NAME]'
+    help = ('Parses the diagnosis graphml file and writes the processed graph '
+            'to a compiled file so that processes can load it without '
+            'parsing it again. Defaults to settings.DIAGNOSIS_FILE_NAME')
+
+    def handle(self, *args, **kwargs):
+        file_name = args[0] if args else settings.DIAGNOSIS_FILE_NAME
+
+        compiled_path = compile_graph(get_graph_file_path(file_name))
+
+        self.stdout.write('Compiled graph written to %s' % compiled_path)
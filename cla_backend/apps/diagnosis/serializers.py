@@ -9,7 +9,8 @@ from legalaid.models import Category
 
 from .graph import graph
 from rest_framework.relations import SlugRelatedField
-from .utils import is_terminal, is_pre_end_node, get_node_scope_value
+from .utils import is_terminal, is_pre_end_node, get_node_scope_value, \
+    get_ordered_children, get_children_ids
 
 
 class DiagnosisSerializer(ClaModelSerializer):
@@ -67,16 +68,7 @@ class DiagnosisSerializer(ClaModelSerializer):
             current_node_id = self.graph.graph['operator_root_id']
 
         # populating choices
-        children = self.graph.successors(current_node_id)
-        nodes = []
-        for child_id in children:
-            node = self.graph.node[child_id].copy()
-            node['id'] = child_id
-            nodes.append(node)
-        # nodes = [(node_id, self.graph.node[node_id])
-        #          for node_id in children]
-        nodes = sorted(nodes, key=lambda x: x['order'])
-        return nodes
+        return list(get_ordered_children(self.graph, current_node_id))
 
     def get_context(self, obj):
         context = {}
@@ -118,7 +110,7 @@ class DiagnosisSerializer(ClaModelSerializer):
 
             # if pre end node => process end node directly
             if is_pre_end_node(self.graph, obj.current_node_id):
-                obj.current_node_id = self.graph.successors(obj.current_node_id)[0]
+                obj.current_node_id = get_children_ids(self.graph, obj.current_node_id)[0]
                 self.process_obj(obj)
         else:
             obj.nodes = []
@@ -1,4 +1,11 @@
-from django.test import TestCase
+import cPickle as pickle
+import shutil
+import tempfile
+
+import mock
+
+from django.test import TestCase, SimpleTestCase
+from django.test.utils import override_settings
 
 from django.conf import settings
 from django.core.management import call_command
@@ -7,8 +14,10 @@ from cla_common.constants import DIAGNOSIS_SCOPE
 
 from legalaid.models import Category
 
-from diagnosis.graph import get_graph
-from diagnosis.utils import get_node_scope_value
+from diagnosis.graph import get_graph, get_graph_file_path, \
+    get_graph_version, compile_graph, load_compiled_graph, GraphImporter, \
+    COMPILED_GRAPH_FORMAT
+from diagnosis.utils import get_node_scope_value, get_graph_index
 
 if not hasattr(settings, 'ORIGINAL_DIAGNOSIS_FILE_NAME'):
     raise Exception(
@@ -55,3 +64,87 @@ class GraphTestCase(TestCase):
 
         root_id = self.graph.graph['operator_root_id']
         move_down(root_id, {}, [])
+
+
+class CompiledGraphTestCase(SimpleTestCase):
+
+    def setUp(self):
+        super(CompiledGraphTestCase, self).setUp()
+        self.compiled_dir = tempfile.mkdtemp()
+        self.settings_override = override_settings(
+            DIAGNOSIS_COMPILED_GRAPH_DIR=self.compiled_dir
+        )
+        self.settings_override.enable()
+        self.file_path = get_graph_file_path(settings.DIAGNOSIS_FILE_NAME)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.compiled_dir)
+        super(CompiledGraphTestCase, self).tearDown()
+
+    def test_not_compiled(self):
+        self.assertEqual(load_compiled_graph(self.file_path), None)
+
+    def test_compiled_graph_same_as_parsed(self):
+        compiled_path = compile_graph(self.file_path)
+        self.assertTrue(compiled_path.startswith(self.compiled_dir))
+
+        parsed = GraphImporter(self.file_path).process()
+        compiled = load_compiled_graph(self.file_path)
+
+        self.assertEqual(compiled.graph, parsed.graph)
+        self.assertEqual(dict(compiled.nodes(data=True)), dict(parsed.nodes(data=True)))
+        self.assertItemsEqual(compiled.edges(), parsed.edges())
+
+        with mock.patch('diagnosis.graph.GraphImporter') as importer:
+            graph = get_graph(file_name=settings.DIAGNOSIS_FILE_NAME)
+            self.assertFalse(importer.called)
+        self.assertEqual(graph.graph, parsed.graph)
+
+    def test_stale_compiled_graph_ignored(self):
+        compiled_path = compile_graph(self.file_path)
+
+        with open(compiled_path, 'wb') as f:
+            pickle.dump((COMPILED_GRAPH_FORMAT, 'other version', None), f)
+        self.assertEqual(load_compiled_graph(self.file_path), None)
+
+        with open(compiled_path, 'wb') as f:
+            f.write('corrupted')
+        self.assertEqual(load_compiled_graph(self.file_path), None)
+
+        graph = get_graph(file_name=settings.DIAGNOSIS_FILE_NAME)
+        self.assertEqual(
+            graph.graph['version'], get_graph_version(self.file_path)
+        )
+
+
+class GraphIndexTestCase(SimpleTestCase):
+
+    def setUp(self):
+        super(GraphIndexTestCase, self).setUp()
+        self.graph = get_graph()
+
+    def test_index_matches_graph(self):
+        index = get_graph_index(self.graph)
+
+        for node_id in self.graph.nodes():
+            successors = self.graph.successors(node_id)
+
+            children = [
+                dict(self.graph.node[child_id], id=child_id)
+                for child_id in successors
+            ]
+            children.sort(key=lambda x: x['order'])
+            self.assertEqual(list(index.child_nodes[node_id]), children)
+
+            self.assertEqual(node_id in index.terminal, not successors)
+            self.assertEqual(
+                node_id in index.pre_end,
+                len(successors) == 1 and
+                not self.graph.successors(successors[0])
+            )
+
+    def test_index_built_once_per_version(self):
+        self.assertTrue(
+            get_graph_index(self.graph) is get_graph_index(get_graph())
+        )
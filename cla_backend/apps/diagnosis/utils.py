@@ -3,6 +3,79 @@ from django.template.defaultfilters import striptags
 from cla_common.constants import DIAGNOSIS_SCOPE
 
 
+class GraphIndex(object):
+    """
+    Precomputed lookups over a diagnosis graph so that traversing it doesn't
+    need to call `successors()` or strip the labels again and again.
+
+    The index is built once per graph version (see `get_graph_index`) and
+    must be treated as read-only.
+    """
+
+    def __init__(self, digraph):
+        children = {}
+        child_nodes = {}
+        for node_id in digraph.node.keys():
+            nodes = []
+            for child_id in digraph.successors(node_id):
+                node = digraph.node[child_id].copy()
+                node['id'] = child_id
+                nodes.append(node)
+            nodes = sorted(nodes, key=lambda x: x['order'])
+
+            child_nodes[node_id] = tuple(nodes)
+            children[node_id] = tuple(digraph.successors(node_id))
+
+        self.children = children
+        self.child_nodes = child_nodes
+        self.terminal = frozenset(
+            node_id for node_id, ids in children.items() if not ids
+        )
+        self.pre_end = frozenset(
+            node_id for node_id, ids in children.items()
+            if len(ids) == 1 and ids[0] in self.terminal
+        )
+        self.scope_values = dict(
+            (node_id, self._get_scope_value(digraph.node[node_id]))
+            for node_id in self.terminal
+        )
+
+    def _get_scope_value(self, node):
+        label = striptags(node['label']+"    ").strip()
+
+        return DIAGNOSIS_SCOPE.CHOICES_CONST_DICT.get(
+            label, DIAGNOSIS_SCOPE.UNKNOWN
+        )
+
+
+_graph_indexes = {}
+
+
+def get_graph_index(digraph):
+    """
+    :return: the `GraphIndex` of `digraph`, cached by graph version
+    """
+    version = digraph.graph.get('version')
+    if not version:
+        return GraphIndex(digraph)
+
+    if version not in _graph_indexes:
+        _graph_indexes[version] = GraphIndex(digraph)
+    return _graph_indexes[version]
+
+
+def get_ordered_children(digraph, g_node_id):
+    """
+    :return: tuple of child node dicts (with 'id') sorted by 'order',
+        these are shared so they must not be modified
+    """
+    return get_graph_index(digraph).child_nodes[g_node_id]
+
+
+def get_children_ids(digraph, g_node_id):
+    return get_graph_index(digraph).children[g_node_id]
+
+
 def is_terminal(digraph, g_node_id):
     """
 
@@ -12,23 +85,12 @@ def is_terminal(digraph, g_node_id):
     """
     if not g_node_id:
         return False
-    return not bool(digraph.successors(g_node_id))
+    return g_node_id in get_graph_index(digraph).terminal
 
 
 def is_pre_end_node(digraph, g_node_id):
-    children = digraph.successors(g_node_id)
-    if len(children) == 1 and is_terminal(digraph, children[0]):
-        return True
-    return False
+    return g_node_id in get_graph_index(digraph).pre_end
 
 
 def get_node_scope_value(digraph, g_node_id):
-    if not is_terminal(digraph, g_node_id):
-        return None
-
-    node = digraph.node[g_node_id]
-    label = striptags(node['label']+"    ").strip()
-
-    return DIAGNOSIS_SCOPE.CHOICES_CONST_DICT.get(
-        label, DIAGNOSIS_SCOPE.UNKNOWN
-    )
+    return get_graph_index(digraph).scope_values.get(g_node_id)
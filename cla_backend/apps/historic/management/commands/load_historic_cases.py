@@ -1,33 +1,34 @@
-from collections import defaultdict
 import csv
-from operator import attrgetter
-import datetime
-from django.utils.itercompat import is_iterable
-from historic.models import CaseArchived
-import os
-import sys
+import itertools
 from optparse import make_option
+
 from dateutil.parser import parse
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils.itercompat import is_iterable
 from django.utils.timezone import make_aware, UTC
 
+from core.bulk import copy_rows
+from historic.models import CaseArchived
 
 
-from django.core.management.base import BaseCommand
-
 def yesno(str):
     return True if str.upper() == 'YES' else False
 
 def parse_dt(str):
     str = str.strip()
     if str and is_iterable(str):
-        try:
-            return make_aware(parse(str, dayfirst=True), UTC())
-        except Exception as e:
-            import pdb; pdb.set_trace()
-
+        return make_aware(parse(str, dayfirst=True), UTC())
 
 
 class Command(BaseCommand):
+    """
+    Both files are streamed into load tables in batches, each written
+    with one COPY in its own transaction so that an interrupted load can
+    be carried on with --resume. The historic cases are then replaced
+    with the loaded ones in a single transaction, searches keep seeing
+    the previous cases until it's committed.
+    """
 
     option_list = BaseCommand.option_list + (
         make_option('-c','--case_file',
@@ -38,6 +39,15 @@ class Command(BaseCommand):
                     dest='kb_file',
                     help='path to accompanying knowledge-base .csv file'
         ),
+        make_option('-b', '--batch_size',
+                    dest='batch_size', type='int', default=10000,
+                    help='number of rows written at a time'
+        ),
+        make_option('-r', '--resume',
+                    dest='resume', action='store_true', default=False,
+                    help='carry on with the rows not loaded by a previous '
+                         'interrupted run'
+        ),
     )
 
     help = ('Create CaseArchived object from a case and knowledge-base CSV')
@@ -47,89 +57,194 @@ class Command(BaseCommand):
         'kb_file'
     )
 
+    cases_table = 'historic_casearchived_load'
+    referrals_table = 'historic_casearchived_kb_load'
+
+    # columns of the load tables, in the order of the rows written to them
+    case_columns = (
+        'line', 'laa_reference', 'full_name', 'date_of_birth', 'postcode',
+        'created', 'outcome_code', 'outcome_code_date',
+        'specialist_referred_to', 'date_specialist_referred', 'area_of_law',
+        'in_scope', 'financially_eligible', 'search_field'
+    )
+    referral_columns = ('line', 'case_id', 'title')
+
     def handle(self, *args, **options):
         if options['case_file'] is None or options['kb_file'] is None:
             raise ValueError('Missing parameter. Try --help')
+        batch_size = options['batch_size']
+
+        self.create_load_tables(drop=not options['resume'])
+
         # Load referrals
         self.stderr.write('Loading referrals from %s' % options['kb_file'])
-        self.load_referrals(options['kb_file'])
-        self.stderr.write('Found referrals %s for cases' % len(self.referrals))
-
+        count = self.load_file(
+            options['kb_file'], self.referrals_table, self.referral_columns,
+            self.record_to_referral, batch_size
+        )
+        self.stderr.write('Found %s referrals' % count)
 
         # Load cases
         self.stderr.write('Loading cases from %s' % options['case_file'])
-        self.load_cases(options['case_file'])
-        self.stderr.write('Found %s cases' % len(self.cases))
-
-        # Clear out existing cases if required
-        existing_cases_count = CaseArchived.objects.all().count()
-        if existing_cases_count:
-            self.stderr.write('Clearing out %s existing historic cases.' % existing_cases_count)
-            CaseArchived.objects.all().delete()
-
-        fake_datetime = datetime.datetime(1900,1,1).replace(tzinfo=UTC())
-        # Writing Cases to the database
-
-        def _getdate(x):
-            return x.outcome_code_date or fake_datetime
-        self.cases =  sorted(self.cases, key=_getdate, reverse=True)
-
-        CaseArchived.objects.bulk_create(self.cases)
-
-
-    def get_referrals(self, laa_reference):
-        all_refs = self.referrals.get(laa_reference)
-        if all_refs:
-            return '\n'.join(all_refs)
-
-    def load_referrals(self, filename):
-        self.referrals = defaultdict(list)
+        count = self.load_file(
+            options['case_file'], self.cases_table, self.case_columns,
+            self.record_to_case_archived, batch_size,
+            reader_kwargs={'lineterminator': '\n'}
+        )
+        self.stderr.write('Found %s cases' % count)
+
+        self.stderr.write('Replacing the existing historic cases')
+        self.replace_cases()
+        self.drop_load_tables()
+
+    def create_load_tables(self, drop=True):
+        cursor = connection.cursor()
+        if drop:
+            self.drop_load_tables()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS {cases_table} (
+                line integer PRIMARY KEY,
+                laa_reference bigint,
+                full_name text,
+                date_of_birth date,
+                postcode text,
+                created timestamp with time zone,
+                outcome_code text,
+                outcome_code_date timestamp with time zone,
+                specialist_referred_to text,
+                date_specialist_referred timestamp with time zone,
+                area_of_law text,
+                in_scope boolean,
+                financially_eligible boolean,
+                search_field text
+            );
+            CREATE TABLE IF NOT EXISTS {referrals_table} (
+                line integer PRIMARY KEY,
+                case_id bigint,
+                title text
+            )""".format(
+                cases_table=self.cases_table,
+                referrals_table=self.referrals_table
+            )
+        )
+
+    def drop_load_tables(self):
+        cursor = connection.cursor()
+        cursor.execute('DROP TABLE IF EXISTS %s, %s' % (
+            self.cases_table, self.referrals_table
+        ))
+
+    def get_loaded_lines(self, table):
+        cursor = connection.cursor()
+        cursor.execute('SELECT coalesce(max(line), -1) + 1 FROM %s' % table)
+        return cursor.fetchone()[0]
+
+    def load_file(
+        self, filename, table, columns, record_to_row, batch_size,
+        reader_kwargs=None
+    ):
+        """
+        Writes the rows of the csv file into the load `table`, skipping the
+        ones already there.
+
+        @return: number of rows in the file
+        """
+        start = self.get_loaded_lines(table)
+        if start:
+            self.stderr.write('Resuming after %s rows' % start)
+
+        count = start
         with open(filename, 'rU') as f:
-            reader = csv.DictReader(f)
-            for count, row in enumerate(reader):
-                if count % 20 == 0:
-                    self.stderr.write('.', ending='')
-                self.referrals[row['CaseID']].append(unicode(row['Title'], "ISO-8859-1"))
-
-
-    def load_cases(self, filename):
-
-        def record_to_case_archived(row):
-            full_name = row['FirstName'] + ' ' + row['Surname']
-            case = CaseArchived(
-                full_name=unicode(full_name, "ISO-8859-1"),
-                date_of_birth=parse_dt(row['DateOfBirth']),
-                postcode=unicode(row['PostCode'], "ISO-8859-1"),
-                laa_reference=row['CaseID'],
-                created=parse_dt(row['DateCreated']),
-                outcome_code=unicode(row['OutcomeCode'], "ISO-8859-1"),
-                outcome_code_date=parse_dt(row['OutcomeDate']),
-                specialist_referred_to=unicode(row['SpecialistReferred'], "ISO-8859-1"),
-                date_specialist_referred=parse_dt(row['DateSpecialistClosed']),
-                area_of_law=unicode(row['AreaOfLaw'], "ISO-8859-1"),
-                in_scope=yesno(row['IsInScope']),
-                financially_eligible=bool(row['Eligible']),
-                knowledgebase_items_used=self.get_referrals(row['CaseID'])
+            reader = csv.DictReader(f, **(reader_kwargs or {}))
+            rows = itertools.islice(enumerate(reader), start, None)
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+                self.copy_rows(table, columns, [
+                    (line,) + self.record_to_row(record_to_row, line, record)
+                    for line, record in batch
+                ])
+                count += len(batch)
+                self.stderr.write('.', ending='')
+        return count
+
+    def record_to_row(self, record_to_row, line, record):
+        try:
+            return record_to_row(record)
+        except ValueError as e:
+            raise CommandError('Row %s: %s' % (line + 1, e))
+
+    def copy_rows(self, table, columns, rows):
+        with transaction.atomic():
+            copy_rows(connection.cursor(), table, columns, rows)
+
+    def replace_cases(self):
+        """
+        Replaces the historic cases with the loaded ones, sorted by outcome
+        date latest first, and their referrals.
+        """
+        table = CaseArchived._meta.db_table
+        with transaction.atomic():
+            cursor = connection.cursor()
+            cursor.execute('DELETE FROM %s' % table)
+            cursor.execute("""
+                INSERT INTO {table} (
+                    created, modified, full_name, date_of_birth, postcode,
+                    laa_reference, specialist_referred_to,
+                    date_specialist_referred, knowledgebase_items_used,
+                    area_of_law, in_scope, financially_eligible,
+                    outcome_code, outcome_code_date, search_field
+                )
+                SELECT
+                    coalesce(c.created, now()), now(), c.full_name,
+                    c.date_of_birth, c.postcode, c.laa_reference,
+                    c.specialist_referred_to, c.date_specialist_referred,
+                    r.titles, c.area_of_law, c.in_scope,
+                    c.financially_eligible, c.outcome_code,
+                    c.outcome_code_date, c.search_field
+                FROM {cases_table} c
+                LEFT OUTER JOIN (
+                    SELECT case_id, string_agg(title, E'\\n' ORDER BY line)
+                        AS titles
+                    FROM {referrals_table}
+                    GROUP BY case_id
+                ) r ON r.case_id = c.laa_reference
+                ORDER BY c.outcome_code_date DESC NULLS LAST, c.line""".format(
+                    table=table, cases_table=self.cases_table,
+                    referrals_table=self.referrals_table
+                )
             )
 
-            search_field = []
-            for field in [
-                'full_name',
-                'postcode',
-                'laa_reference',
-                'outcome_code'
-            ]:
-                val = getattr(case, field)
-                if val:
-                    search_field.append(val.upper())
-            case.search_field = ' '.join(search_field)
-
-            return case
-
-        self.cases = []
-        with open(filename, 'rU') as f:
-            reader = csv.DictReader(f, lineterminator='\n')
-            for count, row in enumerate(reader):
-                if count % 20 == 0:
-                    self.stderr.write('.', ending='')
-                self.cases.append(record_to_case_archived(row))
+    def record_to_referral(self, row):
+        return (row['CaseID'], unicode(row['Title'], "ISO-8859-1"))
+
+    def record_to_case_archived(self, row):
+        full_name = unicode(
+            row['FirstName'] + ' ' + row['Surname'], "ISO-8859-1"
+        )
+        postcode = unicode(row['PostCode'], "ISO-8859-1")
+        outcome_code = unicode(row['OutcomeCode'], "ISO-8859-1")
+        date_of_birth = parse_dt(row['DateOfBirth'])
+
+        search_field = ' '.join(
+            val.upper()
+            for val in [full_name, postcode, row['CaseID'], outcome_code]
+            if val
+        )
+
+        return (
+            row['CaseID'],
+            full_name,
+            date_of_birth.date() if date_of_birth else None,
+            postcode,
+            parse_dt(row['DateCreated']),
+            outcome_code,
+            parse_dt(row['OutcomeDate']),
+            unicode(row['SpecialistReferred'], "ISO-8859-1"),
+            parse_dt(row['DateSpecialistClosed']),
+            unicode(row['AreaOfLaw'], "ISO-8859-1"),
+            yesno(row['IsInScope']),
+            bool(row['Eligible']),
+            search_field
+        )
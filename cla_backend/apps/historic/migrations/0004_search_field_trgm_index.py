@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from south.utils import datetime_utils as datetime
+from south.db import db
+from south.v2 import SchemaMigration
+from django.db import models
+
+
+class Migration(SchemaMigration):
+
+    def forwards(self, orm):
+        # trigram index so that LIKE '%term%' searches don't scan the table
+        db.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        db.execute("""
+            CREATE INDEX historic_casearchived_search_field_trgm
+            ON historic_casearchived USING gin (search_field gin_trgm_ops)
+        """)
+
+    def backwards(self, orm):
+        db.execute('DROP INDEX historic_casearchived_search_field_trgm')
+
+    models = {
+        u'historic.casearchived': {
+            'Meta': {'object_name': 'CaseArchived'},
+            'area_of_law': ('django.db.models.fields.TextField', [], {'null': 'True', 'blank': 'True'}),
+            'created': ('model_utils.fields.AutoCreatedField', [], {'default': 'datetime.datetime.now'}),
+            'date_of_birth': ('django.db.models.fields.DateField', [], {'null': 'True', 'blank': 'True'}),
+            'date_specialist_closed': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'blank': 'True'}),
+            'date_specialist_referred': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'blank': 'True'}),
+            'financially_eligible': ('django.db.models.fields.NullBooleanField', [], {'null': 'True', 'blank': 'True'}),
+            'full_name': ('django.db.models.fields.TextField', [], {'null': 'True', 'blank': 'True'}),
+            u'id': ('django.db.models.fields.AutoField', [], {'primary_key': 'True'}),
+            'in_scope': ('django.db.models.fields.NullBooleanField', [], {'null': 'True', 'blank': 'True'}),
+            'knowledgebase_items_used': ('django.db.models.fields.TextField', [], {'null': 'True', 'blank': 'True'}),
+            'laa_reference': ('django.db.models.fields.BigIntegerField', [], {'unique': 'True', 'null': 'True', 'blank': 'True'}),
+            'modified': ('model_utils.fields.AutoLastModifiedField', [], {'default': 'datetime.datetime.now'}),
+            'outcome_code': ('django.db.models.fields.TextField', [], {'null': 'True', 'blank': 'True'}),
+            'outcome_code_date': ('django.db.models.fields.DateTimeField', [], {'null': 'True', 'blank': 'True'}),
+            'postcode': ('django.db.models.fields.CharField', [], {'max_length': '12', 'null': 'True', 'blank': 'True'}),
+            'search_field': ('django.db.models.fields.TextField', [], {'null': 'True', 'blank': 'True'}),
+            'specialist_referred_to': ('django.db.models.fields.TextField', [], {'null': 'True', 'blank': 'True'})
+        }
+    }
+
+    complete_apps = ['historic']
\ No newline at end of file
@@ -1,3 +1,87 @@
+import os
+import shutil
+import tempfile
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from historic.management.commands.load_historic_cases import Command
+from historic.models import CaseArchived
+
+
+CASES_CSV = (
+    'CaseID,FirstName,Surname,DateOfBirth,PostCode,DateCreated,OutcomeCode,'
+    'OutcomeDate,SpecialistReferred,DateSpecialistClosed,AreaOfLaw,'
+    'IsInScope,Eligible\n'
+    '1001,Jo\xe9,Bloggs,01/02/1980,SW1,03/04/2014,CB1,05/04/2014,spec,,'
+    'Debt,Yes,1\n'
+    '1002,Ann,Smith,,,03/04/2014,,,,,Housing,No,\n'
+    '1003,Bob,X,,E1,03/04/2014,MIS,06/04/2014,,07/04/2014,Debt,yes,1\n'
+)
+
+KB_CSV = 'CaseID,Title\n1001,First\n1003,Only\n1001,Second\n'
+
+
+class LoadHistoricCasesTestCase(TestCase):
+    def setUp(self):
+        super(LoadHistoricCasesTestCase, self).setUp()
+        self.dir = tempfile.mkdtemp()
+        self.case_file = self.write_file('cases.csv', CASES_CSV)
+        self.kb_file = self.write_file('kb.csv', KB_CSV)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+        super(LoadHistoricCasesTestCase, self).tearDown()
+
+    def write_file(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def load(self, **options):
+        call_command(
+            'load_historic_cases', case_file=self.case_file,
+            kb_file=self.kb_file, stderr=open(os.devnull, 'w'), **options
+        )
+
+    def test_load(self):
+        CaseArchived.objects.create(laa_reference=1)
+
+        self.load(batch_size=2)
+
+        self.assertEqual(
+            list(CaseArchived.objects.order_by('pk').values_list(
+                'laa_reference', flat=True
+            )),
+            [1003, 1001, 1002]
+        )
+        case = CaseArchived.objects.get(laa_reference=1001)
+        self.assertEqual(case.full_name, u'Jo\xe9 Bloggs')
+        self.assertEqual(case.knowledgebase_items_used, u'First\nSecond')
+        self.assertEqual(case.search_field, u'JO\xc9 BLOGGS SW1 1001 CB1')
+        self.assertEqual(case.date_of_birth.isoformat(), '1980-02-01')
+        self.assertTrue(case.in_scope)
+        self.assertEqual(
+            CaseArchived.objects.get(laa_reference=1002).postcode, u''
+        )
+
+    def test_resume(self):
+        self.load(batch_size=2)
+        # interrupted before replacing the cases, the same rows again
+        # must not be loaded twice
+        command = Command()
+        command.create_load_tables()
+        command.copy_rows(
+            command.referrals_table, command.referral_columns,
+            [(0, 1001, u'First')]
+        )
+
+        self.load(batch_size=2, resume=True)
+
+        self.assertEqual(CaseArchived.objects.count(), 3)
+        self.assertEqual(
+            CaseArchived.objects.get(laa_reference=1001)
+            .knowledgebase_items_used,
+            u'First\nSecond'
+        )
@@ -3,7 +3,6 @@ from cla_common.constants import REQUIRES_ACTION_BY
 from cla_eventlog import event_registry
 from cla_eventlog.constants import LOG_TYPES, LOG_LEVELS, LOG_ROLES
 from cla_eventlog.events import BaseEvent, None_if_owned_by_op_or_op_manager
-from cla_eventlog.models import Log
 
 
 class MeansTestEvent(BaseEvent):
@@ -72,20 +71,14 @@ class CaseEvent(BaseEvent):
     }
 
     def save_log(self, log):
-        to_be_saved = True
-
+        unique_codes = None
         if log.code == 'CASE_VIEWED' and log.timer:
-            # checking that doesn't exist 'created' or 'viewed' log entry
-            # for this timer in the db already do that I don't duplicate
+            # not logging 'viewed' if there's already a 'created' or
+            # 'viewed' log entry for this timer so that I don't duplicate
             # events.
-            # TODO: might be slow, is there a better way?
-            to_be_saved = Log.objects.filter(
-                timer=log.timer, case=log.case, 
-                code__in=['CASE_CREATED', 'CASE_VIEWED']
-            ).count() == 0
+            unique_codes = ['CASE_CREATED', 'CASE_VIEWED']
 
-        if to_be_saved:
-            log.save(force_insert=True)
+        super(CaseEvent, self).save_log(log, unique_codes=unique_codes)
 
     def get_log_code(self, **kwargs):
         status = kwargs['status']
@@ -0,0 +1,492 @@
+import bisect
+import datetime
+import multiprocessing
+import random
+import uuid
+from optparse import make_option
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from cla_eventlog import event_registry
+from cla_eventlog.constants import LOG_TYPES, LOG_LEVELS
+from cla_eventlog.models import Log, CaseLogSummary, PROVIDER_ASSIGN_CODES
+from cla_provider.models import Provider, ProviderAllocation
+from call_centre.models import Operator
+from core.bulk import copy_objects
+from historic.models import CaseArchived
+from legalaid.models import Case, EligibilityCheck, PersonalDetails, \
+    Category, get_case_priority
+from timer.models import Timer
+
+
+FIRST_NAMES = (
+    'Oliver', 'Amelia', 'Jack', 'Olivia', 'Harry', 'Isla', 'Jacob', 'Emily',
+    'Charlie', 'Poppy', 'Thomas', 'Ava', 'George', 'Isabella', 'Oscar',
+    'Jessica', 'James', 'Lily', 'William', 'Sophie', 'Mohammed', 'Grace',
+    'Daniel', 'Mia', 'Joshua', 'Evie', 'Alfie', 'Ruby', 'Samuel', 'Ella',
+)
+SURNAMES = (
+    'Smith', 'Jones', 'Taylor', 'Brown', 'Williams', 'Wilson', 'Johnson',
+    'Davies', 'Robinson', 'Wright', 'Thompson', 'Evans', 'Walker', 'White',
+    'Roberts', 'Green', 'Hall', 'Wood', 'Jackson', 'Clarke', 'Patel',
+    'Khan', 'Lewis', 'Hughes', 'Edwards', 'Turner', 'Hill', 'Moore',
+)
+STREETS = (
+    'High Street', 'Station Road', 'Main Street', 'Park Road', 'Church Road',
+    'Church Street', 'London Road', 'Victoria Road', 'Green Lane',
+    'Manor Road', 'Church Lane', 'Park Avenue', 'The Avenue', 'Queens Road',
+)
+POSTCODE_AREAS = (
+    'B', 'M', 'L', 'LS', 'S', 'BS', 'NG', 'CF', 'SW', 'E', 'N', 'SE', 'NW',
+    'W', 'BD', 'LE', 'CV', 'ST', 'NE', 'SO', 'PL', 'HU', 'DN', 'WV',
+)
+
+# chances of a case being from a client with a previous case, of it
+# having an outcome and of it having been viewed after being created
+REPEAT_CLIENT_RATE = 0.1
+OUTCOME_RATE = 0.85
+VIEWED_RATE = 0.5
+
+ELIGIBILITY_STATES = (('yes', 60), ('no', 25), ('unknown', 15))
+
+# call centre working hours and how busy they are, the busiest first
+HOURS = (11, 10, 12, 14, 13, 15, 9, 16, 17, 18, 19)
+
+# ids allocated to the logs of each case
+LOGS_PER_CASE = 3
+
+
+class WeightedChoice(object):
+    """
+    Picks one of `values` with Zipf weights, the first ones being the most
+    common, or with the given weights if `values` are (value, weight).
+    """
+    def __init__(self, values, weighted=False):
+        if weighted:
+            values, weights = zip(*values) if values else ((), ())
+        else:
+            weights = [1.0 / (index + 1) for index in range(len(values))]
+
+        self.values = list(values)
+        self.cumulative_weights = []
+        total = 0
+        for weight in weights:
+            total += weight
+            self.cumulative_weights.append(total)
+
+    def __call__(self, rng):
+        if not self.values:
+            return None
+        index = bisect.bisect(
+            self.cumulative_weights, rng.random() * self.cumulative_weights[-1]
+        )
+        return self.values[min(index, len(self.values) - 1)]
+
+
+def random_uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4).hex
+
+
+def random_postcode(rng):
+    return '%s%s %s%s%s' % (
+        rng.choice(POSTCODE_AREAS), rng.randint(1, 20), rng.randint(1, 9),
+        rng.choice('ABDEFGHJLNPQRSTUWXYZ'), rng.choice('ABDEFGHJLNPQRSTUWXYZ')
+    )
+
+
+def random_name(rng):
+    return u'%s %s' % (rng.choice(FIRST_NAMES), rng.choice(SURNAMES))
+
+
+def random_date_of_birth(rng, created):
+    return (created - datetime.timedelta(
+        days=int(rng.triangular(18, 90, 40) * 365.25)
+    )).date()
+
+
+class Dataset(object):
+    """
+    What the generated rows are made of, built from the database once and
+    shared by the workers.
+
+    Each chunk of rows is generated with its own random generator seeded
+    from `seed` and the chunk so the same data is generated whatever the
+    number of workers.
+    """
+    CASES, ARCHIVED_CASES = range(2)
+
+    def __init__(self, seed, cases, archived, chunk_size, days, operators):
+        self.seed = seed
+        self.cases = cases
+        self.archived = archived
+        self.chunk_size = chunk_size
+        self.end = timezone.localtime(timezone.now()).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        self.days = days
+        self.operator_ids = operators
+
+        self.choose_hour = WeightedChoice(HOURS)
+        self.choose_eligibility_state = WeightedChoice(
+            ELIGIBILITY_STATES, weighted=True
+        )
+        self.choose_category = WeightedChoice(list(
+            Category.objects.order_by('order').values_list('pk', flat=True)
+        ))
+        self.category_names = dict(Category.objects.values_list('pk', 'name'))
+
+        allocations = {}
+        for category_id, provider_id, weight in \
+                ProviderAllocation.objects.filter(
+                    provider__active=True
+                ).values_list(
+                    'category_id', 'provider_id', 'weighted_distribution'
+                ):
+            allocations.setdefault(category_id, []).append(
+                (provider_id, weight)
+            )
+        self.provider_choices = dict(
+            (category_id, WeightedChoice(weights, weighted=True))
+            for category_id, weights in allocations.items()
+        )
+        self.choose_any_provider = WeightedChoice(list(
+            Provider.objects.active().values_list('pk', flat=True)
+        ))
+
+        codes = event_registry.all()
+        self.created_code = ('CASE_CREATED', codes['CASE_CREATED'])
+        self.viewed_code = ('CASE_VIEWED', codes['CASE_VIEWED'])
+        outcome_codes = sorted(
+            (code, data) for code, data in codes.items()
+            if data['type'] == LOG_TYPES.OUTCOME and
+            data['level'] >= LOG_LEVELS.HIGH
+        )
+        # the most common codes depend on the seed
+        random.Random(seed).shuffle(outcome_codes)
+        self.choose_outcome = WeightedChoice(outcome_codes)
+
+        self.next_ids = dict(
+            (model, self.get_next_id(model))
+            for model in (
+                PersonalDetails, EligibilityCheck, Case, Timer, Log,
+                CaseArchived
+            )
+        )
+        self.next_archived_laa_reference = (
+            CaseArchived.objects.aggregate(
+                Max('laa_reference')
+            )['laa_reference__max'] or 0
+        ) + 1
+
+    def get_next_id(self, model):
+        cursor = connection.cursor()
+        cursor.execute(
+            'SELECT coalesce(max(id), 0) + 1 FROM %s' % model._meta.db_table
+        )
+        return cursor.fetchone()[0]
+
+    def get_rng(self, kind, chunk):
+        return random.Random((self.seed * 2 + kind) * 1000003 + chunk)
+
+    def get_chunks(self, count):
+        return range((count + self.chunk_size - 1) // self.chunk_size)
+
+    def random_datetime(self, rng):
+        day = self.end - datetime.timedelta(days=rng.randint(1, self.days))
+        # fewer contacts at the weekend
+        if day.weekday() >= 5 and rng.random() < 0.7:
+            day -= datetime.timedelta(days=day.weekday() - 4)
+        return day + datetime.timedelta(
+            hours=self.choose_hour(rng), seconds=rng.randint(0, 3599)
+        )
+
+    def choose_provider(self, rng, category_id):
+        choose = self.provider_choices.get(
+            category_id, self.choose_any_provider
+        )
+        return choose(rng)
+
+
+def make_log(log_id, case, timer, code, created):
+    code, code_data = code
+    return Log(
+        id=log_id, created=created, modified=created, case_id=case.pk,
+        timer_id=timer.pk, code=code, type=code_data['type'],
+        level=code_data['level'], created_by_id=timer.created_by_id
+    )
+
+
+def generate_cases(dataset, chunk):
+    """
+    Writes the cases of `chunk` with their personal details, eligibility
+    check, timer and logs.
+    """
+    rng = dataset.get_rng(Dataset.CASES, chunk)
+    start = chunk * dataset.chunk_size
+    end = min(start + dataset.chunk_size, dataset.cases)
+    ids = dataset.next_ids
+
+    personal_details = []
+    eligibility_checks = []
+    cases = []
+    timers = []
+    logs = []
+    for index in range(start, end):
+        created = dataset.random_datetime(rng)
+        duration = datetime.timedelta(minutes=rng.lognormvariate(2, 0.6))
+        operator_id = rng.choice(dataset.operator_ids)
+
+        if personal_details and rng.random() < REPEAT_CLIENT_RATE:
+            client = rng.choice(personal_details)
+            client.case_count += 1
+        else:
+            client = PersonalDetails(
+                id=ids[PersonalDetails] + index, created=created,
+                modified=created, reference=random_uuid(rng),
+                title=rng.choice(('Mr', 'Mrs', 'Ms', 'Miss', '')),
+                full_name=random_name(rng),
+                postcode=random_postcode(rng),
+                street=u'%s %s' % (rng.randint(1, 200), rng.choice(STREETS)),
+                mobile_phone=u'07%09d' % rng.randint(0, 999999999),
+                home_phone=u'', email=u'',
+                date_of_birth=random_date_of_birth(rng, created),
+                case_count=1
+            )
+            personal_details.append(client)
+
+        category_id = dataset.choose_category(rng)
+        has_partner = rng.random() < 0.4
+        eligibility_check = EligibilityCheck(
+            id=ids[EligibilityCheck] + index, created=created,
+            modified=created + duration, reference=random_uuid(rng),
+            category_id=category_id,
+            state=dataset.choose_eligibility_state(rng),
+            dependants_young=rng.choice((0, 0, 0, 1, 1, 2, 3)),
+            dependants_old=rng.choice((0, 0, 0, 0, 1)),
+            on_passported_benefits=rng.random() < 0.3,
+            on_nass_benefits=rng.random() < 0.02,
+            is_you_or_your_partner_over_60=rng.random() < 0.15,
+            has_partner=has_partner
+        )
+        eligibility_checks.append(eligibility_check)
+
+        case_id = ids[Case] + index
+        case = Case(
+            id=case_id, created=created, modified=created + duration,
+            reference=u'%s-%04d-%04d' % (
+                rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') +
+                rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ'),
+                case_id // 10000 % 10000, case_id % 10000
+            ),
+            laa_reference=case_id + settings.LAA_REFERENCE_SEED,
+            eligibility_check_id=eligibility_check.pk,
+            personal_details=client, created_by_id=operator_id,
+            billable_time=int(duration.total_seconds())
+        )
+        cases.append(case)
+
+        timer = Timer(
+            id=ids[Timer] + index, created=created,
+            modified=created + duration, created_by_id=operator_id,
+            stopped=created + duration, linked_case_id=case_id
+        )
+        timers.append(timer)
+
+        log_id = ids[Log] + index * LOGS_PER_CASE
+        logs.append(make_log(
+            log_id, case, timer, dataset.created_code, created
+        ))
+        if rng.random() < VIEWED_RATE:
+            logs.append(make_log(
+                log_id + 1, case, timer, dataset.viewed_code,
+                created + duration / 2
+            ))
+        outcome_code = dataset.choose_outcome(rng)
+        if outcome_code and rng.random() < OUTCOME_RATE:
+            outcome = make_log(
+                log_id + 2, case, timer, outcome_code, created + duration
+            )
+            logs.append(outcome)
+            case.outcome_code = outcome.code
+            case.outcome_code_id = outcome.pk
+            case.level = outcome.level
+            if outcome.code in PROVIDER_ASSIGN_CODES:
+                case.provider_id = dataset.choose_provider(rng, category_id)
+
+        case.search_field = case.get_search_field()
+        case.priority = get_case_priority(case.outcome_code)
+
+    with transaction.atomic():
+        copy_objects(PersonalDetails, personal_details)
+        copy_objects(EligibilityCheck, eligibility_checks)
+        copy_objects(Case, cases)
+        copy_objects(Timer, timers)
+        copy_objects(Log, logs)
+    return len(cases)
+
+
+def generate_archived_cases(dataset, chunk):
+    rng = dataset.get_rng(Dataset.ARCHIVED_CASES, chunk)
+    start = chunk * dataset.chunk_size
+    end = min(start + dataset.chunk_size, dataset.archived)
+
+    archived_cases = []
+    for index in range(start, end):
+        created = dataset.random_datetime(rng) - datetime.timedelta(
+            days=dataset.days
+        )
+        full_name = random_name(rng)
+        postcode = random_postcode(rng)
+        laa_reference = dataset.next_archived_laa_reference + index
+        outcome_code = (dataset.choose_outcome(rng) or ('', None))[0]
+        category_id = dataset.choose_category(rng)
+        archived_cases.append(CaseArchived(
+            id=dataset.next_ids[CaseArchived] + index, created=created,
+            modified=created, full_name=full_name,
+            date_of_birth=random_date_of_birth(rng, created),
+            postcode=postcode, laa_reference=laa_reference,
+            area_of_law=dataset.category_names.get(category_id),
+            in_scope=rng.random() < 0.8,
+            financially_eligible=rng.random() < 0.6,
+            outcome_code=outcome_code,
+            outcome_code_date=created + datetime.timedelta(
+                minutes=rng.lognormvariate(2, 0.6)
+            ),
+            search_field=u' '.join(
+                value.upper() for value in [
+                    full_name, postcode, unicode(laa_reference), outcome_code
+                ] if value
+            )
+        ))
+
+    with transaction.atomic():
+        copy_objects(CaseArchived, archived_cases)
+    return len(archived_cases)
+
+
+# set in the parent before the workers are forked
+_dataset = None
+
+
+def run_chunk(args):
+    generate, chunk = args
+    return generate(_dataset, chunk)
+
+
+class Command(BaseCommand):
+    """
+    The rows are generated in chunks of --chunk_size, each written with
+    COPY in its own transaction by one of the --workers processes. Primary
+    keys are allocated upfront so that the chunks don't depend on each
+    other.
+    """
+
+    option_list = BaseCommand.option_list + (
+        make_option('-c', '--cases',
+                    dest='cases', type='int', default=100000,
+                    help='number of cases to generate, each with its '
+                         'eligibility check, timer and logs'
+        ),
+        make_option('-a', '--archived',
+                    dest='archived', type='int', default=100000,
+                    help='number of archived cases to generate'
+        ),
+        make_option('-s', '--seed',
+                    dest='seed', type='int', default=0,
+                    help='seed of the random data, the same seed and '
+                         'options generate the same data'
+        ),
+        make_option('-d', '--days',
+                    dest='days', type='int', default=365,
+                    help='number of days up to today the cases are spread '
+                         'over'
+        ),
+        make_option('-w', '--workers',
+                    dest='workers', type='int',
+                    default=multiprocessing.cpu_count(),
+                    help='number of processes writing the data'
+        ),
+        make_option('--chunk_size',
+                    dest='chunk_size', type='int', default=5000,
+                    help='number of rows generated and written at a time'
+        ),
+        make_option('--operators',
+                    dest='operators', type='int', default=20,
+                    help='number of operators created if there are none'
+        ),
+    )
+
+    help = ('Generates a large reproducible set of synthetic cases for '
+            'load testing')
+
+    def handle(self, *args, **options):
+        global _dataset
+
+        if not Category.objects.exists():
+            raise CommandError(
+                'No categories, load the initial_category fixture first'
+            )
+
+        _dataset = Dataset(
+            options['seed'], options['cases'], options['archived'],
+            options['chunk_size'], options['days'],
+            self.get_operators(options['operators'])
+        )
+
+        # the workers can't share the connection
+        connection.close()
+        pool = multiprocessing.Pool(options['workers'])
+        try:
+            self.generate(pool, generate_cases, _dataset.cases, 'cases')
+            self.generate(
+                pool, generate_archived_cases, _dataset.archived,
+                'archived cases'
+            )
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+        self.stderr.write('Updating sequences')
+        self.reset_sequences()
+
+        self.stderr.write('Rebuilding case log summaries')
+        CaseLogSummary.objects.rebuild()
+
+    def generate(self, pool, generate, count, name):
+        self.stderr.write('Generating %s %s' % (count, name))
+        total = 0
+        chunks = [(generate, chunk) for chunk in _dataset.get_chunks(count)]
+        for written in pool.imap_unordered(run_chunk, chunks):
+            total += written
+            self.stderr.write('%s/%s' % (total, count))
+
+    def get_operators(self, count):
+        operator_ids = list(
+            Operator.objects.order_by('user').values_list('user', flat=True)
+        )
+        if operator_ids:
+            return operator_ids
+
+        for index in range(count):
+            user = User.objects.create_user(
+                'synthetic_operator_%s' % index,
+                'synthetic_operator_%s@example.com' % index
+            )
+            Operator.objects.create(user=user)
+            operator_ids.append(user.pk)
+        return operator_ids
+
+    def reset_sequences(self):
+        cursor = connection.cursor()
+        for model in _dataset.next_ids:
+            table = model._meta.db_table
+            cursor.execute(
+                "SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+                "coalesce(max(id), 1)) FROM " + table, [table]
+            )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from legalaid.models import PersonalDetails
+
+
+class Command(BaseCommand):
+
+    help = ('Sets the case count of all personal details to their number of '
+            'cases. Counts are kept up to date as cases are saved so this is '
+            'only needed to fix the ones that got out of sync')
+
+    def handle(self, *args, **options):
+        count = PersonalDetails.objects.reconcile_case_counts()
+        self.stdout.write('%s personal details fixed' % count)
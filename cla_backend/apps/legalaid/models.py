@@ -1,24 +1,31 @@
+import hashlib
+import json
 import logging
 import datetime
+from collections import defaultdict
 
 from jsonfield import JSONField
 
 from uuidfield import UUIDField
 from django.core.validators import MaxValueValidator
-from django.db import models
-from django.db.models import SET_NULL
+from django.db import models, transaction, connection, IntegrityError
+from django.db.models import SET_NULL, F
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils.timezone import utc
+from django.utils.crypto import get_random_string
 from django.core.exceptions import ObjectDoesNotExist
 
 from model_utils.models import TimeStampedModel
 
 from core.utils import getattrd
-from core.cloning import clone_model, CloneModelMixin
+from core.cloning import bulk_clone_model, clone_objects, \
+    CloneModelMixin, reserve_pks
 
 from eligibility_calculator.models import CaseData
 from eligibility_calculator.calculator import EligibilityChecker
 from eligibility_calculator.exceptions import PropertyExpectedException
+from eligibility_calculator.rules import get_rules
 
 from diagnosis.models import DiagnosisTraversal
 
@@ -100,6 +107,40 @@ class Deductions(CloneModelMixin, TimeStampedModel):
     }
 
 
+class PersonalDetailsManager(models.Manager):
+    def add_to_case_count(self, pk, count):
+        """
+        Adds `count` (can be negative) to the case count of the personal
+        details `pk` in the db without reading it first.
+        """
+        qs = self.get_queryset().filter(pk=pk)
+        if count < 0:
+            qs = qs.filter(case_count__gte=-count)
+        qs.update(case_count=F('case_count') + count)
+
+    def reconcile_case_counts(self):
+        """
+        Sets the case count of all the personal details to their number of
+        cases, fixing the ones that got out of sync.
+
+        :return: number of personal details fixed
+        """
+        cursor = connection.cursor()
+        cursor.execute("""
+            UPDATE legalaid_personaldetails AS pd
+            SET case_count = counts.case_count
+            FROM (
+                SELECT pd.id, count(c.id) AS case_count
+                FROM legalaid_personaldetails AS pd
+                    LEFT OUTER JOIN legalaid_case AS c
+                        ON c.personal_details_id = pd.id
+                GROUP BY pd.id
+            ) AS counts
+            WHERE counts.id = pd.id AND counts.case_count != pd.case_count
+        """)
+        return cursor.rowcount
+
+
 class PersonalDetails(CloneModelMixin, TimeStampedModel):
     title = models.CharField(max_length=20, blank=True, null=True)
     full_name = models.CharField(max_length=400, blank=True, null=True)
@@ -134,16 +175,23 @@ class PersonalDetails(CloneModelMixin, TimeStampedModel):
         'excludes': ['reference', 'created', 'modified', 'case_count']
     }
 
+    objects = PersonalDetailsManager()
+
     class Meta:
         verbose_name_plural = "personal details"
 
-    def update_case_count(self):
-        case_count = self.case_set.count()
-
-        # avoiding an extra save if possible
-        if case_count != self.case_count:
-            self.case_count = case_count
-            self.save(update_fields=['case_count'])
+    def save(self, *args, **kwargs):
+        created = not self.pk
+        super(PersonalDetails, self).save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        if not created and (
+            update_fields is None or
+            set(update_fields) & set(PERSONAL_DETAILS_SEARCH_FIELDS)
+        ):
+            update_case_search_field(
+                'c.personal_details_id = %s', [self.pk]
+            )
 
 
 class ThirdPartyDetails(CloneModelMixin, TimeStampedModel):
@@ -246,6 +294,40 @@ class ValidateModelMixin(models.Model):
         return {"warnings": warnings}
 
 
+# bump to recalculate the state of all the checks on their next update
+ELIGIBILITY_INPUTS_FINGERPRINT_VERSION = 1
+
+ELIGIBILITY_INPUTS_RELATED = (
+    'category', 'disputed_savings',
+    'you__income', 'you__savings', 'you__deductions',
+    'partner__income', 'partner__savings', 'partner__deductions',
+)
+
+PROPERTY_DATA_FIELDS = ('value', 'mortgage_left', 'share', 'disputed', 'main')
+
+# properties of the check as a json array so that they can be fetched
+# together with the check
+PROPERTY_DATA_SQL = """
+    SELECT array_to_json(array_agg(row_to_json(p)))
+    FROM (
+        SELECT %s FROM legalaid_property
+        WHERE eligibility_check_id = legalaid_eligibilitycheck.id
+        ORDER BY id
+    ) AS p
+""" % ', '.join(PROPERTY_DATA_FIELDS)
+
+
+class EligibilityCheckManager(models.Manager):
+    def with_inputs(self):
+        """
+        @return: queryset fetching the checks together with everything
+                 `to_case_data` needs in one query.
+        """
+        return self.get_queryset().select_related(
+            *ELIGIBILITY_INPUTS_RELATED
+        ).extra(select={'loaded_property_data': PROPERTY_DATA_SQL})
+
+
 class EligibilityCheck(TimeStampedModel, ValidateModelMixin, ModelDiffMixin):
     reference = UUIDField(auto=True, unique=True)
 
@@ -278,6 +360,13 @@ class EligibilityCheck(TimeStampedModel, ValidateModelMixin, ModelDiffMixin):
 
     calculations = JSONField(null=True, blank=True)
 
+    # fingerprint of the calculator inputs `state` was calculated from
+    inputs_fingerprint = models.CharField(
+        max_length=40, blank=True, null=True, editable=False
+    )
+
+    objects = EligibilityCheckManager()
+
     def get_dependencies(self):
         deps = {'category',
                 'you__income',
@@ -293,14 +382,14 @@ class EligibilityCheck(TimeStampedModel, ValidateModelMixin, ModelDiffMixin):
 
         return deps
 
-    def get_eligibility_state(self):
+    def get_eligibility_state(self, case_data_dict=None, rules=None):
         """
         Returns one of the ELIGIBILITY_STATES values depending on if the model
         is eligible or not. If PropertyExpectedException is raised, it means
         that we don't have enough data to determine the state so we set the
         `state` property to UNKNOWN.
         """
-        ec = EligibilityChecker(self.to_case_data())
+        ec = EligibilityChecker(self.to_case_data(case_data_dict), rules=rules)
 
         try:
             if ec.is_eligible():
@@ -312,22 +401,59 @@ class EligibilityCheck(TimeStampedModel, ValidateModelMixin, ModelDiffMixin):
 
             # TODO what do we do when we get a different exception? (which shouldn't happen)
 
-    def update_state(self):
-        self.state, checker = self.get_eligibility_state()
+    def get_inputs_fingerprint(self, case_data_dict, rules):
+        return hashlib.sha1(json.dumps(
+            [
+                ELIGIBILITY_INPUTS_FINGERPRINT_VERSION,
+                rules.effective_from, case_data_dict
+            ],
+            sort_keys=True, cls=DjangoJSONEncoder
+        )).hexdigest()
+
+    def update_state(self, force=False):
+        """
+        Recalculates and saves `state` and `calculations` unless the
+        calculator inputs, or the eligibility rules in force, haven't
+        changed since the last calculation.
+
+        The inputs are loaded from the db with one query so the check and
+        its related objects need to be saved first.
+
+        @return: True if the state has been recalculated
+        """
+        if self.pk:
+            inputs = EligibilityCheck.objects.with_inputs().get(pk=self.pk)
+        else:
+            inputs = self
+        case_data_dict = inputs.get_case_data_dict()
+        rules = get_rules()
+        fingerprint = self.get_inputs_fingerprint(case_data_dict, rules)
+
+        if not force and fingerprint == self.inputs_fingerprint:
+            return False
+
+        self.state, checker = self.get_eligibility_state(case_data_dict, rules)
 
         if self.state == ELIGIBILITY_STATES.UNKNOWN:
             self.calculations = None
         else:
             self.calculations = checker.calcs
+        self.inputs_fingerprint = fingerprint
 
         self.save()
+        return True
 
     def has_stated_any_specific_benefits(self):
         if not self.specific_benefits:
             return False
         return any(self.specific_benefits.values())
 
-    def to_case_data(self):
+    def to_case_data(self, case_data_dict=None):
+        if case_data_dict is None:
+            case_data_dict = self.get_case_data_dict()
+        return CaseData(**case_data_dict)
+
+    def get_case_data_dict(self):
         def compose_dict(model=self, props=None):
             if not props: props = []
             if not model: return None
@@ -346,9 +472,15 @@ class EligibilityCheck(TimeStampedModel, ValidateModelMixin, ModelDiffMixin):
         if self.category:
             d['category'] = self.category.code
 
-        d['property_data'] = self.property_set.values(
-            'value', 'mortgage_left', 'share', 'disputed', 'main'
-        )
+        if hasattr(self, 'loaded_property_data'):
+            property_data = self.loaded_property_data or []
+            if isinstance(property_data, basestring):
+                property_data = json.loads(property_data)
+            d['property_data'] = property_data
+        else:
+            d['property_data'] = list(self.property_set.order_by(
+                'pk'
+            ).values(*PROPERTY_DATA_FIELDS))
 
         d['facts'] = compose_dict(props=[
             'dependants_old', 'dependants_young', 'has_partner',
@@ -418,7 +550,7 @@ class EligibilityCheck(TimeStampedModel, ValidateModelMixin, ModelDiffMixin):
         # Fake
         d['facts']['is_partner_opponent'] = False
 
-        return CaseData(**d)
+        return d
 
     def reset_matter_types(self):
         case = None
@@ -476,6 +608,136 @@ class MediaCode(TimeStampedModel):
     code = models.CharField(max_length=20)
 
 
+PERSONAL_DETAILS_SEARCH_FIELDS = ('full_name', 'postcode', 'street')
+CASE_SEARCH_FIELDS = ('reference', 'laa_reference')
+
+# same as Case.get_search_field for case `c` and its personal details `pd`
+CASE_SEARCH_FIELD_SQL = "upper(concat_ws(' ', %s, %s))" % (
+    ', '.join('pd.%s' % field for field in PERSONAL_DETAILS_SEARCH_FIELDS),
+    ', '.join('c.%s::text' % field for field in CASE_SEARCH_FIELDS)
+)
+
+
+# dashboard priority of the cases with these outcome codes, it's 1 for the
+# cases with any other outcome code and 0 for the ones without outcome code
+CASE_OUTCOME_PRIORITIES = {
+    'REF-EXT': 8,
+    'IRCB': 7,
+    'MIS': 6,
+    'COI': 5,
+    'CB1': 4,
+    'CB2': 3,
+    'CB3': 2,
+}
+
+
+def get_case_priority(outcome_code):
+    if outcome_code is None:
+        return 0
+    return CASE_OUTCOME_PRIORITIES.get(outcome_code, 1)
+
+
+# times a new case reference is generated when it's already taken
+CASE_REFERENCE_ATTEMPTS = 5
+
+CASE_REFERENCE_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+
+
+def generate_case_reference():
+    return u'%s-%s-%s' % (
+        get_random_string(length=2, allowed_chars=CASE_REFERENCE_CHARS),
+        get_random_string(length=4, allowed_chars='0123456789'),
+        get_random_string(length=4, allowed_chars='0123456789')
+    )
+
+
+def update_case_search_field(where, params=None):
+    """
+    Recomputes the search field of the cases `c` matching the `where`
+    clause in a single query.
+    """
+    cursor = connection.cursor()
+    cursor.execute("""
+        UPDATE legalaid_case AS c SET search_field = %s
+        FROM legalaid_case AS c2
+            LEFT OUTER JOIN legalaid_personaldetails AS pd
+                ON pd.id = c2.personal_details_id
+        WHERE c2.id = c.id AND %s
+    """ % (CASE_SEARCH_FIELD_SQL, where), params)
+    return cursor.rowcount
+
+
+class CaseManager(models.Manager):
+    def bulk_create_cases(self, cases):
+        """
+        Inserts the new `cases` with a single query (e.g. for imports),
+        setting their references and derived fields like `Case.save`
+        does and updating the case count of their personal details.
+
+        The personal details of the cases should be set as instances,
+        they're read for the search field.
+
+        :return: `cases`, saved
+        """
+        cases = list(cases)
+        if not cases:
+            return cases
+
+        generated = [case for case in cases if not case.reference]
+        given_references = [case.reference for case in cases if case.reference]
+        for case, pk in zip(cases, reserve_pks(self.model, len(cases))):
+            case.pk = pk
+            case._set_laa_reference()
+            case.priority = get_case_priority(case.outcome_code)
+
+        for attempt in range(CASE_REFERENCE_ATTEMPTS):
+            self._set_unique_references(generated, given_references)
+            for case in cases:
+                case.search_field = case.get_search_field()
+            try:
+                with transaction.atomic():
+                    self.bulk_create(cases)
+                break
+            except IntegrityError:
+                # taken by a case created in the meantime
+                if not generated or attempt == CASE_REFERENCE_ATTEMPTS - 1:
+                    raise
+
+        case_counts = defaultdict(int)
+        for case in cases:
+            case._state.adding = False
+            case._counted_personal_details_id = case.personal_details_id
+            if case.personal_details_id:
+                case_counts[case.personal_details_id] += 1
+        for pk, count in case_counts.items():
+            PersonalDetails.objects.add_to_case_count(pk, count)
+        return cases
+
+    def _set_unique_references(self, cases, reserved=()):
+        """
+        Generates new references for `cases` until none of them is
+        already taken, by a case in the db, in `cases` or in `reserved`.
+        """
+        for case in cases:
+            case.reference = generate_case_reference()
+
+        while cases:
+            references = [case.reference for case in cases]
+            taken = set(self.get_queryset().filter(
+                reference__in=references
+            ).values_list('reference', flat=True))
+            taken.update(reserved)
+
+            clashing = []
+            for case in cases:
+                if case.reference in taken:
+                    clashing.append(case)
+                taken.add(case.reference)
+            for case in clashing:
+                case.reference = generate_case_reference()
+            cases = clashing
+
+
 class Case(TimeStampedModel, ModelDiffMixin):
     reference = models.CharField(max_length=128, unique=True, editable=False)
     eligibility_check = models.OneToOneField(EligibilityCheck, null=True,
@@ -557,17 +819,40 @@ class Case(TimeStampedModel, ModelDiffMixin):
         max_length=20, choices=CASE_SOURCE, default=CASE_SOURCE.PHONE
     )
 
+    # upper case personal details and references, has a trigram index
+    # so that searches (see CaseSearchFilter) don't scan the whole table
+    search_field = models.TextField(blank=True, null=True, editable=False)
+
+    # dashboard ordering, derived from outcome_code (see get_case_priority)
+    # and indexed together with the dashboard filter
+    priority = models.PositiveSmallIntegerField(default=0, editable=False)
+
+    objects = CaseManager()
+
+    def __init__(self, *args, **kwargs):
+        super(Case, self).__init__(*args, **kwargs)
+        # the personal details this case is counted in, see
+        # _update_case_count (not loading it if deferred)
+        self._counted_personal_details_id = self.__dict__.get(
+            'personal_details_id'
+        )
+
     def _set_reference_if_necessary(self):
+        """
+        :return: True if a new reference has been generated
+        """
         if not self.reference:
-            # TODO make it better
-            from django.utils.crypto import get_random_string
-
-            self.reference = u'%s-%s-%s' % (
-                get_random_string(length=2,
-                                  allowed_chars='ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'),
-                get_random_string(length=4, allowed_chars='0123456789'),
-                get_random_string(length=4, allowed_chars='0123456789')
-            )
+            self.reference = generate_case_reference()
+            return True
+        return False
+
+    def _set_laa_reference(self):
+        # derived from the id, which is taken from the sequence before the
+        # insert so that the case is created with a single query
+        if not self.pk:
+            self.pk, = reserve_pks(self.__class__, 1)
+        if self.laa_reference is None:
+            self.laa_reference = self.pk + settings.LAA_REFERENCE_SEED
 
     def is_part_of_split(self):
         """
@@ -575,14 +860,15 @@ class Case(TimeStampedModel, ModelDiffMixin):
         """
         return self.from_case or self.split_cases.count() > 0
 
+    @transaction.atomic
     def split(self, user, category, matter_type1, matter_type2, assignment_internal):
         # DIAGNOSIS
         diagnosis = DiagnosisTraversal.objects.create_eligible(category)
 
         # ELIGIBILITY CHECK
-        eligibility_check = clone_model(
+        eligibility_check = bulk_clone_model(
             cls=EligibilityCheck,
-            pk=self.eligibility_check_id,
+            pks=[self.eligibility_check_id],
             config={
                 'excludes': ['reference', 'created', 'modified'],
                 'clone_fks': ['you', 'partner', 'disputed_savings'],
@@ -590,16 +876,20 @@ class Case(TimeStampedModel, ModelDiffMixin):
                     'category': category
                 }
             }
-        )
-        if self.eligibility_check:
-            prop_ids = self.eligibility_check.property_set.values_list('pk', flat=True)
-            for prop_id in prop_ids:
-                clone_model(cls=Property, pk=prop_id, config={
+        ).get(self.eligibility_check_id)
+        if eligibility_check:
+            clone_objects(
+                cls=Property,
+                objs=list(Property.objects.filter(
+                    eligibility_check_id=self.eligibility_check_id
+                )),
+                config={
                     'excludes': ['created', 'modified'],
                     'override_values': {
                         'eligibility_check': eligibility_check
                     }
-                })
+                }
+            )
 
         # CASE
         override_values = {
@@ -619,44 +909,143 @@ class Case(TimeStampedModel, ModelDiffMixin):
             override_values['provider'] = None
             override_values['requires_action_by'] = REQUIRES_ACTION_BY.OPERATOR
 
-        new_case = clone_model(
+        # saved on its own as Case.save sets the references
+        new_case, = clone_objects(
             cls=self.__class__,
-            pk=self.pk,
+            objs=[self.__class__.objects.get(pk=self.pk)],
             config={
                 'excludes': [
                     'reference', 'locked_by', 'locked_at',
                     'laa_reference', 'billable_time', 'outcome_code', 'level',
                     'created', 'modified', 'outcome_code_id', 'requires_action_at',
-                    'callback_attempt'
+                    'callback_attempt', 'search_field', 'priority'
                 ],
                 'clone_fks': [
                     'thirdparty_details', 'adaptation_details'
                 ],
                 'override_values': override_values
-            }
+            },
+            save=True
         )
-        for cka_id in self.caseknowledgebaseassignment_set.values_list('pk', flat=True):
-            clone_model(cls=CaseKnowledgebaseAssignment, pk=cka_id, config={
+        clone_objects(
+            cls=CaseKnowledgebaseAssignment,
+            objs=list(self.caseknowledgebaseassignment_set.all()),
+            config={
                 'override_values': {
                     'case': new_case
                 }
-            })
+            }
+        )
         return new_case
 
-    def save(self, *args, **kwargs):
-        self._set_reference_if_necessary()
+    def get_search_field(self):
+        values = [self.reference, self.laa_reference]
+        if self.personal_details:
+            values = [
+                getattr(self.personal_details, field)
+                for field in PERSONAL_DETAILS_SEARCH_FIELDS
+            ] + values
+        return u' '.join(
+            unicode(value) for value in values if value is not None
+        ).upper()
+
+    def _set_search_field(self, save_kwargs):
+        update_fields = save_kwargs.get('update_fields')
+        if update_fields is not None:
+            search_fields = set(CASE_SEARCH_FIELDS) | set([
+                'personal_details', 'personal_details_id'
+            ])
+            if not set(update_fields) & search_fields:
+                return
+            save_kwargs['update_fields'] = list(
+                set(update_fields) | set(['search_field'])
+            )
 
-        if not self.pk:
-            super(Case, self).save(*args, **kwargs)
-            self.laa_reference = self.pk + settings.LAA_REFERENCE_SEED
-            kwargs['force_insert'] = False
-            self.save(*args, **kwargs)
+        self.search_field = self.get_search_field()
+
+    def _set_priority(self, save_kwargs):
+        update_fields = save_kwargs.get('update_fields')
+        if update_fields is not None:
+            if 'outcome_code' not in update_fields:
+                return
+            save_kwargs['update_fields'] = list(
+                set(update_fields) | set(['priority'])
+            )
+
+        self.priority = get_case_priority(self.outcome_code)
+
+    def _update_case_count(self, save_kwargs):
+        """
+        Moves this case from the case count of the personal details it was
+        counted in to the ones it's now linked to, only if they've changed.
+        """
+        update_fields = save_kwargs.get('update_fields')
+        if update_fields is not None and not set(update_fields) & set([
+            'personal_details', 'personal_details_id'
+        ]):
+            return
+
+        counted_id = self._counted_personal_details_id
+        if counted_id == self.personal_details_id:
+            return
+
+        if counted_id:
+            PersonalDetails.objects.add_to_case_count(counted_id, -1)
+        if self.personal_details_id:
+            PersonalDetails.objects.add_to_case_count(
+                self.personal_details_id, 1
+            )
+            # keeping the instance in sync too
+            personal_details = getattr(
+                self, self._meta.get_field('personal_details').get_cache_name(),
+                None
+            )
+            if personal_details is not None:
+                personal_details.case_count += 1
+        self._counted_personal_details_id = self.personal_details_id
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            # not in any case count until it's inserted
+            self._counted_personal_details_id = None
+            if not self.pk:
+                # the id is new so there's nothing to update
+                kwargs['force_insert'] = True
+            self._set_laa_reference()
+        generated_reference = self._set_reference_if_necessary()
+        self._set_search_field(kwargs)
+        self._set_priority(kwargs)
+
+        if generated_reference:
+            self._save_with_unique_reference(*args, **kwargs)
         else:
             super(Case, self).save(*args, **kwargs)
+        self._update_case_count(kwargs)
 
-        # updating personal_details case count
-        if self.personal_details:
-            self.personal_details.update_case_count()
+    def _save_with_unique_reference(self, *args, **kwargs):
+        """
+        Saves the case with a new reference if its generated one turns out
+        to be already taken.
+        """
+        for attempt in range(CASE_REFERENCE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return super(Case, self).save(*args, **kwargs)
+            except IntegrityError:
+                if attempt == CASE_REFERENCE_ATTEMPTS - 1 or \
+                        not Case.objects.filter(
+                            reference=self.reference
+                        ).exists():
+                    raise
+                self.reference = generate_case_reference()
+                self._set_search_field(kwargs)
+
+    def delete(self, *args, **kwargs):
+        super(Case, self).delete(*args, **kwargs)
+        if self._counted_personal_details_id:
+            PersonalDetails.objects.add_to_case_count(
+                self._counted_personal_details_id, -1
+            )
 
     def assign_to_provider(self, provider):
         self.provider = provider
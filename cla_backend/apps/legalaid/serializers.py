@@ -59,13 +59,11 @@ class FeedbackSerializerBase(serializers.ModelSerializer):
 
 class CSVUploadSerializerBase(serializers.ModelSerializer):
 
-    rows = serializers.SerializerMethodField('get_rows')
+    rows = serializers.IntegerField(read_only=True, source='row_count')
     provider = serializers.CharField(read_only=True, source='provider.name')
     created_by = serializers.CharField(read_only=True, source='created_by.user.username')
     body = JSONField()
-
-    def get_rows(self, obj):
-        return len(obj.body)
+    summary = JSONField(read_only=True)
 
     def validate_month(self, attrs, source):
         value = attrs[source]
@@ -76,7 +74,14 @@ class CSVUploadSerializerBase(serializers.ModelSerializer):
         value = attrs[source]
         if len(value) == 0:
             raise serializers.ValidationError('No rows found.')
-        ProviderCSVValidator(value).validate()
+
+        validator = ProviderCSVValidator(value)
+        errors = validator.validate_all()
+        if errors:
+            raise serializers.ValidationError(
+                [error['message'] for error in errors]
+            )
+        attrs['summary'] = validator.summary
 
         return attrs
 
@@ -0,0 +1,70 @@
+from django.test import TestCase
+
+from core.tests.mommy_utils import make_recipe
+from cla_eventlog.models import Log
+from historic.models import CaseArchived
+from legalaid.management.commands.generate_synthetic_data import Dataset, \
+    generate_cases, generate_archived_cases
+from legalaid.models import Case, EligibilityCheck, PersonalDetails
+from timer.models import Timer
+
+
+class GenerateSyntheticDataTestCase(TestCase):
+    def setUp(self):
+        super(GenerateSyntheticDataTestCase, self).setUp()
+        make_recipe('legalaid.category', _quantity=3)
+        self.operator = make_recipe('call_centre.operator')
+
+    def get_dataset(self):
+        return Dataset(
+            seed=1, cases=25, archived=15, chunk_size=10, days=30,
+            operators=[self.operator.user_id]
+        )
+
+    def generate_cases(self, chunks):
+        dataset = self.get_dataset()
+        for chunk in chunks:
+            generate_cases(dataset, chunk)
+        return list(Case.objects.order_by('pk').values_list(
+            'pk', 'reference', 'outcome_code', 'personal_details__full_name',
+            'eligibility_check__category'
+        ))
+
+    def test_cases_generated(self):
+        self.generate_cases(self.get_dataset().get_chunks(25))
+
+        self.assertEqual(Case.objects.count(), 25)
+        self.assertEqual(EligibilityCheck.objects.count(), 25)
+        self.assertEqual(Timer.objects.count(), 25)
+        self.assertEqual(
+            Log.objects.filter(code='CASE_CREATED').count(), 25
+        )
+        self.assertEqual(
+            sum(PersonalDetails.objects.values_list('case_count', flat=True)),
+            25
+        )
+        for case in Case.objects.all():
+            self.assertEqual(case.search_field, case.get_search_field())
+            if case.outcome_code:
+                self.assertEqual(
+                    Log.objects.get(pk=case.outcome_code_id).code,
+                    case.outcome_code
+                )
+
+    def test_same_data_whatever_the_order_of_chunks(self):
+        cases = self.generate_cases([0, 1, 2])
+
+        for model in (Log, Timer, Case, EligibilityCheck, PersonalDetails):
+            model.objects.all().delete()
+
+        self.assertEqual(self.generate_cases([2, 0, 1]), cases)
+
+    def test_archived_cases_generated(self):
+        dataset = self.get_dataset()
+        for chunk in dataset.get_chunks(15):
+            generate_archived_cases(dataset, chunk)
+
+        self.assertEqual(CaseArchived.objects.count(), 15)
+        self.assertEqual(
+            CaseArchived.objects.filter(search_field__isnull=True).count(), 0
+        )
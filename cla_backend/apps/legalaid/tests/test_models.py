@@ -4,7 +4,8 @@ import random
 
 from django.conf import settings
 from django.test import TestCase
-from django.db import models
+from django.db import models, connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from eligibility_calculator.models import CaseData, ModelMixin
@@ -16,8 +17,11 @@ from cla_common.constants import ELIGIBILITY_STATES, CONTACT_SAFETY, \
     CASE_SOURCE
 from cla_common.money_interval.models import MoneyInterval
 
+from core.cloning import bulk_clone_model
 from core.tests.mommy_utils import make_recipe, make_user
 
+from cla_eventlog.constants import LOG_TYPES, LOG_LEVELS
+
 from legalaid.models import Savings, Income, Deductions, PersonalDetails, \
     ThirdPartyDetails, AdaptationDetails, Person, Case, ValidateModelMixin, \
     EligibilityCheck, Property, CaseKnowledgebaseAssignment
@@ -587,17 +591,83 @@ class EligibilityCheckTestCase(TestCase):
         self.assertEqual(check.state, ELIGIBILITY_STATES.UNKNOWN)
 
         # 2. True => YES
-        check.update_state()
+        check.update_state(force=True)
         self.assertEqual(check.state, ELIGIBILITY_STATES.YES)
 
         # 3. False => NO
-        check.update_state()
+        check.update_state(force=True)
         self.assertEqual(check.state, ELIGIBILITY_STATES.NO)
 
         # 4. PropertyExpectedException => UNKNOWN
-        check.update_state()
+        check.update_state(force=True)
         self.assertEqual(check.state, ELIGIBILITY_STATES.UNKNOWN)
 
+    def _make_full_check(self):
+        check = make_recipe('legalaid.eligibility_check',
+            category=make_recipe('legalaid.category', code='code'),
+            you=make_recipe('legalaid.full_person'),
+            partner=make_recipe('legalaid.full_person'),
+            disputed_savings=make_recipe('legalaid.savings'),
+            has_partner=True
+        )
+        make_recipe(
+            'legalaid.property', eligibility_check=check, value=100,
+            mortgage_left=50, share=100, disputed=False, main=True
+        )
+        make_recipe(
+            'legalaid.property', eligibility_check=check, value=200,
+            mortgage_left=0, share=50, disputed=True, main=False
+        )
+        return check
+
+    def test_with_inputs_loads_case_data_in_one_query(self):
+        check = self._make_full_check()
+        expected = check.get_case_data_dict()
+
+        with self.assertNumQueries(1):
+            loaded = EligibilityCheck.objects.with_inputs().get(pk=check.pk)
+            case_data_dict = loaded.get_case_data_dict()
+
+        self.assertEqual(case_data_dict, expected)
+        self.assertEqual(len(case_data_dict['property_data']), 2)
+
+    @mock.patch('legalaid.models.EligibilityChecker')
+    def test_update_state_skipped_if_inputs_unchanged(self, MockedEligibilityChecker):
+        mocked_checker = MockedEligibilityChecker()
+        mocked_checker.calcs = {}
+        mocked_checker.is_eligible.return_value = True
+
+        check = self._make_full_check()
+        self.assertTrue(check.update_state())
+        self.assertEqual(check.state, ELIGIBILITY_STATES.YES)
+        self.assertEqual(mocked_checker.is_eligible.call_count, 1)
+
+        # only notes changed => loading the inputs is the only query
+        check.notes = 'new notes'
+        check.save()
+        with self.assertNumQueries(1):
+            self.assertFalse(check.update_state())
+        self.assertEqual(mocked_checker.is_eligible.call_count, 1)
+
+        # inputs changed => recalculated
+        mocked_checker.is_eligible.return_value = False
+        check.you.savings.bank_balance = 123456
+        check.you.savings.save()
+        self.assertTrue(check.update_state())
+        self.assertEqual(check.state, ELIGIBILITY_STATES.NO)
+        self.assertEqual(mocked_checker.is_eligible.call_count, 2)
+
+        # properties are inputs too
+        mocked_checker.is_eligible.return_value = True
+        check.property_set.all()[0].delete()
+        self.assertTrue(check.update_state())
+        self.assertEqual(check.state, ELIGIBILITY_STATES.YES)
+
+        self.assertEqual(
+            EligibilityCheck.objects.get(pk=check.pk).inputs_fingerprint,
+            check.inputs_fingerprint
+        )
+
 
 class CaseTestCase(TestCase):
     def test_create_has_laa_reference(self):
@@ -612,6 +682,132 @@ class CaseTestCase(TestCase):
         # it is 7 digits long
         self.assertEqual(len(unicode(case.laa_reference)), 7)
 
+    def test_create_single_insert(self):
+        case = Case(notes='notes')
+        with CaptureQueriesContext(connection) as queries:
+            case.save()
+
+        case_writes = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith(('INSERT', 'UPDATE')) and
+            'legalaid_case' in query['sql']
+        ]
+        self.assertEqual(len(case_writes), 1)
+        self.assertTrue(case_writes[0].startswith('INSERT'))
+
+        db_case = Case.objects.get(pk=case.pk)
+        self.assertEqual(
+            db_case.laa_reference, case.pk + settings.LAA_REFERENCE_SEED
+        )
+        self.assertEqual(db_case.search_field, case.get_search_field())
+
+    @mock.patch('legalaid.models.generate_case_reference')
+    def test_create_retries_taken_reference(self, generate_case_reference):
+        existing = make_recipe('legalaid.case')
+        generate_case_reference.side_effect = [
+            existing.reference, u'AB-1234-5678'
+        ]
+
+        case = make_recipe('legalaid.case')
+
+        self.assertEqual(case.reference, u'AB-1234-5678')
+        db_case = Case.objects.get(pk=case.pk)
+        self.assertEqual(db_case.reference, u'AB-1234-5678')
+        self.assertIn(u'AB-1234-5678', db_case.search_field)
+
+    def test_bulk_create_cases(self):
+        pd = make_recipe('legalaid.personal_details', full_name='John Smith')
+        existing = make_recipe('legalaid.case')
+        cases = [
+            Case(personal_details=pd, outcome_code='MIS'),
+            Case(personal_details=pd),
+            Case(reference=u'AB-1234-5678'),
+        ]
+
+        with mock.patch(
+            'legalaid.models.generate_case_reference',
+            side_effect=[existing.reference, u'AB-1234-5678', u'CD-1234-5678',
+                         u'EF-1234-5678']
+        ):
+            Case.objects.bulk_create_cases(cases)
+
+        self.assertEqual(Case.objects.count(), 4)
+        self.assertEqual(
+            set(case.reference for case in cases),
+            set([u'CD-1234-5678', u'EF-1234-5678', u'AB-1234-5678'])
+        )
+        for case in cases:
+            db_case = Case.objects.get(pk=case.pk)
+            self.assertEqual(db_case.reference, case.reference)
+            self.assertEqual(
+                db_case.laa_reference, case.pk + settings.LAA_REFERENCE_SEED
+            )
+            self.assertEqual(db_case.search_field, case.get_search_field())
+        self.assertEqual(Case.objects.get(pk=cases[0].pk).priority, 6)
+        self.assertEqual(PersonalDetails.objects.get(pk=pd.pk).case_count, 2)
+
+    def test_search_field_set_on_save(self):
+        pd = make_recipe(
+            'legalaid.personal_details', full_name='John Smith',
+            postcode='sw1a 1aa', street=None
+        )
+        case = make_recipe('legalaid.case', personal_details=pd)
+
+        expected = u'JOHN SMITH SW1A 1AA %s %s' % (
+            case.reference, case.laa_reference
+        )
+        self.assertEqual(case.search_field, expected)
+        self.assertEqual(
+            Case.objects.get(pk=case.pk).search_field, expected
+        )
+
+        case.personal_details = None
+        case.save(update_fields=['personal_details'])
+        self.assertEqual(
+            Case.objects.get(pk=case.pk).search_field,
+            u'%s %s' % (case.reference, case.laa_reference)
+        )
+
+    def test_search_field_updated_on_personal_details_save(self):
+        pd = make_recipe('legalaid.personal_details', full_name='John Smith')
+        cases = make_recipe('legalaid.case', personal_details=pd, _quantity=2)
+
+        pd.full_name = 'Jane Doe'
+        pd.save()
+
+        for case in cases:
+            search_field = Case.objects.get(pk=case.pk).search_field
+            self.assertTrue(search_field.startswith(u'JANE DOE '))
+            self.assertEqual(search_field, case.get_search_field())
+
+    def test_search_field_not_updated_on_unrelated_save(self):
+        pd = make_recipe('legalaid.personal_details', full_name='John Smith')
+        make_recipe('legalaid.case', personal_details=pd)
+
+        with self.assertNumQueries(1):
+            pd.save(update_fields=['mobile_phone'])
+
+    def test_priority_follows_outcome_code(self):
+        case = make_recipe('legalaid.case')
+        self.assertEqual(case.priority, 0)
+
+        for outcome_code, priority in [
+            ('CB1', 4), ('REF-EXT', 8), ('MANALC', 1), (None, 0)
+        ]:
+            case.outcome_code = outcome_code
+            case.save(update_fields=['outcome_code'])
+            self.assertEqual(
+                Case.objects.get(pk=case.pk).priority, priority
+            )
+
+    def test_priority_updated_by_outcome_log(self):
+        case = make_recipe('legalaid.case')
+        make_recipe(
+            'cla_eventlog.log', case=case, code='IRCB',
+            type=LOG_TYPES.OUTCOME, level=LOG_LEVELS.HIGH
+        )
+        self.assertEqual(Case.objects.get(pk=case.pk).priority, 7)
+
     def test_assign_to_provider_overriding_provider(self):
         providers = make_recipe('cla_provider.provider', _quantity=2)
 
@@ -770,6 +966,42 @@ class CaseTestCase(TestCase):
         self.assertEqual(pd.case_count, 2)
         self.assertEqual(pd2.case_count, 1)
 
+    def test_case_count_moves_when_pd_changes(self):
+        pd = make_recipe('legalaid.personal_details')
+        pd2 = make_recipe('legalaid.personal_details')
+        case = make_recipe('legalaid.case', personal_details=pd)
+
+        case.personal_details = pd2
+        case.save()
+
+        self.assertEqual(PersonalDetails.objects.get(pk=pd.pk).case_count, 0)
+        self.assertEqual(PersonalDetails.objects.get(pk=pd2.pk).case_count, 1)
+
+        case.delete()
+        self.assertEqual(PersonalDetails.objects.get(pk=pd2.pk).case_count, 0)
+
+    def test_case_count_not_updated_if_pd_not_saved(self):
+        pd = make_recipe('legalaid.personal_details')
+        case = make_recipe('legalaid.case', personal_details=pd)
+
+        case = Case.objects.get(pk=case.pk)
+        with self.assertNumQueries(1):
+            case.save(update_fields=['notes'])
+        case.save()
+        self.assertEqual(PersonalDetails.objects.get(pk=pd.pk).case_count, 1)
+
+    def test_reconcile_case_counts(self):
+        pd = make_recipe('legalaid.personal_details')
+        pd2 = make_recipe('legalaid.personal_details')
+        make_recipe('legalaid.case', personal_details=pd, _quantity=2)
+        PersonalDetails.objects.filter(pk=pd.pk).update(case_count=5)
+        PersonalDetails.objects.filter(pk=pd2.pk).update(case_count=1)
+
+        self.assertEqual(PersonalDetails.objects.reconcile_case_counts(), 2)
+        self.assertEqual(PersonalDetails.objects.get(pk=pd.pk).case_count, 2)
+        self.assertEqual(PersonalDetails.objects.get(pk=pd2.pk).case_count, 0)
+        self.assertEqual(PersonalDetails.objects.reconcile_case_counts(), 0)
+
 
 class MoneyIntervalFieldTestCase(TestCase):
     def test_create_save_moneyinterval(self):
@@ -1065,6 +1297,52 @@ class CloneModelsTestCase(CloneModelsTestCaseMixin, TestCase):
             equal_fields=[]
         )
 
+    def _bulk_clone_persons(self, num_persons):
+        persons = [
+            make_recipe('legalaid.full_person') for i in range(num_persons)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            cloned = bulk_clone_model(
+                Person, [p.pk for p in persons], Person.cloning_config
+            )
+        return persons, cloned, len(queries)
+
+    def test_bulk_clone_person(self):
+        persons, cloned, _ = self._bulk_clone_persons(3)
+
+        self.assertEqual(Person.objects.count(), 6)
+        self.assertItemsEqual(cloned.keys(), [p.pk for p in persons])
+        for person in persons:
+            self.obj = person
+            self.cloned_obj = Person.objects.get(pk=cloned[person.pk].pk)
+            self._check_model_fields(
+                Person, self.obj, self.cloned_obj,
+                non_equal_fields=['id', 'created', 'modified', 'income', 'savings', 'deductions'],
+                equal_fields=[]
+            )
+            self.assertEqual(
+                self.cloned_obj.income.self_employed,
+                person.income.self_employed
+            )
+            self.assertEqual(
+                self.cloned_obj.savings.bank_balance,
+                person.savings.bank_balance
+            )
+            self.assertEqual(
+                self.cloned_obj.deductions.criminal_legalaid_contributions,
+                person.deductions.criminal_legalaid_contributions
+            )
+
+    def test_bulk_clone_queries_dont_depend_on_objects(self):
+        _, _, num_queries = self._bulk_clone_persons(1)
+        _, _, num_queries_many = self._bulk_clone_persons(5)
+
+        self.assertEqual(num_queries, num_queries_many)
+
+    def test_bulk_clone_no_pks(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(bulk_clone_model(Person, [None]), {})
+
 
 class SplitCaseTestCase(CloneModelsTestCaseMixin, TestCase):
     def build_category_data(self):
@@ -1110,7 +1388,7 @@ class SplitCaseTestCase(CloneModelsTestCaseMixin, TestCase):
                 'your_problem_notes', 'notes', 'state', 'dependants_young',
                 'dependants_old', 'on_passported_benefits', 'on_nass_benefits',
                 'is_you_or_your_partner_over_60', 'has_partner', 'calculations',
-                'specific_benefits'
+                'specific_benefits', 'inputs_fingerprint'
             ],
             check_not_None=True
         )
@@ -1164,6 +1442,7 @@ class SplitCaseTestCase(CloneModelsTestCaseMixin, TestCase):
         self.assertEqual(new_case.provider_notes, '')
         self.assertNotEqual(case.laa_reference, new_case.laa_reference)
         self.assertEqual(new_case.billable_time, 0)
+        self.assertEqual(new_case.priority, 0)
         self.assertEqual(new_case.matter_type1, self.cat2_data.matter_type1)
         self.assertEqual(new_case.matter_type2, self.cat2_data.matter_type2)
         self.assertEqual(new_case.alternative_help_articles.count(), 0)
@@ -1201,7 +1480,8 @@ class SplitCaseTestCase(CloneModelsTestCaseMixin, TestCase):
             'adaptation_details', 'billable_time', 'matter_type1', 'matter_type2',
             'outcome_code', 'level', 'reference', 'laa_reference', 'from_case',
             'outcome_code_id', 'requires_action_at', 'callback_attempt',
-            'provider_viewed', 'provider_accepted', 'provider_closed'
+            'provider_viewed', 'provider_accepted', 'provider_closed',
+            'search_field', 'priority'
         ]
         equal_fields = [
             'personal_details', 'notes', 'provider_notes', 'media_code',
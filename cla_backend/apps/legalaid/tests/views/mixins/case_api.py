@@ -1,6 +1,7 @@
 from django.core.urlresolvers import reverse
 from django.conf import settings
 from django.db import connection
+from django.http import QueryDict
 
 from rest_framework import status
 
@@ -230,6 +231,68 @@ class BaseSearchCaseAPIMixin(BaseFullCaseAPIMixin):
         self.assertEqual(1, len(response.data['results']))
         self.assertCaseEqual(response.data['results'][0], self.resource)
 
+    def test_search_ranks_reference_match_first(self):
+        """
+        GET search should list the case with the given reference first
+        """
+        self.resource.personal_details.full_name = 'abc'
+        self.resource.personal_details.save()
+
+        obj = make_recipe(
+            'legalaid.case',
+            personal_details__full_name='xyz %s' % self.resource.reference,
+            **self.get_extra_search_make_recipe_kwargs()
+        )
+
+        response = self.client.get(
+            self.list_url, data={'search': self.resource.reference.lower()},
+            HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [case['reference'] for case in response.data['results']],
+            [self.resource.reference, obj.reference]
+        )
+
+    def test_search_with_cursor(self):
+        """
+        Following the cursors of a search returns the cases in the same
+        order, ranked, as the page number pagination
+        """
+        self.resource.personal_details.full_name = 'abc'
+        self.resource.personal_details.save()
+        for full_name in ['abc def', 'xabc', 'def abc', 'xyz']:
+            make_recipe(
+                'legalaid.case', personal_details__full_name=full_name,
+                **self.get_extra_search_make_recipe_kwargs()
+            )
+
+        response = self.client.get(
+            self.list_url, data={'search': 'abc'},
+            HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        expected = [case['reference'] for case in response.data['results']]
+        self.assertEqual(len(expected), 4)
+
+        references = []
+        params = {'search': 'abc', 'page_size': 1, 'cursor': ''}
+        while True:
+            response = self.client.get(
+                self.list_url, data=params,
+                HTTP_AUTHORIZATION=self.get_http_authorization()
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            references += [
+                case['reference'] for case in response.data['results']
+            ]
+            if not response.data['next']:
+                break
+            params['cursor'] = QueryDict(
+                response.data['next'].lstrip('?')
+            )['cursor']
+
+        self.assertEqual(references, expected)
+
     def test_search_find_none_result_by_postcode(self):
         """
         GET search by name should work
@@ -125,3 +125,50 @@ class CaseNotesHistoryAPIMixin(NestedSimpleResourceAPIMixin):
             else:
                 self.assertEqual(obj['operator_notes'], 'Operator notes')
                 self.assertEqual(obj['type_notes'], 'Operator notes')
+
+    def test_get_with_cursor(self):
+        url = "%s?cursor=" % self.list_url
+        response = self.client.get(
+            url, HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], None)
+        self.assertEqual(response.data['previous'], None)
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertTrue(response.data['next'].startswith('?cursor='))
+
+        response = self.client.get(
+            self.list_url + response.data['next'],
+            HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(response.data['next'], None)
+
+    def test_get_with_cursor_and_with_extra_param(self):
+        url = "%s?cursor=&with_extra=true&with_count=true" % self.list_url
+        first_page = self.client.get(
+            url, HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        self.assertEqual(first_page.status_code, status.HTTP_200_OK)
+        self.assertEqual(first_page.data['count'], 8)
+        self.assertEqual(len(first_page.data['results']), 6)
+
+        url = "%s%s&with_extra=true" % (
+            self.list_url, first_page.data['next']
+        )
+        second_page = self.client.get(
+            url, HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        self.assertEqual(second_page.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(second_page.data['results']), 3)
+        self.assertEqual(
+            first_page.data['results'][-1], second_page.data['results'][0]
+        )
+
+    def test_get_with_invalid_cursor(self):
+        url = "%s?cursor=invalid" % self.list_url
+        response = self.client.get(
+            url, HTTP_AUTHORIZATION=self.get_http_authorization()
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
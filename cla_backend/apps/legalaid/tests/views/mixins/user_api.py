@@ -1,8 +1,10 @@
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
+from django.utils import timezone
 
 from rest_framework import status
 
-from cla_auth.models import AccessAttempt
+from cla_auth.lockout import LoginFailures
 
 
 class UserAPIMixin(object):
@@ -258,15 +260,14 @@ class UserAPIMixin(object):
 
         other_username = other_user.user.username
 
-        # creating AccessAttempts
-
-        AccessAttempt.objects.create_for_username('different_username')
+        # recording login failures
+        cache.clear()
+        now = timezone.now()
+        LoginFailures('different_username').add(now)
         for index in range(5):
-            AccessAttempt.objects.create_for_username(other_username)
+            LoginFailures(other_username).add(now)
 
-        self.assertEqual(
-            AccessAttempt.objects.filter(username=other_username).count(), 5
-        )
+        self.assertTrue(LoginFailures(other_username).is_locked_out(now))
 
         # make request
         reset_lockout = self.get_user_reset_lockout_url(other_username)
@@ -278,6 +279,5 @@ class UserAPIMixin(object):
         # asserts
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
-        self.assertEqual(
-            AccessAttempt.objects.filter(username=other_username).count(), 0
-        )
+        self.assertEqual(LoginFailures(other_username).count(now), 0)
+        self.assertEqual(LoginFailures('different_username').count(now), 1)
@@ -95,6 +95,28 @@ def validate_in(iterable):
 def inverted_reduce(x, f):
     return f(x)
 
+
+def compile_validators(validators):
+    """
+    Composes a list of validators into a single function applying them in
+    order, so that the chain is built once per field instead of reducing
+    over the list for every value.
+    """
+    validators = tuple(validators)
+
+    if not validators:
+        return lambda val: val
+
+    if len(validators) == 1:
+        return validators[0]
+
+    def _validate(val):
+        for validator in validators:
+            val = validator(val)
+        return val
+
+    return _validate
+
 TRUTHY = lambda x: bool(x)
 FALSEY = lambda x: not bool(x)
 AFTER_APR_2013 = lambda x: x > datetime.datetime(2013, 4, 1)
@@ -189,17 +211,27 @@ class ProviderCSVValidator(object):
     def __init__(self, rows):
         self.rows = rows
         self.cleaned_data = []
+        self.errors = []
+        self.summary = {}
+
+    @classmethod
+    def get_compiled_fields(cls):
+        """
+        @return: tuple of (field name, validator) with the validators of
+                 each field compiled into one, built once per class.
+        """
+        if '_compiled_fields' not in cls.__dict__:
+            cls._compiled_fields = tuple(
+                (field_name, compile_validators(validators))
+                for field_name, validators in cls.fields
+            )
+        return cls._compiled_fields
 
     def _validate_field(self, field_name, field_value, idx,
-                        row_num, validators):
+                        row_num, validator):
         # Field Validation
         try:
-            # reduce the validators over the original field value, save
-            # the final value into self.cleaned_data[field_name]
-            cleaned_value = reduce(inverted_reduce, validators,
-                                   field_value)
-
-            return cleaned_value
+            return validator(field_value)
 
         except serializers.ValidationError as ve:
             ve.message = 'Row: %s Field (%s): %s - %s' % (
@@ -213,20 +245,18 @@ class ProviderCSVValidator(object):
         the fields and apply the validators specified in the
         field spec (self.fields)
         """
-        cleaned_data = {}
+        fields = self.get_compiled_fields()
 
         for row_num, row in enumerate(self.rows):
-            if len(row) != len(self.fields):
-                raise serializers.ValidationError(
-                    'Row: %s - Incorrect number of columns should be %s '
-                    'actually %s' % (row_num + 1, len(self.fields), len(row)))
+            self._validate_row_length(row, row_num)
 
+            cleaned_data = {}
             for idx, field_value in enumerate(row):
-                field_name, validators = self.fields[idx]
+                field_name, validator = fields[idx]
                 cleaned_data[field_name] = self._validate_field(field_name,
                                                                 field_value,
                                                                 idx, row_num,
-                                                                validators)
+                                                                validator)
 
             # Global Validation
             self.cleaned_data.append(
@@ -347,6 +377,82 @@ class ProviderCSVValidator(object):
             raise ve
 
 
+    def _validate_row_length(self, row, row_num):
+        if len(row) != len(self.fields):
+            raise serializers.ValidationError(
+                'Row: %s - Incorrect number of columns should be %s '
+                'actually %s' % (row_num + 1, len(self.fields), len(row)))
+
+    def _add_error(self, row_num, idx, ve):
+        self.errors.append({
+            'row': row_num + 1,
+            'column': idx + 1 if idx is not None else None,
+            'message': ve.message
+        })
+
+    def _add_to_summary(self, cleaned_data):
+        summary = self.summary
+        # the category is consistent across fields in valid rows
+        category = PREFIX_CATEGORY_LOOKUP[cleaned_data['Matter Type 1'][0]]
+        summary['categories'][category] = \
+            summary['categories'].get(category, 0) + 1
+        summary['time_spent'] += cleaned_data.get('Time Spent') or 0
+        summary['case_costs'] += cleaned_data.get('Case Costs') or 0
+
     def validate(self):
         self._validate_fields()
         return self.cleaned_data
+
+    def validate_all(self):
+        """
+        Same as `validate` but instead of stopping at the first error, it
+        goes through all the rows once (they can be any iterable so they
+        don't need to be in memory) collecting the errors of every row
+        in self.errors as dicts with 'row', 'column' (None for errors
+        across fields) and 'message'.
+
+        Also builds self.summary of the valid rows: number of rows by
+        category, total time spent and total case costs.
+
+        @return: list of errors, empty if all the rows are valid
+        """
+        fields = self.get_compiled_fields()
+        self.summary = {
+            'categories': {}, 'time_spent': 0, 'case_costs': Decimal(0)
+        }
+
+        for row_num, row in enumerate(self.rows):
+            try:
+                self._validate_row_length(row, row_num)
+            except serializers.ValidationError as ve:
+                self._add_error(row_num, None, ve)
+                continue
+
+            cleaned_data = {}
+            valid = True
+            for idx, field_value in enumerate(row):
+                field_name, validator = fields[idx]
+                try:
+                    cleaned_data[field_name] = self._validate_field(
+                        field_name, field_value, idx, row_num, validator
+                    )
+                except serializers.ValidationError as ve:
+                    self._add_error(row_num, idx, ve)
+                    valid = False
+
+            # checks across fields need all the fields to be valid
+            if not valid:
+                continue
+
+            try:
+                self.cleaned_data.append(
+                    self._validate_data(cleaned_data, row_num)
+                )
+            except serializers.ValidationError as ve:
+                self._add_error(row_num, None, ve)
+                continue
+
+            self._add_to_summary(cleaned_data)
+
+        self.summary['case_costs'] = unicode(self.summary['case_costs'])
+        return self.errors
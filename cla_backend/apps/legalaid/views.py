@@ -19,12 +19,13 @@ from rest_framework_extensions.mixins import DetailSerializerMixin
 from core.utils import format_patch
 from core.drf.mixins import NestedGenericModelMixin, JsonPatchViewSetMixin, \
     FormActionMixin
-from core.drf.pagination import RelativeUrlPaginationSerializer
+from core.drf.pagination import RelativeUrlPaginationSerializer, \
+    CursorPaginationMixin
 
 from legalaid.permissions import IsManagerOrMePermission
 from cla_eventlog import event_registry
 
-from cla_auth.models import AccessAttempt
+from cla_auth.lockout import LoginFailures
 
 from .serializers import CategorySerializerBase, \
     MatterTypeSerializerBase, MediaCodeSerializerBase, \
@@ -127,7 +128,7 @@ class BaseUserViewSet(
             raise PermissionDenied()
 
         user = self.get_object().user
-        AccessAttempt.objects.delete_for_username(user.username)
+        LoginFailures(user.username).clear()
         statsd.incr('account.lockout.reset')
         return DRFResponse(status=status.HTTP_204_NO_CONTENT)
 
@@ -323,7 +324,66 @@ class DescCaseOrderingFilter(BaseCaseOrderingFilter):
     default_modified = '-modified'
 
 
+class CaseSearchFilter(SearchFilter):
+    """
+    Looks for each search term in Case.search_field (a single indexed
+    column) instead of OR-ing icontains lookups across the joined
+    personal details.
+
+    Unless an ordering is explicitly requested, cases with a reference
+    equal to a term come first, then the ones where a term matches the
+    start of a word.
+    """
+    rank_sql = """CASE
+        WHEN legalaid_case.reference = %s
+            OR legalaid_case.laa_reference::text = %s THEN 2
+        WHEN legalaid_case.search_field LIKE %s
+            OR legalaid_case.search_field LIKE %s THEN 1
+        ELSE 0
+    END"""
+
+    def get_search_terms(self, request):
+        terms = super(CaseSearchFilter, self).get_search_terms(request)
+        return [term.upper() for term in terms]
+
+    def get_rank_params(self, term, like_term):
+        """
+        @return: params of `rank_sql` for `term`, `like_term` is the same
+                 escaped for LIKE
+        """
+        return [term, term, '%s%%' % like_term, '%% %s%%' % like_term]
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        for term in terms:
+            queryset = queryset.filter(search_field__contains=term)
+
+        if request.QUERY_PARAMS.get(OrderingFilter.ordering_param):
+            return queryset
+
+        rank_sql = []
+        rank_params = []
+        for term in terms:
+            like_term = term.replace('\\', '\\\\').replace(
+                '%', '\\%').replace('_', '\\_')
+            rank_sql.append(self.rank_sql)
+            rank_params += self.get_rank_params(term, like_term)
+
+        ordering = list(
+            queryset.query.order_by or queryset.model._meta.ordering or
+            ['pk']
+        )
+        return queryset.extra(
+            select={'search_rank': ' + '.join(rank_sql)},
+            select_params=rank_params
+        ).order_by('-search_rank', *ordering)
+
+
 class FullCaseViewSet(
+    CursorPaginationMixin,
     DetailSerializerMixin,
     mixins.UpdateModelMixin,
     mixins.RetrieveModelMixin,
@@ -340,13 +400,13 @@ class FullCaseViewSet(
 
     filter_backends = (
         AscCaseOrderingFilter,
-        SearchFilter,
+        CaseSearchFilter,
     )
 
     ordering_fields = ('modified', 'personal_details__full_name',
             'personal_details__date_of_birth', 'personal_details__postcode',
             'eligibility_check__category__name', 'priority', 'null_priority')
-    ordering = ('null_priority', '-priority', 'modified')
+    ordering = ('-priority', 'modified')
 
     search_fields = (
         'personal_details__full_name',
@@ -375,16 +435,6 @@ class FullCaseViewSet(
                     WHEN legalaid_case.outcome_code IS NULL THEN 1
                     ELSE 0
                 END''',
-                'priority': '''CASE legalaid_case.outcome_code
-                        WHEN 'REF-EXT' THEN 8
-                        WHEN 'IRCB' THEN 7
-                        WHEN 'MIS' THEN 6
-                        WHEN 'COI' THEN 5
-                        WHEN 'CB1' THEN 4
-                        WHEN 'CB2' THEN 3
-                        WHEN 'CB3' THEN 2
-                        ELSE 1
-                    END''',
                 'rejected': '''CASE
                     WHEN legalaid_case.outcome_code IN (
                         'COI', 'MIS')
@@ -452,6 +502,13 @@ class BaseCSVUploadViewSet(
         OrderingFilter,
     )
 
+    def get_queryset(self, *args, **kwargs):
+        qs = super(BaseCSVUploadViewSet, self).get_queryset(*args, **kwargs)
+        if self.lookup_field not in self.kwargs:
+            # lists only show the row count and summary
+            qs = qs.defer('body')
+        return qs
+
     def create(self, request, *args, **kwargs):
         try:
             return super(BaseCSVUploadViewSet, self).create(request, *args, **kwargs)
@@ -484,6 +541,7 @@ class PaginatorWithExtraItem(Paginator):
 
 
 class BaseCaseNotesHistoryViewSet(
+    CursorPaginationMixin,
     NestedGenericModelMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet
@@ -6,6 +6,7 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from eligibility_calculator.batch import BatchEligibilityChecker, to_columns
 from eligibility_calculator.calculator import EligibilityChecker
 from eligibility_calculator.models import CaseData
 
@@ -13,7 +14,13 @@ from eligibility_calculator.models import CaseData
 @api_view(['POST'])
 @permission_classes((AllowAny,))
 def eligibility_batch_check(request):
-    return Response(map(pass_fail, request.DATA))
+    return Response(batch_pass_fail(request.DATA))
+
+
+def batch_pass_fail(scenarios):
+    columns = to_columns(map(to_case_data, scenarios))
+    results = BatchEligibilityChecker(columns).is_eligible()
+    return ['P' if is_eligible else 'F' for is_eligible in results]
 
 
 def pass_fail(scenario):
@@ -2,8 +2,8 @@ from datetime import timedelta, time, datetime
 from cla_eventlog import event_registry
 
 from django import forms
-from django.db import connection
 from django.db.models.aggregates import Count
+from django.db.models.query import QuerySet
 from django.db.models.sql.aggregates import Aggregate
 from django.utils import timezone
 from django.contrib.admin import widgets
@@ -15,6 +15,7 @@ from cla_eventlog.constants import LOG_LEVELS, LOG_TYPES
 from cla_provider.models import Provider
 from legalaid.models import Case
 from . import sql
+from .utils import stream_sql
 import os
 
 
@@ -29,8 +30,19 @@ class ReportForm(ConvertDateMixin, forms.Form):
     def get_headers(self):
         raise NotImplementedError
 
+    def get_queryset_rows(self):
+        """
+        Rows of `get_queryset()`, without caching them on the queryset.
+        Only the raw SQL reports (see `stream_sql`) are fetched in batches
+        from a server-side cursor.
+        """
+        qs = self.get_queryset()
+        if isinstance(qs, QuerySet):
+            return qs.iterator()
+        return qs
+
     def get_rows(self):
-        for row in self.get_queryset():
+        for row in self.get_queryset_rows():
             yield row
 
     def __iter__(self):
@@ -75,7 +87,7 @@ class ProviderCaseClosure(DateRangeReportForm):
 
     def get_rows(self):
         total = 0
-        qs = self.get_queryset()
+        qs = self.get_queryset_rows()
         for outcome_data in qs:
             total += 1
             local_dt = timezone.localtime(outcome_data[1])
@@ -106,7 +118,7 @@ class OperatorCaseClosure(DateRangeReportForm):
     def get_rows(self):
         call_count = 0
         call_total_time = 0
-        qs = self.get_queryset()
+        qs = self.get_queryset_rows()
         for outcome_data in qs:
             call_count += 1
             delta = (outcome_data[2] - outcome_data[1]).seconds
@@ -181,7 +193,7 @@ class OperatorCaseCreate(DateRangeReportForm):
         return ['Case #', 'Assigned', 'Duration']
 
     def get_rows(self):
-        qs = self.get_queryset()
+        qs = self.get_queryset_rows()
         count = 0
         total_time = 0
         for case in qs:
@@ -234,7 +246,7 @@ class CaseReport(DateRangeReportForm):
 
     def get_rows(self):
         count = 0
-        for row in self.get_queryset():
+        for row in self.get_queryset_rows():
             count += 1
             yield row
         yield []
@@ -263,8 +275,7 @@ class NewCasesWithAdaptationCount(DateRangeReportForm):
 
 class CaseVolumeAndAvgDurationByDay(DateRangeReportForm):
     def get_queryset(self):
-        cursor = connection.cursor()
-        cursor.execute('''
+        return stream_sql('''
 SELECT
     (DATE_TRUNC('day', legalaid_case.created)) AS created_day,
     legalaid_case.created_by_id AS operator,
@@ -295,7 +306,6 @@ GROUP BY
     DATE_TRUNC('day', legalaid_case.created),
     operator;
         ''', self.date_range)
-        return cursor.fetchall()
 
     def get_headers(self):
         return [
@@ -362,10 +372,7 @@ class SQLFileReport(DateRangeReportForm):
             self.query = f.read()
 
     def get_queryset(self):
-        cursor = connection.cursor()
-        cursor.execute(self.query, self.date_range)
-        self.description = cursor.description
-        return cursor.fetchall()
+        return stream_sql(self.query, self.date_range)
 
 
 class MICaseExtract(SQLFileReport):
@@ -422,10 +429,7 @@ class MICaseExtract(SQLFileReport):
         )
         sql_args = [passphrase] + list(self.date_range)
 
-        cursor = connection.cursor()
-        cursor.execute(sql, sql_args)
-        self.description = cursor.description
-        return cursor.fetchall()
+        return stream_sql(sql, sql_args)
 
 
 class MIFeedbackExtract(SQLFileReport):
@@ -482,10 +486,7 @@ class MIContactsPerCaseByCategoryExtract(SQLFileReport):
         return self.date_range + (self.get_valid_outcomes(),)
 
     def get_queryset(self):
-        cursor = connection.cursor()
-        cursor.execute(self.query, self.params)
-        self.description = cursor.description
-        return cursor.fetchall()
+        return stream_sql(self.query, self.params)
 
 
 class MISurveyExtract(SQLFileReport):
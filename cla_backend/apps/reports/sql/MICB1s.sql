@@ -1,27 +1,4 @@
-WITH  latest_outcome as (
-    select
-      e.*
-    FROM legalaid_case c
-      join cla_eventlog_log e on e.case_id = c.id
-
-    where  e.id = (
-      SELECT MAX(l.id) FROM cla_eventlog_log l WHERE
-        l.case_id = c.id
-        and l.type = 'outcome'
-      group by l.case_id)
-
-), operator_first_view as (
-    SELECT e.* FROM
-      cla_eventlog_log as e
-
-    WHERE
-      e.id = (SELECT MIN(l.id) FROM cla_eventlog_log l
-        JOIN auth_user as u on l.created_by_id = u.id
-        JOIN call_centre_operator as op on u.id = op.user_id
-      WHERE l.case_id = e.case_id
-            and l.code != 'CASE_CREATED'
-      group by l.case_id)
-),
+WITH
     operator_first_outcome AS (
       SELECT
         e.*
@@ -119,8 +96,8 @@ from cla_eventlog_log as log
   LEFT OUTER JOIN auth_user as u on log.created_by_id = u.id
   LEFT OUTER JOIN call_centre_operator as op on u.id = op.user_id
   LEFT OUTER JOIN legalaid_mediacode as mc on mc.id = c.media_code_id
-  LEFT OUTER JOIN latest_outcome on latest_outcome.case_id = c.id
-  LEFT OUTER JOIN operator_first_view on operator_first_view.case_id = c.id
+  LEFT OUTER JOIN cla_eventlog_caselogsummary as summary on summary.case_id = c.id
+  LEFT OUTER JOIN cla_eventlog_log as operator_first_view on operator_first_view.id = summary.operator_first_view_id
   LEFT OUTER JOIN operator_first_log_after_cb1 on operator_first_log_after_cb1.case_id = c.id
   LEFT OUTER JOIN operator_first_outcome on operator_first_outcome.case_id = c.id
   LEFT OUTER JOIN legalaid_case split_case on c.from_case_id = split_case.id
@@ -1,57 +1,6 @@
 WITH diversity_view as (
   select id, {diversity_expression} as diversity
   from legalaid_personaldetails
-), latest_outcome as (
-    select
-      e.*
-      FROM legalaid_case c
-      join cla_eventlog_log e on e.case_id = c.id
-
-    where  e.id = (
-      SELECT MAX(l.id) FROM cla_eventlog_log l WHERE
-        l.case_id = c.id
-        and l.type = 'outcome'
-      group by l.case_id)
-
-), operator_first_view as (
-    SELECT e.* FROM
-      cla_eventlog_log as e
-
-    WHERE
-      e.id = (SELECT MIN(l.id) FROM cla_eventlog_log l
-        JOIN auth_user as u on l.created_by_id = u.id
-        JOIN call_centre_operator as op on u.id = op.user_id
-      WHERE l.case_id = e.case_id
-            and l.code != 'CASE_CREATED'
-      group by l.case_id)
-
-
-), provider_first_view as (
-    SELECT
-      e.*
-    FROM
-      cla_eventlog_log AS e
-    WHERE
-      e.id = (SELECT
-                MIN(l.id)
-              FROM cla_eventlog_log l
-                JOIN auth_user AS u ON l.created_by_id = u.id
-                JOIN cla_provider_staff AS staff ON u.id = staff.user_id
-              WHERE l.case_id = e.case_id
-                    AND l.code != 'CASE_CREATED'
-              GROUP BY l.case_id)
-), provider_first_assign as (
-    SELECT
-      e.*
-    FROM
-      cla_eventlog_log AS e
-    WHERE
-      e.id = (SELECT
-                MIN(l.id)
-              FROM cla_eventlog_log l
-              WHERE l.case_id = e.case_id
-                    AND l.code  in ('REFSP', 'MANALC', 'MANREF', 'SPOR')
-              GROUP BY l.case_id)
 )
 select
   c.laa_reference as "LAA_Reference"
@@ -67,7 +16,7 @@ select
   ,c.modified as "Last_Modified_Date"
   ,log.code as "Outcome_Code_Child"
   ,CASE WHEN log.code = 'NCOE' THEN 0 ELSE ceil(EXTRACT(EPOCH FROM (timer.stopped - timer.created))) END as "Billable_Time"
-  ,CASE WHEN latest_outcome.id = log.id THEN c.billable_time ELSE null END as "Cumulative_Time"
+  ,CASE WHEN summary.latest_outcome_id = log.id THEN c.billable_time ELSE null END as "Cumulative_Time"
   ,mt1.code as "Matter_Type_1"
   ,mt2.code as "Matter_Type_2"
   ,CASE WHEN op.id IS NOT NULL THEN 'OS:'||log.created_by_id::text
@@ -162,10 +111,10 @@ from cla_eventlog_log as log
   LEFT OUTER JOIN call_centre_operator as op on u.id = op.user_id
   LEFT OUTER JOIN cla_provider_staff as staff on u.id = staff.user_id
   LEFT OUTER JOIN legalaid_mediacode as mc on mc.id = c.media_code_id
-  LEFT OUTER JOIN latest_outcome on latest_outcome.case_id = c.id
-  LEFT OUTER JOIN operator_first_view on operator_first_view.case_id = c.id
-  LEFT OUTER JOIN provider_first_view on provider_first_view.case_id = c.id
-  LEFT OUTER JOIN provider_first_assign on provider_first_assign.case_id = c.id
+  LEFT OUTER JOIN cla_eventlog_caselogsummary as summary on summary.case_id = c.id
+  LEFT OUTER JOIN cla_eventlog_log as operator_first_view on operator_first_view.id = summary.operator_first_view_id
+  LEFT OUTER JOIN cla_eventlog_log as provider_first_view on provider_first_view.id = summary.provider_first_view_id
+  LEFT OUTER JOIN cla_eventlog_log as provider_first_assign on provider_first_assign.id = summary.provider_first_assign_id
   LEFT OUTER JOIN legalaid_case split_case on c.from_case_id = split_case.id
   LEFT OUTER JOIN diversity_view on pd.id = diversity_view.id
   LEFT OUTER JOIN cla_provider_provider as assigned_provider on trim((log.context->'provider_id')::text, '"')::numeric = assigned_provider.id
@@ -10,7 +10,7 @@ from cla_common.constants import CASELOGTYPE_ACTION_KEYS
 from core.tests.mommy_utils import make_recipe
 
 from ..forms import ProviderCaseClosure, \
-    OperatorCaseClosure
+    OperatorCaseClosure, CaseReport, NewCasesWithAdaptationCount
 
 @skip('skip until this is reimplemented using Log')
 class ProviderCaseClosureReportFormTestCase(TestCase):
@@ -214,3 +214,33 @@ class OperatorCaseClosureReportFormTestCase(TestCase):
             form.get_headers(),
            ['Case #', 'Call Started', 'Call Assigned', 'Duration (sec)','Outcome Code', 'To Provider']
         )
+
+
+class QuerysetRowsTestCase(TestCase):
+    def get_form(self, form_class):
+        today = datetime.date.today()
+        form = form_class({
+            'date_from': today - datetime.timedelta(days=1),
+            'date_to': today
+        })
+        self.assertTrue(form.is_valid())
+        return form
+
+    def assertRowsEqual(self, form_class):
+        form = self.get_form(form_class)
+        self.assertEqual(
+            list(form.get_queryset_rows()), list(form.get_queryset())
+        )
+
+    def test_values_list_with_aggregate(self):
+        make_recipe('legalaid.case', _quantity=3)
+        self.assertRowsEqual(CaseReport)
+
+    def test_values_list_with_annotate(self):
+        make_recipe('legalaid.case', _quantity=3)
+        self.assertRowsEqual(NewCasesWithAdaptationCount)
+
+    def test_no_rows(self):
+        self.assertEqual(
+            list(self.get_form(CaseReport).get_queryset_rows()), []
+        )
@@ -7,6 +7,7 @@ from django.core.urlresolvers import reverse
 from core.tests.mommy_utils import make_user
 
 from ..forms import ProviderCaseClosure
+from ..views import csv_download, csv_stream
 
 
 class ProviderClosureVolumeViewTestCase(SimpleTestCase):
@@ -58,3 +59,44 @@ class ProviderClosureVolumeViewTestCase(SimpleTestCase):
         form = response.context['form']
         self.assertTrue('form' in response.context)
         self.assertEqual(response.context['title'], 'Provider Closure Volume')
+
+
+class CSVStreamTestCase(SimpleTestCase):
+    def test_rows_are_sent_in_chunks(self):
+        rows = [['header']] + [[str(i)] for i in range(5)]
+
+        chunks = list(csv_stream(rows, rows_per_chunk=2))
+
+        self.assertEqual(chunks, [
+            'header\n0\n', '1\n2\n', '3\n4\n', ''
+        ])
+
+    def test_download_response_is_streamed(self):
+        rows = [['header'], ['1']]
+
+        response = csv_download('report.csv', rows)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            response['Content-Disposition'],
+            'attachment; filename="report.csv"'
+        )
+        self.assertEqual(''.join(response.streaming_content), 'header\n1\n')
+
+    def test_report_closed_when_response_closed_early(self):
+        closed = []
+
+        def rows():
+            try:
+                yield ['header']
+                for i in range(1000):
+                    yield [str(i)]
+            finally:
+                closed.append(True)
+
+        response = csv_download('report.csv', rows())
+        next(iter(response.streaming_content))
+        self.assertEqual(closed, [])
+
+        response.close()
+        self.assertEqual(closed, [True])
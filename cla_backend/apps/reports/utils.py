@@ -0,0 +1,27 @@
+import uuid
+
+from django.db import connection, transaction
+
+
+STREAM_BATCH_SIZE = 2000
+
+
+def stream_sql(sql, params=None, batch_size=STREAM_BATCH_SIZE):
+    """
+    Executes the query through a server-side (named) cursor and yields its
+    rows fetching `batch_size` at a time, so that the full result set is
+    never held in memory.
+
+    Named cursors only live within a transaction so the whole iteration
+    happens inside an atomic block.
+    """
+    with transaction.atomic():
+        name = 'report_%s' % uuid.uuid4().hex
+        cursor = connection.connection.cursor(name)
+        cursor.itersize = batch_size
+        try:
+            cursor.execute(sql, params)
+            for row in cursor:
+                yield row
+        finally:
+            cursor.close()
@@ -1,9 +1,10 @@
 import contextlib
+import itertools
 import csvkit as csv
 
 from django.contrib.admin.views.decorators import staff_member_required
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 
 from .forms import ProviderCaseClosure, OperatorCaseClosure, \
     OperatorCaseCreate, CaseReport, NewCasesWithAdaptationCount, \
@@ -42,11 +43,68 @@ def valid_submit(request, form):
 
 
 def csv_download(filename, form):
-    response = make_csv_download_response(filename)
-    csv_data = list(form)
-    with csv_writer(response) as writer:
-        map(writer.writerow, csv_data)
-    return response
+    content = csv_stream(form)
+    # generating the first chunk runs the report query so that any error
+    # is raised here and not halfway through the response
+    first_chunk = next(content)
+    return make_csv_download_response(
+        filename, StreamedContent(first_chunk, content)
+    )
+
+
+class StreamedContent(object):
+    """
+    `first_chunk` followed by the rest of the `content` generator.
+
+    Unlike itertools.chain it can be closed, the response closes it when
+    it's done or the client disconnects so that the report's cursor and
+    transaction aren't left open.
+    """
+    def __init__(self, first_chunk, content):
+        self.first_chunk = first_chunk
+        self.content = content
+
+    def __iter__(self):
+        yield self.first_chunk
+        for chunk in self.content:
+            yield chunk
+
+    def close(self):
+        self.content.close()
+
+
+class CSVBuffer(object):
+    """
+    File-like object used as csv writer output, its content gets popped
+    after every few rows and sent down the response.
+    """
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    def pop(self):
+        data = ''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def csv_stream(form, rows_per_chunk=500):
+    buffer = CSVBuffer()
+    rows = iter(form)
+    try:
+        with csv_writer(buffer) as writer:
+            while True:
+                chunk = list(itertools.islice(rows, rows_per_chunk))
+                map(writer.writerow, chunk)
+                yield buffer.pop()
+                if len(chunk) < rows_per_chunk:
+                    break
+    finally:
+        # ends the report's query if the stream is closed early
+        if hasattr(rows, 'close'):
+            rows.close()
 
 
 @contextlib.contextmanager
@@ -54,8 +112,8 @@ def csv_writer(response):
     yield csv.writer(response)
 
 
-def make_csv_download_response(filename):
-    response = HttpResponse(content_type='text/csv')
+def make_csv_download_response(filename, content):
+    response = StreamingHttpResponse(content, content_type='text/csv')
     response['Content-Disposition'] = 'attachment; filename="%s"' % filename
     return response
 
@@ -0,0 +1,37 @@
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from timer.models import get_billable_time_drift, reconcile_billable_time
+
+
+class Command(BaseCommand):
+
+    option_list = BaseCommand.option_list + (
+        make_option('--dry-run',
+                    action='store_true',
+                    dest='dry_run',
+                    default=False,
+                    help='Only report the drift, don\'t fix it'
+        ),
+    )
+
+    help = ('Recomputes the billable time of each case from its stopped '
+            'timers and fixes the cases where it has drifted')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            drift = get_billable_time_drift()
+        else:
+            drift = reconcile_billable_time()
+
+        for case_id, reference, billable_time, total in drift:
+            self.stdout.write(
+                'Case %s (id %s): billable time %s, timers total %s' % (
+                    reference, case_id, billable_time, int(total)
+                )
+            )
+
+        self.stdout.write('%s case(s) %s' % (
+            len(drift), 'drifted' if options['dry_run'] else 'reconciled'
+        ))
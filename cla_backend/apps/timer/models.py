@@ -1,7 +1,7 @@
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
-from django.db import connection
+from django.db import connection, transaction
 from django_statsd.clients import statsd
 from model_utils.models import TimeStampedModel
 
@@ -35,29 +35,86 @@ class Timer(TimeStampedModel):
         if self.is_stopped():
             raise ValueError(u'The timer has already been stopped')
 
-        last_log = self.log_set.order_by('created').last()  # get last log
-        if not last_log and not cancelled:
+        # case of the last log
+        last_log_case_ids = list(self.log_set.order_by('-created').values_list(
+            'case_id', flat=True
+        )[:1])
+        if not last_log_case_ids and not cancelled:
             raise ValueError(u'You can\'t stop a timer without a log')
 
         # stop and update this model
         self.stopped = timezone.now()  # stop
+        self.modified = self.stopped
         self.cancelled = cancelled
-        if last_log:
-            self.linked_case = last_log.case
-
-        self.save()
-        if self.linked_case:
-            # update billable time on case
-            cursor = connection.cursor()
-            cursor.execute('''
-                select sum(ceiling(EXTRACT(epoch FROM a.stopped-a.created)))
-                    from timer_timer as a
-                    where
-                    a.cancelled = false and
-                    a.stopped is not null and a.linked_case_id = %s''', [self.linked_case.id])
-            total_billable_time, = cursor.fetchone()
-            if total_billable_time:
-                self.linked_case.billable_time = total_billable_time
-                if total_billable_time:
-                    statsd.timing('timer.total_time', total_billable_time * 1000)
-                self.linked_case.save(update_fields=['billable_time'])
+        if last_log_case_ids:
+            self.linked_case_id = last_log_case_ids[0]
+
+        with transaction.atomic():
+            # only if it's still running in the db so that concurrent stops
+            # don't add the duration to the billable time twice
+            stopped = Timer.objects.filter(
+                pk=self.pk, stopped__isnull=True
+            ).update(
+                stopped=self.stopped, cancelled=self.cancelled,
+                linked_case=self.linked_case_id, modified=self.modified
+            )
+            if stopped != 1:
+                raise ValueError(u'The timer has already been stopped')
+
+            if self.linked_case_id and not self.cancelled:
+                # add the duration of this timer to the billable time on case
+                cursor = connection.cursor()
+                cursor.execute('''
+                    update legalaid_case
+                        set billable_time = billable_time + ceiling(EXTRACT(epoch FROM %s - %s))
+                        where id = %s
+                        returning billable_time''',
+                    [self.stopped, self.created, self.linked_case_id])
+                row = cursor.fetchone()
+                if row and row[0]:
+                    statsd.timing('timer.total_time', row[0] * 1000)
+
+
+BILLABLE_TIME_DRIFT_SQL = '''
+    select c.id, c.reference, c.billable_time, coalesce(t.total, 0) as total
+        from legalaid_case as c
+        left outer join (
+            select a.linked_case_id as case_id,
+                sum(ceiling(EXTRACT(epoch FROM a.stopped-a.created))) as total
+                from timer_timer as a
+                where
+                a.cancelled = false and
+                a.stopped is not null and a.linked_case_id is not null
+                group by a.linked_case_id
+        ) as t on t.case_id = c.id
+        where c.billable_time <> coalesce(t.total, 0)
+        order by c.id'''
+
+
+def get_billable_time_drift():
+    """
+    :return: list of (case id, case reference, billable time, total time of
+        the stopped timers) for all the cases where the two don't match.
+    """
+    cursor = connection.cursor()
+    cursor.execute(BILLABLE_TIME_DRIFT_SQL)
+    return cursor.fetchall()
+
+
+def reconcile_billable_time():
+    """
+    Sets the billable time of each case to the total of its stopped timers
+    where they've drifted apart.
+
+    :return: the drift fixed, see `get_billable_time_drift`
+    """
+    cursor = connection.cursor()
+    cursor.execute('''
+        with drift as (%s)
+        update legalaid_case
+            set billable_time = drift.total
+            from drift
+            where legalaid_case.id = drift.id
+            returning drift.id, drift.reference, drift.billable_time, drift.total
+        ''' % BILLABLE_TIME_DRIFT_SQL)
+    return sorted(cursor.fetchall())
@@ -8,7 +8,8 @@ from core.tests.mommy_utils import make_recipe, make_user
 
 from legalaid.models import Case
 
-from timer.models import Timer
+from timer.models import Timer, get_billable_time_drift, \
+    reconcile_billable_time
 
 
 class TimerTestCase(TestCase):
@@ -26,6 +27,19 @@ class TimerTestCase(TestCase):
 
         self.assertRaises(ValueError, timer.stop)
 
+    def test_stop_fails_if_stopped_in_the_meantime(self):
+        timer = make_recipe('timer.Timer', stopped=None)
+        case = make_recipe('legalaid.Case', billable_time=0)
+        make_recipe('cla_eventlog.Log', timer=timer, case=case)
+
+        Timer.objects.get(pk=timer.pk).stop()
+        billable_time = Case.objects.get(pk=case.pk).billable_time
+
+        self.assertRaises(ValueError, timer.stop)
+        self.assertEqual(
+            Case.objects.get(pk=case.pk).billable_time, billable_time
+        )
+
     def test_stop_fails_if_no_log_exists(self):
         timer = make_recipe('timer.Timer', stopped=None)
 
@@ -57,6 +71,8 @@ class TimerTestCase(TestCase):
                 timer5: on case B, by user A, stopped (should be ignored)
                 timer6: on no case, by user A, cancelled (should be ignored)
 
+            case A.billable_time already includes timer1 + timer3
+
             Expected:
                 case A.billable_time == timer1 + timer2 + timer3
         """
@@ -67,7 +83,7 @@ class TimerTestCase(TestCase):
 
         # DATABASE SETUP
 
-        caseA = make_recipe('legalaid.Case')
+        caseA = make_recipe('legalaid.Case', billable_time=7202)
         caseB = make_recipe('legalaid.Case')
 
         userA = make_user()
@@ -111,7 +127,7 @@ class TimerTestCase(TestCase):
 
         # CHECKS BEFORE STOPPING THE TIMER
 
-        self.assertEqual(caseA.billable_time, 0)
+        self.assertEqual(caseA.billable_time, 7202)
         self.assertEqual(caseB.billable_time, 0)
 
         mocked_now.return_value = build_datetime('01/04/2014 11:05:00')
@@ -125,3 +141,55 @@ class TimerTestCase(TestCase):
 
         self.assertEqual(caseA.billable_time, 7502)
         self.assertEqual(caseB.billable_time, 0)
+
+    @mock.patch('timer.models.timezone.now')
+    def test_cancelled_timer_not_billable(self, mocked_now):
+        case = make_recipe('legalaid.Case', billable_time=10)
+        timer = make_recipe('timer.Timer', stopped=None)
+        make_recipe('cla_eventlog.Log', timer=timer, case=case)
+
+        mocked_now.return_value = timer.created + datetime.timedelta(seconds=100)
+        timer.stop(cancelled=True)
+
+        case = Case.objects.get(pk=case.pk)
+        self.assertEqual(case.billable_time, 10)
+
+
+class ReconcileBillableTimeTestCase(TestCase):
+    def make_timer(self, case, seconds, **kwargs):
+        now = timezone.now()
+        return make_recipe(
+            'timer.Timer',
+            created=now - datetime.timedelta(seconds=seconds),
+            stopped=now, linked_case=case, **kwargs
+        )
+
+    def test_drift_reported_and_fixed(self):
+        """
+            case A: billable time 0, timers 10s + 20s => fixed to 30
+            case B: billable time 15, timer 15s => no drift
+            case C: billable time 5, cancelled timer => fixed to 0
+            case D: billable time 0, no timers => no drift
+        """
+        caseA = make_recipe('legalaid.Case', billable_time=0)
+        caseB = make_recipe('legalaid.Case', billable_time=15)
+        caseC = make_recipe('legalaid.Case', billable_time=5)
+        caseD = make_recipe('legalaid.Case', billable_time=0)
+
+        self.make_timer(caseA, 10)
+        self.make_timer(caseA, 20)
+        self.make_timer(caseB, 15)
+        self.make_timer(caseC, 20, cancelled=True)
+
+        expected = [
+            (caseA.pk, caseA.reference, 0, 30),
+            (caseC.pk, caseC.reference, 5, 0),
+        ]
+        self.assertEqual(get_billable_time_drift(), expected)
+        self.assertEqual(reconcile_billable_time(), expected)
+
+        self.assertEqual(Case.objects.get(pk=caseA.pk).billable_time, 30)
+        self.assertEqual(Case.objects.get(pk=caseB.pk).billable_time, 15)
+        self.assertEqual(Case.objects.get(pk=caseC.pk).billable_time, 0)
+        self.assertEqual(Case.objects.get(pk=caseD.pk).billable_time, 0)
+        self.assertEqual(get_billable_time_drift(), [])
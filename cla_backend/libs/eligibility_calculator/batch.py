@@ -0,0 +1,368 @@
+from . import exceptions
+from .rules import get_rules
+
+
+INCOME_FIELDS = (
+    'earnings', 'self_employment_drawings', 'benefits', 'tax_credits',
+    'child_benefits', 'maintenance_received', 'pension', 'other_income'
+)
+
+SAVINGS_FIELDS = (
+    'bank_balance', 'investment_balance', 'credit_balance', 'asset_balance'
+)
+
+DEDUCTIONS_FIELDS = (
+    'income_tax', 'national_insurance', 'maintenance', 'childcare',
+    'mortgage', 'rent', 'criminal_legalaid_contributions'
+)
+
+FACTS_FIELDS = (
+    'is_you_or_your_partner_over_60', 'on_passported_benefits',
+    'on_nass_benefits', 'has_partner', 'is_partner_opponent',
+    'dependants_old', 'dependants_young'
+)
+
+
+def _person_columns(person):
+    columns = ['%s__income__%s' % (person, f) for f in INCOME_FIELDS]
+    columns.append('%s__income__self_employed' % person)
+    columns += ['%s__savings__%s' % (person, f) for f in SAVINGS_FIELDS]
+    columns += ['%s__deductions__%s' % (person, f) for f in DEDUCTIONS_FIELDS]
+    return columns
+
+
+REQUIRED_COLUMNS = ['category', 'property_data'] + \
+    ['facts__%s' % f for f in FACTS_FIELDS] + \
+    _person_columns('you')
+
+# only needed when at least one row has a (non disputed) partner or
+# disputed savings, missing ones default to 0
+OPTIONAL_COLUMNS = _person_columns('partner') + \
+    ['disputed_savings__%s' % f for f in SAVINGS_FIELDS]
+
+COLUMNS = REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+
+
+def to_columns(case_data_dicts):
+    """
+    Transposes a list of dicts in the format accepted by `models.CaseData`
+    into a dict of columns (one list per field) as accepted by
+    `BatchEligibilityChecker`.
+
+    Column names are the nested keys joined by `__`
+    e.g. you__income__earnings.
+    """
+    # each level of nesting is only looked up once per row
+    levels = {(): list(case_data_dicts)}
+
+    def get_level(path):
+        if path not in levels:
+            key = path[-1]
+            levels[path] = [
+                None if parent is None else parent.get(key)
+                for parent in get_level(path[:-1])
+            ]
+        return levels[path]
+
+    columns = dict(
+        (name, get_level(tuple(name.split('__')))) for name in COLUMNS
+    )
+
+    for name in OPTIONAL_COLUMNS:
+        columns[name] = [v or 0 for v in columns[name]]
+    return columns
+
+
+def _sum_columns(*columns):
+    return [sum(values) for values in zip(*columns)]
+
+
+def _capital(rules, properties, non_disputed_liquid_capital, disputed_liquid_capital):
+    """
+    Same as `calculator.CapitalCalculator.calculate_capital` without
+    building the intermediate objects.
+    """
+    mortgage_disregard_available = rules.mortgage_disregard
+    SMOD_disregard_available = rules.smod_disregard
+    equity_disregard = rules.equity_disregard
+
+    property_capital = 0
+    if properties:
+        main_index = None
+        for index, prop in enumerate(properties):
+            if prop['main']:
+                main_index = index
+                break
+        other_indexes = [
+            index for index, prop in enumerate(properties) if not prop['main']
+        ]
+        main_indexes = [] if main_index is None else [main_index]
+        equities = [0] * len(properties)
+
+        # calculating equities
+        for index in other_indexes + main_indexes:
+            prop = properties[index]
+            if any(v is None for v in prop.values()):
+                continue
+            mortgage_disregard = min(prop['mortgage_left'], mortgage_disregard_available)
+            property_equity = (prop['value'] - mortgage_disregard) * prop['share'] / 100
+            mortgage_disregard_available -= mortgage_disregard
+            equities[index] = max(property_equity, 0)
+
+        # applying SMOD disregard
+        for index in main_indexes + other_indexes:
+            if not properties[index]['disputed']:
+                continue
+            SMOD_disregard = min(equities[index], SMOD_disregard_available)
+            equities[index] = max(equities[index] - SMOD_disregard, 0)
+            SMOD_disregard_available -= SMOD_disregard
+
+        # applying equity disregard (to main home only)
+        for index in main_indexes:
+            equities[index] = max(equities[index] - equity_disregard, 0)
+
+        property_capital = sum(equities)
+
+    SMOD_disregard = min(disputed_liquid_capital, SMOD_disregard_available)
+    liquid_capital = max(disputed_liquid_capital - SMOD_disregard, 0)
+    liquid_capital += non_disputed_liquid_capital
+
+    return property_capital + liquid_capital
+
+
+class cached_column(object):
+    def __init__(self, func):
+        self.func = func
+
+    def __get__(self, instance, type=None):
+        if instance is None:
+            return self
+        res = instance.__dict__[self.func.__name__] = self.func(instance)
+        return res
+
+
+class BatchEligibilityChecker(object):
+    """
+    Columnar equivalent of `calculator.EligibilityChecker`.
+
+    Takes a dict of columns (see `COLUMNS` and `to_columns`), all of the
+    same length, and computes each figure for all the rows in one go
+    without building `CaseData` objects.
+
+    Each row gives exactly the same results as
+    `EligibilityChecker(CaseData(**row), rules=rules, as_of=as_of)`.
+    """
+
+    def __init__(self, columns, rules=None, as_of=None):
+        super(BatchEligibilityChecker, self).__init__()
+        self.rules = rules or get_rules(as_of)
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            raise exceptions.PropertyExpectedException(
+                "Missing columns: %s" % ', '.join(sorted(missing))
+            )
+
+        self.size = len(columns['category'])
+        self.columns = dict(columns)
+        for name in OPTIONAL_COLUMNS:
+            if name not in self.columns:
+                self.columns[name] = [0] * self.size
+
+        for name, column in self.columns.items():
+            if len(column) != self.size:
+                raise exceptions.InvalidStateException(
+                    "Column '%s' has %s rows, expected %s" % (
+                        name, len(column), self.size
+                    )
+                )
+
+    def __len__(self):
+        return self.size
+
+    def _col(self, name):
+        return self.columns[name]
+
+    def _total(self, person, group, fields):
+        return _sum_columns(*[
+            self._col('%s__%s__%s' % (person, group, f)) for f in fields
+        ])
+
+    def _partner_only(self, column):
+        return [
+            v if aggregate else 0
+            for v, aggregate in zip(column, self.should_aggregate_partner)
+        ]
+
+    @cached_column
+    def has_partner(self):
+        return [bool(v) for v in self._col('facts__has_partner')]
+
+    @cached_column
+    def should_aggregate_partner(self):
+        return [
+            has_partner and not opponent
+            for has_partner, opponent in zip(
+                self.has_partner, self._col('facts__is_partner_opponent')
+            )
+        ]
+
+    @cached_column
+    def dependant_children(self):
+        return _sum_columns(
+            self._col('facts__dependants_old'),
+            self._col('facts__dependants_young')
+        )
+
+    @cached_column
+    def gross_income(self):
+        return _sum_columns(
+            self._total('you', 'income', INCOME_FIELDS),
+            self._partner_only(self._total('partner', 'income', INCOME_FIELDS))
+        )
+
+    @cached_column
+    def partner_allowance(self):
+        allowance = self.rules.partner_allowance
+        return [allowance if v else 0 for v in self.has_partner]
+
+    def _employment_allowance(self, person):
+        allowance = self.rules.employment_costs_allowance
+        return [
+            allowance if earnings and not self_employed else 0
+            for earnings, self_employed in zip(
+                self._col('%s__income__earnings' % person),
+                self._col('%s__income__self_employed' % person)
+            )
+        ]
+
+    @cached_column
+    def employment_allowance(self):
+        return self._employment_allowance('you')
+
+    @cached_column
+    def partner_employment_allowance(self):
+        return self._partner_only(self._employment_allowance('partner'))
+
+    @cached_column
+    def dependants_allowance(self):
+        allowance = self.rules.child_allowance
+        return [children * allowance for children in self.dependant_children]
+
+    @cached_column
+    def housing(self):
+        cap = self.rules.childless_housing_cap
+        mortgage_or_rent = _sum_columns(
+            self._col('you__deductions__mortgage'),
+            self._col('you__deductions__rent'),
+            self._partner_only(self._col('partner__deductions__mortgage')),
+            self._partner_only(self._col('partner__deductions__rent'))
+        )
+        return [
+            v if children else min(v, cap)
+            for v, children in zip(mortgage_or_rent, self.dependant_children)
+        ]
+
+    @cached_column
+    def disposable_income(self):
+        fields = (
+            'income_tax', 'national_insurance', 'maintenance',
+            'criminal_legalaid_contributions', 'childcare'
+        )
+        deductions = _sum_columns(
+            self.partner_allowance,
+            self.dependants_allowance,
+            self._total('you', 'deductions', fields),
+            self._partner_only(self._total('partner', 'deductions', fields)),
+            self.housing,
+            self.employment_allowance,
+            self.partner_employment_allowance
+        )
+        return [
+            gross - deduction
+            for gross, deduction in zip(self.gross_income, deductions)
+        ]
+
+    @cached_column
+    def pensioner_disregard(self):
+        get_disregard = self.rules.get_pensioner_disregard
+        return [
+            get_disregard(disposable_income) if over_60 else 0
+            for disposable_income, over_60 in zip(
+                self.disposable_income,
+                self._col('facts__is_you_or_your_partner_over_60')
+            )
+        ]
+
+    @cached_column
+    def non_disputed_liquid_capital(self):
+        return _sum_columns(
+            self._total('you', 'savings', SAVINGS_FIELDS),
+            self._partner_only(self._total('partner', 'savings', SAVINGS_FIELDS))
+        )
+
+    @cached_column
+    def disputed_liquid_capital(self):
+        return _sum_columns(*[
+            self._col('disputed_savings__%s' % f) for f in SAVINGS_FIELDS
+        ])
+
+    @cached_column
+    def disposable_capital_assets(self):
+        return [
+            max(_capital(self.rules, *row[:3]) - row[3], 0)
+            for row in zip(
+                self._col('property_data'),
+                self.non_disputed_liquid_capital,
+                self.disputed_liquid_capital,
+                self.pensioner_disregard
+            )
+        ]
+
+    def is_gross_income_eligible(self):
+        get_limit = self.rules.get_gross_income_limit
+        return [
+            bool(passported) or gross_income <= get_limit(children)
+            for passported, gross_income, children in zip(
+                self._col('facts__on_passported_benefits'),
+                self.gross_income,
+                self.dependant_children
+            )
+        ]
+
+    def is_disposable_income_eligible(self):
+        limit = self.rules.disposable_income_limit
+        return [
+            bool(passported) or disposable_income <= limit
+            for passported, disposable_income in zip(
+                self._col('facts__on_passported_benefits'),
+                self.disposable_income
+            )
+        ]
+
+    def is_disposable_capital_eligible(self):
+        get_limit = self.rules.get_capital_limit
+        return [
+            capital <= get_limit(category)
+            for capital, category in zip(
+                self.disposable_capital_assets, self._col('category')
+            )
+        ]
+
+    def should_passport_nass(self):
+        return [
+            bool(nass) and category == 'immigration'
+            for nass, category in zip(
+                self._col('facts__on_nass_benefits'), self._col('category')
+            )
+        ]
+
+    def is_eligible(self):
+        return [
+            nass or (capital and gross and disposable)
+            for nass, capital, gross, disposable in zip(
+                self.should_passport_nass(),
+                self.is_disposable_capital_eligible(),
+                self.is_gross_income_eligible(),
+                self.is_disposable_income_eligible()
+            )
+        ]
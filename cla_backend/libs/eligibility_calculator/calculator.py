@@ -1,4 +1,4 @@
-from . import constants
+from .rules import get_rules
 
 
 class cached_calcs_property(object):
@@ -20,7 +20,8 @@ class cached_calcs_property(object):
 
 
 class CapitalCalculator(object):
-    def __init__(self, properties=[], non_disputed_liquid_capital=0, disputed_liquid_capital=0, calcs={}):
+    def __init__(self, properties=[], non_disputed_liquid_capital=0, disputed_liquid_capital=0, calcs={}, rules=None):
+        self.rules = rules or get_rules()
         self.properties = self._parse_props(properties)
         self.non_disputed_liquid_capital = non_disputed_liquid_capital
         self.disputed_liquid_capital = disputed_liquid_capital
@@ -95,9 +96,9 @@ class CapitalCalculator(object):
         prop['equity'] = max(prop['equity'] - self.equity_disregard_available, 0)
 
     def _reset_state(self):
-        self.mortgage_disregard_available = constants.disposable_capital.MORTGAGE_DISREGARD
-        self.SMOD_disregard_available = constants.disposable_capital.SMOD_DISREGARD
-        self.equity_disregard_available = constants.disposable_capital.EQUITY_DISREGARD
+        self.mortgage_disregard_available = self.rules.mortgage_disregard
+        self.SMOD_disregard_available = self.rules.smod_disregard
+        self.equity_disregard_available = self.rules.equity_disregard
 
         for prop in self.properties:
             prop['equity'] = 0
@@ -152,10 +153,15 @@ class CapitalCalculator(object):
 
 
 class EligibilityChecker(object):
-    def __init__(self, case_data, calcs=None):
+    def __init__(self, case_data, calcs=None, rules=None, as_of=None):
+        """
+        :param rules: `rules.RuleSet` to use, defaults to the one in force
+            on `as_of` (default: today).
+        """
         super(EligibilityChecker, self).__init__()
         self.case_data = case_data
         self.calcs = calcs or {}
+        self.rules = rules or get_rules(as_of)
 
     @cached_calcs_property
     def gross_income(self):
@@ -164,32 +170,32 @@ class EligibilityChecker(object):
     @cached_calcs_property
     def partner_allowance(self):
         if self.case_data.facts.has_partner:
-            return constants.disposable_income.PARTNER_ALLOWANCE
+            return self.rules.partner_allowance
         return 0
 
     @cached_calcs_property
     def employment_allowance(self):
         if self.case_data.you.income.has_employment_earnings and not self.case_data.you.income.self_employed:
-            return constants.disposable_income.EMPLOYMENT_COSTS_ALLOWANCE
+            return self.rules.employment_costs_allowance
         return 0
 
     @cached_calcs_property
     def partner_employment_allowance(self):
         if self.case_data.facts.has_partner and self.case_data.facts.should_aggregate_partner:
             if self.case_data.partner.income.has_employment_earnings and not self.case_data.partner.income.self_employed:
-                return constants.disposable_income.EMPLOYMENT_COSTS_ALLOWANCE
+                return self.rules.employment_costs_allowance
             return 0
         return 0
 
     @cached_calcs_property
     def dependants_allowance(self):
         # TODO 2 values for children...
-        return self.case_data.facts.dependant_children * constants.disposable_income.CHILD_ALLOWANCE
+        return self.case_data.facts.dependant_children * self.rules.child_allowance
 
     @cached_calcs_property
     def pensioner_disregard(self):
         if self.case_data.facts.is_you_or_your_partner_over_60:
-            return constants.disposable_capital.PENSIONER_DISREGARD_LIMIT_LEVELS.get(max(self.disposable_income, 0), 0)
+            return self.rules.get_pensioner_disregard(self.disposable_income)
         return 0
 
     @cached_calcs_property
@@ -224,7 +230,7 @@ class EligibilityChecker(object):
                 mortgage_or_rent += self.case_data.partner.deductions.rent
 
             if not self.case_data.facts.dependant_children:
-                mortgage_or_rent = min(mortgage_or_rent, constants.disposable_income.CHILDLESS_HOUSING_CAP)
+                mortgage_or_rent = min(mortgage_or_rent, self.rules.childless_housing_cap)
             gross_income -= mortgage_or_rent
 
             # employment allowance
@@ -254,8 +260,8 @@ class EligibilityChecker(object):
                 properties=self.case_data.property_data,
                 non_disputed_liquid_capital=self.case_data.non_disputed_liquid_capital,
                 disputed_liquid_capital=self.case_data.disputed_liquid_capital,
-                calcs=self.calcs
-
+                calcs=self.calcs,
+                rules=self.rules
             )
             disposable_capital = capital_calc.calculate_capital()
 
@@ -271,17 +277,17 @@ class EligibilityChecker(object):
         if self.case_data.facts.on_passported_benefits:
             return True
 
-        limit = constants.gross_income.get_limit(self.case_data.facts.dependant_children)
+        limit = self.rules.get_gross_income_limit(self.case_data.facts.dependant_children)
         return self.gross_income <= limit
 
     def is_disposable_income_eligible(self):
         if self.case_data.facts.on_passported_benefits:
             return True
 
-        return self.disposable_income <= constants.disposable_income.LIMIT
+        return self.disposable_income <= self.rules.disposable_income_limit
 
     def is_disposable_capital_eligible(self):
-        limit = constants.disposable_capital.get_limit(self.case_data.category)
+        limit = self.rules.get_capital_limit(self.case_data.category)
         return self.disposable_capital_assets <= limit
 
     def is_eligible(self):
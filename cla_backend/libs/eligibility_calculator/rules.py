@@ -0,0 +1,142 @@
+import datetime
+from bisect import bisect_right
+
+from . import constants
+from . import exceptions
+from .util import BetweenDict
+
+
+class RuleSet(object):
+    """
+    Immutable set of limits, allowances and disregards in force from
+    `effective_from` until the next rule set.
+
+    Banded values (e.g. the pensioner disregard) are compiled into
+    `BetweenDict`s when the rule set is created so that each lookup is a
+    bisect.
+    """
+    FIELDS = (
+        'mortgage_disregard', 'smod_disregard', 'equity_disregard',
+        'capital_limits', 'default_capital_limit',
+        'pensioner_disregard_limit_levels',
+        'disposable_income_limit', 'partner_allowance', 'child_allowance',
+        'childless_housing_cap', 'employment_costs_allowance',
+        'gross_income_base_limit', 'inclusive_children_base',
+        'extra_child_modifier'
+    )
+
+    def __init__(self, effective_from, **values):
+        missing = [f for f in self.FIELDS if f not in values]
+        extra = [f for f in values if f not in self.FIELDS]
+        if missing or extra:
+            raise ValueError(
+                u'Invalid rule set fields, missing: %s, unknown: %s' % (
+                    ', '.join(sorted(missing)), ', '.join(sorted(extra))
+                )
+            )
+
+        levels = values['pensioner_disregard_limit_levels']
+        if not isinstance(levels, BetweenDict):
+            values['pensioner_disregard_limit_levels'] = BetweenDict(levels)
+        values['capital_limits'] = tuple(sorted(
+            dict(values['capital_limits']).items()
+        ))
+
+        set_attr = super(RuleSet, self).__setattr__
+        set_attr('effective_from', effective_from)
+        for name, value in values.items():
+            set_attr(name, value)
+        set_attr('_capital_limits', dict(self.capital_limits))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(u'Rule sets cannot be changed')
+
+    def __delattr__(self, name):
+        raise AttributeError(u'Rule sets cannot be changed')
+
+    def __repr__(self):
+        return '<RuleSet effective from %s>' % self.effective_from
+
+    @classmethod
+    def from_constants(cls, effective_from):
+        """
+        Builds a rule set from the values in `constants`.
+        """
+        disposable_capital = constants.disposable_capital
+        disposable_income = constants.disposable_income
+        gross_income = constants.gross_income
+        return cls(
+            effective_from,
+            mortgage_disregard=disposable_capital.MORTGAGE_DISREGARD,
+            smod_disregard=disposable_capital.SMOD_DISREGARD,
+            equity_disregard=disposable_capital.EQUITY_DISREGARD,
+            capital_limits={
+                'immigration': disposable_capital.LIMIT_IMMIGRATION
+            },
+            default_capital_limit=disposable_capital.LIMIT_DEFAULT,
+            pensioner_disregard_limit_levels=disposable_capital.PENSIONER_DISREGARD_LIMIT_LEVELS,
+            disposable_income_limit=disposable_income.LIMIT,
+            partner_allowance=disposable_income.PARTNER_ALLOWANCE,
+            child_allowance=disposable_income.CHILD_ALLOWANCE,
+            childless_housing_cap=disposable_income.CHILDLESS_HOUSING_CAP,
+            employment_costs_allowance=disposable_income.EMPLOYMENT_COSTS_ALLOWANCE,
+            gross_income_base_limit=gross_income.BASE_LIMIT,
+            inclusive_children_base=gross_income.INCLUSIVE_CHILDREN_BASE,
+            extra_child_modifier=gross_income.EXTRA_CHILD_MODIFIER
+        )
+
+    def get_capital_limit(self, category):
+        return self._capital_limits.get(category, self.default_capital_limit)
+
+    def get_gross_income_limit(self, dependant_children=0):
+        extra_children = max(0, dependant_children - self.inclusive_children_base)
+        return self.gross_income_base_limit + \
+            extra_children * self.extra_child_modifier
+
+    def get_pensioner_disregard(self, disposable_income):
+        return self.pensioner_disregard_limit_levels.get(
+            max(disposable_income, 0), 0
+        )
+
+
+class RuleSets(object):
+    """
+    Rule sets sorted by `effective_from`, `get` returns the one in force
+    on a given date.
+    """
+    def __init__(self, rule_sets):
+        rule_sets = sorted(rule_sets, key=lambda rules: rules.effective_from)
+        dates = [rules.effective_from for rules in rule_sets]
+        if len(set(dates)) != len(dates):
+            raise ValueError(u'Rule sets with the same effective date')
+
+        self._dates = tuple(dates)
+        self._rule_sets = tuple(rule_sets)
+
+    def __len__(self):
+        return len(self._rule_sets)
+
+    def get(self, as_of=None):
+        if as_of is None:
+            as_of = datetime.date.today()
+        elif isinstance(as_of, datetime.datetime):
+            as_of = as_of.date()
+
+        index = bisect_right(self._dates, as_of) - 1
+        if index < 0:
+            raise exceptions.InvalidStateException(
+                "No eligibility rules in force on %s" % as_of
+            )
+        return self._rule_sets[index]
+
+
+RULE_SETS = RuleSets([
+    RuleSet.from_constants(datetime.date(2013, 4, 1))
+])
+
+
+def get_rules(as_of=None):
+    """
+    Returns the rule set in force on `as_of` (default: today).
+    """
+    return RULE_SETS.get(as_of)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import random
+
+from ..batch import BatchEligibilityChecker, to_columns
+from ..calculator import EligibilityChecker
+from ..exceptions import PropertyExpectedException
+from ..models import CaseData
+from .. import constants
+
+from . import fixtures
+
+
+def random_money(max_value=5000000):
+    return random.choice([0, 0, random.randint(0, max_value)])
+
+
+def random_person():
+    return {
+        'income': {
+            'earnings': random_money(300000),
+            'self_employment_drawings': random_money(100000),
+            'benefits': random_money(50000),
+            'tax_credits': random_money(50000),
+            'child_benefits': random_money(20000),
+            'maintenance_received': random_money(50000),
+            'pension': random_money(100000),
+            'other_income': random_money(50000),
+            'self_employed': random.choice([True, False]),
+        },
+        'savings': {
+            'bank_balance': random_money(),
+            'investment_balance': random_money(),
+            'credit_balance': random_money(),
+            'asset_balance': random_money(),
+        },
+        'deductions': {
+            'income_tax': random_money(50000),
+            'national_insurance': random_money(20000),
+            'maintenance': random_money(20000),
+            'childcare': random_money(30000),
+            'mortgage': random_money(100000),
+            'rent': random_money(100000),
+            'criminal_legalaid_contributions': random_money(10000),
+        }
+    }
+
+
+def random_property(main):
+    return {
+        'value': random.choice([None, random_money(50000000)]),
+        'mortgage_left': random_money(30000000),
+        'share': random.choice([None, 50, 100, random.randint(0, 100)]),
+        'disputed': random.choice([True, False]),
+        'main': main
+    }
+
+
+def random_case_data():
+    case_data = {
+        'category': random.choice([u'immigration', u'debt', u'housing', None]),
+        'facts': {
+            'is_you_or_your_partner_over_60': random.choice([True, False]),
+            'on_passported_benefits': random.choice([True, False, False]),
+            'on_nass_benefits': random.choice([True, False, False]),
+            'has_partner': random.choice([True, False]),
+            'is_partner_opponent': random.choice([True, False]),
+            'dependants_young': random.randint(0, 6),
+            'dependants_old': random.randint(0, 3)
+        },
+        'you': random_person(),
+        'partner': random_person(),
+        'property_data': [
+            random_property(main=(i == 0)) for i in range(random.randint(0, 3))
+        ],
+    }
+    if random.choice([True, False]):
+        case_data['disputed_savings'] = random_person()['savings']
+    return case_data
+
+
+class BatchEligibilityCheckerTestCase(unittest.TestCase):
+
+    def assertMatchesChecker(self, case_data_dicts):
+        batch = BatchEligibilityChecker(to_columns(case_data_dicts))
+        self.assertEqual(len(batch), len(case_data_dicts))
+
+        is_eligible = batch.is_eligible()
+        for i, case_data_dict in enumerate(case_data_dicts):
+            checker = EligibilityChecker(CaseData(**case_data_dict))
+            self.assertEqual(is_eligible[i], checker.is_eligible(), case_data_dict)
+            self.assertEqual(batch.gross_income[i], checker.gross_income)
+            self.assertEqual(batch.disposable_income[i], checker.disposable_income)
+            self.assertEqual(
+                batch.disposable_capital_assets[i],
+                checker.disposable_capital_assets
+            )
+
+    def test_default_case_data(self):
+        self.assertMatchesChecker([fixtures.get_default_case_data()])
+
+    def test_limits(self):
+        self.assertMatchesChecker([
+            fixtures.get_default_case_data(
+                you__income__earnings=constants.gross_income.BASE_LIMIT
+            ),
+            fixtures.get_default_case_data(
+                you__income__earnings=constants.gross_income.BASE_LIMIT + 1
+            ),
+            fixtures.get_default_case_data(
+                you__savings__bank_balance=constants.disposable_capital.LIMIT_DEFAULT + 1
+            ),
+            fixtures.get_default_case_data(
+                category=u'immigration',
+                you__savings__bank_balance=constants.disposable_capital.LIMIT_IMMIGRATION + 1
+            ),
+        ])
+
+    def test_random_scenarios(self):
+        random.seed(0)
+        self.assertMatchesChecker([random_case_data() for i in range(2000)])
+
+    def test_missing_columns(self):
+        columns = to_columns([fixtures.get_default_case_data()])
+        del columns['you__income__earnings']
+        self.assertRaises(
+            PropertyExpectedException, BatchEligibilityChecker, columns
+        )
+
+    def test_partner_columns_are_optional(self):
+        columns = to_columns([fixtures.get_default_case_data()])
+        for name in columns.keys():
+            if name.startswith('partner__'):
+                del columns[name]
+        self.assertEqual(BatchEligibilityChecker(columns).is_eligible(), [True])
@@ -6,6 +6,7 @@ import random
 
 from ..calculator import EligibilityChecker, CapitalCalculator
 from ..models import CaseData, Facts
+from ..rules import RuleSet
 from .. import constants
 
 from . import fixtures
@@ -1186,8 +1187,8 @@ class GrossIncomeTestCase(CalculatorTestBase):
         """
         TEST: eligibility depends on mocked limit
         """
-        with mock.patch.object(constants, 'gross_income') as mocked_constant_gross_income:
-            mocked_constant_gross_income.get_limit.return_value = 500
+        with mock.patch.object(RuleSet, 'get_gross_income_limit') as mocked_get_limit:
+            mocked_get_limit.return_value = 500
             case_data = mock.MagicMock()
             type(case_data.facts).on_passported_benefits = mock.PropertyMock(return_value=False)
             type(case_data.facts).dependant_children = mock.PropertyMock(return_value=0)
@@ -1198,15 +1199,15 @@ class GrossIncomeTestCase(CalculatorTestBase):
                 mocked_gross_income.return_value = 500
                 ec = EligibilityChecker(case_data)
                 self.assertTrue(ec.is_gross_income_eligible())
-                mocked_constant_gross_income.get_limit.assert_called_with(0)
+                mocked_get_limit.assert_called_with(0)
                 mocked_gross_income.assert_called_once_with()
 
     def test_is_gross_income_eligible_under_limit(self):
         """
         TEST: eligibility depends on mocked limit
         """
-        with mock.patch.object(constants, 'gross_income') as mocked_constant_gross_income:
-            mocked_constant_gross_income.get_limit.return_value = 500
+        with mock.patch.object(RuleSet, 'get_gross_income_limit') as mocked_get_limit:
+            mocked_get_limit.return_value = 500
             case_data = mock.MagicMock()
             type(case_data.facts).on_passported_benefits = mock.PropertyMock(return_value=False)
             type(case_data.facts).dependant_children = mock.PropertyMock(return_value=0)
@@ -1217,15 +1218,15 @@ class GrossIncomeTestCase(CalculatorTestBase):
                 mocked_gross_income.return_value = 499
                 ec = EligibilityChecker(case_data)
                 self.assertTrue(ec.is_gross_income_eligible())
-                mocked_constant_gross_income.get_limit.assert_called_with(0)
+                mocked_get_limit.assert_called_with(0)
                 mocked_gross_income.assert_called_once_with()
 
     def test_is_gross_income_not_eligible(self):
         """
         TEST: eligibility depends on mocked limit
         """
-        with mock.patch.object(constants, 'gross_income') as mocked_constant_gross_income:
-            mocked_constant_gross_income.get_limit.return_value = 500
+        with mock.patch.object(RuleSet, 'get_gross_income_limit') as mocked_get_limit:
+            mocked_get_limit.return_value = 500
             case_data = mock.MagicMock()
             type(case_data.facts).on_passported_benefits = mock.PropertyMock(return_value=False)
             type(case_data.facts).dependant_children = mock.PropertyMock(return_value=0)
@@ -1236,7 +1237,7 @@ class GrossIncomeTestCase(CalculatorTestBase):
                 mocked_gross_income.return_value = 501
                 ec = EligibilityChecker(case_data)
                 self.assertFalse(ec.is_gross_income_eligible())
-                mocked_constant_gross_income.get_limit.assert_called_with(0)
+                mocked_get_limit.assert_called_with(0)
                 mocked_gross_income.assert_called_once_with()
 
 
@@ -1671,15 +1672,15 @@ class DisposableCapitalTestCase(unittest.TestCase):
 
         pensioner_disregard_limit = 5000000
         with mock.patch.object(
-            constants.disposable_capital, 'PENSIONER_DISREGARD_LIMIT_LEVELS'
+            RuleSet, 'get_pensioner_disregard'
         ) as mocked_pensioner_disregard:
-            mocked_pensioner_disregard.get.return_value = pensioner_disregard_limit
+            mocked_pensioner_disregard.return_value = pensioner_disregard_limit
             ec = EligibilityChecker(case_data)
 
             expected_value = case_data.non_disputed_liquid_capital - pensioner_disregard_limit
 
             self.assertEqual(expected_value, ec.disposable_capital_assets)
-            self.assertEqual(mocked_pensioner_disregard.get.called, True)
+            self.assertEqual(mocked_pensioner_disregard.called, True)
 
     def test_disposable_capital_assets_subtracts_pensioner_disregard_but_cant_be_negative(self):
         """
@@ -1708,15 +1709,15 @@ class DisposableCapitalTestCase(unittest.TestCase):
 
         pensioner_disregard_limit = 5000000
         with mock.patch.object(
-            constants.disposable_capital, 'PENSIONER_DISREGARD_LIMIT_LEVELS'
+            RuleSet, 'get_pensioner_disregard'
         ) as mocked_pensioner_disregard:
-            mocked_pensioner_disregard.get.return_value = pensioner_disregard_limit
+            mocked_pensioner_disregard.return_value = pensioner_disregard_limit
             ec = EligibilityChecker(case_data)
 
             expected_value = 0
 
             self.assertEqual(expected_value, ec.disposable_capital_assets)
-            self.assertEqual(mocked_pensioner_disregard.get.called, True)
+            self.assertEqual(mocked_pensioner_disregard.called, True)
 
     #here
 
@@ -1724,7 +1725,7 @@ class DisposableCapitalTestCase(unittest.TestCase):
         """
         TEST: with mocked disposable_capital_assets and get_limit
         """
-        with mock.patch.object(constants.disposable_capital, 'get_limit') as mocked_get_limit:
+        with mock.patch.object(RuleSet, 'get_capital_limit') as mocked_get_limit:
             mocked_get_limit.return_value = 700000
             case_data = mock.MagicMock()
             type(case_data).category = mock.PropertyMock(return_value=u'blah blah')
@@ -1742,7 +1743,7 @@ class DisposableCapitalTestCase(unittest.TestCase):
         """
         TEST: with mocked disposable_capital_assets and get_limit
         """
-        with mock.patch.object(constants.disposable_capital, 'get_limit') as mocked_get_limit:
+        with mock.patch.object(RuleSet, 'get_capital_limit') as mocked_get_limit:
             mocked_get_limit.return_value = 700000
             case_data = mock.MagicMock()
             type(case_data).category = mock.PropertyMock(return_value=u'blah blah')
@@ -1760,7 +1761,7 @@ class DisposableCapitalTestCase(unittest.TestCase):
         """
         TEST: with mocked disposable_capital_assets and get_limit
         """
-        with mock.patch.object(constants.disposable_capital, 'get_limit') as mocked_get_limit:
+        with mock.patch.object(RuleSet, 'get_capital_limit') as mocked_get_limit:
             mocked_get_limit.return_value = 700000
             case_data = mock.MagicMock()
             type(case_data).category = mock.PropertyMock(return_value=u'blah blah')
@@ -0,0 +1,148 @@
+import datetime
+import unittest
+
+from ..calculator import EligibilityChecker
+from ..exceptions import InvalidStateException
+from ..models import CaseData
+from ..rules import RuleSet, RuleSets, get_rules
+from ..util import BetweenDict
+from .. import constants
+
+from . import fixtures
+
+
+def make_rule_set(effective_from, **values):
+    rules = get_rules()
+    data = dict((f, getattr(rules, f)) for f in RuleSet.FIELDS)
+    data.update(values)
+    return RuleSet(effective_from, **data)
+
+
+class RuleSetTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rules = RuleSet.from_constants(datetime.date(2013, 4, 1))
+
+    def test_from_constants(self):
+        self.assertEqual(
+            self.rules.disposable_income_limit, constants.disposable_income.LIMIT
+        )
+        self.assertEqual(
+            self.rules.partner_allowance,
+            constants.disposable_income.PARTNER_ALLOWANCE
+        )
+        self.assertEqual(
+            self.rules.mortgage_disregard,
+            constants.disposable_capital.MORTGAGE_DISREGARD
+        )
+
+    def test_get_capital_limit(self):
+        for category in ['immigration', 'debt', None]:
+            self.assertEqual(
+                self.rules.get_capital_limit(category),
+                constants.disposable_capital.get_limit(category)
+            )
+
+    def test_get_gross_income_limit(self):
+        for children in range(0, 8):
+            self.assertEqual(
+                self.rules.get_gross_income_limit(children),
+                constants.gross_income.get_limit(children)
+            )
+
+    def test_get_pensioner_disregard(self):
+        levels = constants.disposable_capital.PENSIONER_DISREGARD_LIMIT_LEVELS
+        for income in [-100, 0, 2500, 2501, 22500, 31500]:
+            self.assertEqual(
+                self.rules.get_pensioner_disregard(income),
+                levels.get(max(income, 0), 0)
+            )
+        self.assertEqual(self.rules.get_pensioner_disregard(31501), 0)
+
+    def test_bands_compiled(self):
+        rules = make_rule_set(
+            datetime.date(2014, 4, 1),
+            pensioner_disregard_limit_levels={(0, 10): 5, (10, 20): 3}
+        )
+        self.assertTrue(
+            isinstance(rules.pensioner_disregard_limit_levels, BetweenDict)
+        )
+        self.assertEqual(rules.get_pensioner_disregard(9), 5)
+        self.assertEqual(rules.get_pensioner_disregard(10), 3)
+        self.assertEqual(rules.get_pensioner_disregard(20), 0)
+
+    def test_immutable(self):
+        def set_limit():
+            self.rules.disposable_income_limit = 1
+
+        def del_limit():
+            del self.rules.disposable_income_limit
+
+        self.assertRaises(AttributeError, set_limit)
+        self.assertRaises(AttributeError, del_limit)
+
+    def test_invalid_fields(self):
+        self.assertRaises(ValueError, RuleSet, datetime.date(2014, 4, 1))
+        self.assertRaises(
+            ValueError, make_rule_set, datetime.date(2014, 4, 1), invalid=1
+        )
+
+
+class RuleSetsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rules_2013 = make_rule_set(datetime.date(2013, 4, 1))
+        self.rules_2014 = make_rule_set(datetime.date(2014, 4, 1))
+        self.rule_sets = RuleSets([self.rules_2014, self.rules_2013])
+
+    def test_get_by_date(self):
+        self.assertEqual(
+            self.rule_sets.get(datetime.date(2013, 4, 1)), self.rules_2013
+        )
+        self.assertEqual(
+            self.rule_sets.get(datetime.date(2014, 3, 31)), self.rules_2013
+        )
+        self.assertEqual(
+            self.rule_sets.get(datetime.date(2014, 4, 1)), self.rules_2014
+        )
+        self.assertEqual(
+            self.rule_sets.get(datetime.datetime(2020, 1, 1, 10)),
+            self.rules_2014
+        )
+        self.assertEqual(self.rule_sets.get(), self.rules_2014)
+
+    def test_get_before_first(self):
+        self.assertRaises(
+            InvalidStateException,
+            self.rule_sets.get, datetime.date(2013, 3, 31)
+        )
+
+    def test_same_effective_date(self):
+        self.assertRaises(
+            ValueError, RuleSets,
+            [self.rules_2013, make_rule_set(datetime.date(2013, 4, 1))]
+        )
+
+
+class EligibilityCheckerRulesTestCase(unittest.TestCase):
+    def test_defaults_to_rules_in_force(self):
+        case_data = CaseData(**fixtures.get_default_case_data())
+        ec = EligibilityChecker(case_data)
+        self.assertEqual(ec.rules, get_rules())
+
+    def test_rule_sets_side_by_side(self):
+        """
+        The same case evaluated under two rule sets in the same process
+        """
+        case_data = fixtures.get_default_case_data(
+            you__income__earnings=constants.gross_income.BASE_LIMIT + 1
+        )
+        old_rules = get_rules()
+        new_rules = make_rule_set(
+            datetime.date(2014, 4, 1),
+            gross_income_base_limit=constants.gross_income.BASE_LIMIT + 1
+        )
+
+        old_ec = EligibilityChecker(CaseData(**case_data), rules=old_rules)
+        new_ec = EligibilityChecker(CaseData(**case_data), rules=new_rules)
+
+        self.assertFalse(old_ec.is_gross_income_eligible())
+        self.assertTrue(new_ec.is_gross_income_eligible())
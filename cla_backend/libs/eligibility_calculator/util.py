@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from collections import Mapping
 
 
@@ -14,31 +15,36 @@ class BetweenDict(Mapping):
         where:
             (0, 10) == (<lower value included>, <upper value excluded>)
 
+        The ranges are kept sorted by lower bound so that lookups are a
+        bisect on the lower bounds instead of a scan of all the ranges.
 
         NOTE:
             1. You cannot iterate over the between dict
             2. You cannot delete elements in the between dict
             2. len(betweenDict) will return the number of keys not expanded
         """
-        self.store = dict()
-
-        for k, v in d.items():
+        for k in d.keys():
             if k[0] >= k[1]:
-                raise ValueError(u'Invalid range (%s, %s)' % k[0], k[1])
+                raise ValueError(u'Invalid range (%s, %s)' % k)
+
+        keys = sorted(d.keys())
+        for previous, k in zip(keys, keys[1:]):
+            if k[0] < previous[1]:
+                raise ValueError(u'Overlapping key spaces')
 
-            for lower, upper in self.store.keys():
-                if not (k[1] <= lower or k[0] >= upper):
-                    raise ValueError(u'Overlapping key spaces')
-            self.store[k] = v
+        self.store = dict(d)
+        self._keys = tuple(keys)
+        self._lowers = tuple(k[0] for k in keys)
 
     def __getitem__(self, key):
         return self.store[self.__keytransform__(key)]
 
     def __contains__(self, key):
         try:
-            return bool(self.store[self.__keytransform__(key)]) or True
+            self.__keytransform__(key)
         except KeyError:
             return False
+        return True
 
     def __iter__(self):
         raise NotImplementedError()
@@ -47,12 +53,7 @@ class BetweenDict(Mapping):
         return len(self.store)
 
     def __keytransform__(self, key):
-        given_key = None
-        for k, v in self.store.items():
-            if k[0] <= key < k[1]:
-                given_key = k
-                break
-
-        if not given_key:
+        index = bisect_right(self._lowers, key) - 1
+        if index < 0 or not key < self._keys[index][1]:
             raise KeyError(key)
-        return given_key
+        return self._keys[index]
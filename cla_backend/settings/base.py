@@ -136,12 +136,14 @@ TEMPLATE_LOADERS = (
 MIDDLEWARE_CLASSES = (
     'django_statsd.middleware.GraphiteRequestTimingMiddleware',
     'core.middleware.GraphiteMiddleware',
+    'core.middleware.ProfilingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'cla_eventlog.middleware.LogBufferMiddleware',
 )
 
 ROOT_URLCONF = 'cla_backend.urls'
@@ -191,6 +193,10 @@ INSTALLED_APPS += PROJECT_APPS
 
 DIAGNOSIS_FILE_NAME = 'graph-2014.07.21.graphml'
 
+# where `compile_diagnosis_graph` writes the compiled graph,
+# defaults to the folder of the graphml file
+DIAGNOSIS_COMPILED_GRAPH_DIR = os.environ.get('DIAGNOSIS_COMPILED_GRAPH_DIR')
+
 
 # DIVERSITY
 
@@ -265,6 +271,27 @@ if 'RAVEN_CONFIG_DSN' in os.environ:
 LOGIN_FAILURE_LIMIT = 5
 LOGIN_FAILURE_COOLOFF_TIME = 60  # in minutes
 
+# keeps the recent login failures (see cla_auth.lockout) and the login
+# throttling counts, has to be shared by all the processes to apply to them
+# (e.g. memcached). Without one the login failures are counted from the
+# database instead.
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND')
+if CACHE_BACKEND in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+):
+    raise ImproperlyConfigured(
+        'CACHE_BACKEND %s is not shared by the processes' % CACHE_BACKEND
+    )
+if CACHE_BACKEND:
+    CACHES = {
+        'default': {
+            'BACKEND': CACHE_BACKEND,
+            'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+        }
+    }
+LOGIN_FAILURES_IN_CACHE = bool(CACHE_BACKEND)
+
 
 # .local.py overrides all the common settings.
 try:
@@ -305,6 +332,14 @@ STATSD_PATCHES = [
 STATSD_HOST = os.environ.get('STATSD_HOST', 'localhost')
 STATSD_PORT = os.environ.get('STATSD_PORT', 8125)
 
+# see core.middleware.ProfilingMiddleware
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', 0))
+PROFILING_REQUEST_HEADER = 'HTTP_X_PROFILE'
+# value of the X-Profile request header needed to profile a request
+PROFILING_HEADER_SECRET = os.environ.get('PROFILING_HEADER_SECRET')
+PROFILING_RESPONSE_HEADER = os.environ.get(
+    'PROFILING_RESPONSE_HEADER', 'False') == 'True'
+
 if all([os.environ.get('SMTP_USER'),
         os.environ.get('SMTP_PASSWORD'),
         os.environ.get('SMTP_HOST')]):
@@ -323,6 +358,9 @@ PROVIDER_HOURS = {
     'weekday': (datetime.time(9, 0), datetime.time(17, 0))
 }
 
+# seconds a process keeps the provider allocations of a category in memory
+PROVIDER_ALLOCATION_CACHE_TIMEOUT = int(os.environ.get('PROVIDER_ALLOCATION_CACHE_TIMEOUT', 60))
+
 OPERATOR_HOURS = {
     'weekday': (datetime.time(9, 0), datetime.time(20, 0)),
     'saturday': (datetime.time(9, 0), datetime.time(12, 30))
@@ -7,6 +7,14 @@ INSTALLED_APPS += TEST_APPS
 
 SOUTH_TESTS_MIGRATE = False
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+# the tests run in a single process
+LOGIN_FAILURES_IN_CACHE = True
+
 TEST_MODE = True
 
 ORIGINAL_DIAGNOSIS_FILE_NAME = DIAGNOSIS_FILE_NAME